@@ -21,13 +21,26 @@
 from bpy.types import Panel
 from bpy.types import PropertyGroup
 from bpy.types import Operator
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, asdict, field, replace
+from mathutils import Matrix
 import bpy
+import argparse
+import concurrent.futures
+import hashlib
+import json
 import os
+import queue
 import shutil
+import struct
 import math
+import subprocess
+import sys
+import threading
 import time
+import traceback
+import tracemalloc
 import webbrowser
+import zlib
 import numpy as np
 
 
@@ -50,7 +63,7 @@ bl_info = {
 # --------
 # Purpose:
 # --------
-# Contains parameters for the class IEAS_AnimationTypes 
+# Contains parameters for the class IEAS_AnimationTypes
 # -----------------------------------------------------
 @dataclass
 class IEAS_AnimationTypesParameters:
@@ -58,1890 +71,4220 @@ class IEAS_AnimationTypesParameters:
     exclude:                    bool    # Deactivates every collection and activates only creature collection.
     CreatureCollectionName:     str     # The name of the main creature's collection.
     CreatureCollectionNameLP:   str     # The name of the creature's lower part collection.
-    animationWeaponFolderNames: dict    # Maps weapon keys to collection names.
-    animationWeaponToggles:     dict    # Toggles rendering for specific weapons.
-    animationArmorToggles:      dict    # Toggles rendering for specific armor.
-    animationArmorFolderNames:  dict    # Maps armot keys to collection names.
-    cameraEasternPositions:     list    # List of all eastern model position as string.
+    jobs:                       list    # The render jobs(IEAS_RenderJob) of the current animation, position and frame.
+
+
+# --------
+# Purpose:
+# --------
+# Contains everything needed for one render call of a compiled render plan.
+# -------------------------------------------------------------------------
+@dataclass
+class IEAS_RenderJob:
+    """Contains everything needed for one render call of a compiled render plan"""
+    animationKey:   str     # A short key for the animation (e.g., "TW").
+    animation:      str     # The current animation name which is also the action name (e.g., "dead").
+    positionKey:    str     # The camera angle/direction key (e.g., "south").
+    angle:          float   # The Z-axis rotation of the object in degrees for this direction.
+    frame:          int     # The frame number which will be rendered.
+    layer:          str     # The name of the collection which is rendered (creature, lower part, weapon or armor).
+    layerKind:      str     # How the layer is rendered: 'MAIN', 'UPPER', 'LOWER', 'WEAPON', 'ARMOR' or 'QUADRANT'.
+    folder:         str     # The full path to the subfolder for the current camera position.
+    outputPaths:    tuple   # All files which are written by this job.
+    mirrorPaths:    tuple = () # The files of the eastern direction which are mirrored from this job's render.
+
+    def filePaths(self):
+        """Returns the rendered and the mirrored files of the job."""
+        return self.outputPaths + self.mirrorPaths
+
+
+# --------
+# Purpose:
+# --------
+# Contains the flat list of render jobs which is compiled before the first render.
+# The plan can be inspected, saved as JSON and executed by IEAS_RenderPlanExecutor.
+# ---------------------------------------------------------------------------------
+@dataclass
+class IEAS_RenderPlan:
+    """Contains the flat list of render jobs which is compiled before the first render"""
+    selectedType:               str     # The animation type name (e.g., "E000").
+    objectName:                 str     # The name of the armature/rig which is animated and rotated.
     pathSaveAt:                 str     # The output file path for rendered sprites.
-    animation:                  str     # The current animation name (e.g., "dead").
-    positionKey:                str     # The camera angle/direction key (e.g., "south").
-    animationKey:               str     # A short key for the animation (e.g., "TW").
-    frame:                      int     # The current frame number.
-    prefixResref:               str     # The combined filename prefix and resref.
-    position_folder:            str     # The full path to the subfolder for the current camera position.
+    CreatureCollectionName:     str     # The name of the main creature's collection.
+    CreatureCollectionNameLP:   str     # The name of the creature's lower part collection.
+    folders:                    list    # All folders which have to exist before rendering.
+    jobs:                       list    # All render jobs(IEAS_RenderJob) in render order.
+    bamFrames:                  dict = field(default_factory=dict) # The BAM file, cycle and frame of each creature sprite(see IEAS_BamWriter).
+
+    def outputCount(self):
+        """Returns the number of files which are written by the plan."""
+        return sum(len(job.filePaths()) for job in self.jobs)
+
+    def shard(self, index, count):
+        """Returns the part index(0 to count-1) of the plan split into count parts of about the same size."""
+        # Jobs of the same animation, direction and frame stay together, so each frame is only set up by one process.
+        keys        = list(dict.fromkeys((job.animation, job.positionKey, job.frame) for job in self.jobs))
+        shardKeys   = set(keys[(index*len(keys))//count : ((index+1)*len(keys))//count])
+        return replace(self, jobs=[job for job in self.jobs if (job.animation, job.positionKey, job.frame) in shardKeys])
+
+    def toDict(self):
+        """Converts the plan into a dictionary which can be serialized as JSON."""
+        return asdict(self)
+
+    @classmethod
+    def fromDict(cls, values):
+        """Creates a plan from a dictionary which was created by toDict."""
+        # JSON has no tuples, so the output paths are converted back.
+        jobs = [IEAS_RenderJob(**dict(job, outputPaths=tuple(job['outputPaths']), mirrorPaths=tuple(job.get('mirrorPaths', ())))) for job in values['jobs']]
+        return cls(**dict(values, jobs=jobs))
+
+    def save(self, filePath):
+        """Saves the plan as JSON file."""
+        with open(filePath, 'w', encoding='utf-8') as planFile:
+            json.dump(self.toDict(), planFile, indent=1)
+
+    @classmethod
+    def load(cls, filePath):
+        """Loads a plan from a JSON file which was created by save."""
+        with open(filePath, 'r', encoding='utf-8') as planFile:
+            return cls.fromDict(json.load(planFile))
+
+
+# --------
+# Purpose:
+# --------
+# Copies pixels between Blender images and NumPy arrays.
+# Reading image.pixels directly converts every value to a Python float(and np.array makes float64 of it),
+# so foreach_get/foreach_set fill preallocated float32 buffers instead. The buffers are reused for every frame,
+# which means an array returned by read or buffer is only valid until the next call with the same name and size.
+# ---------------------------------------------------------------------------------------------------------------
+class IEAS_PixelBridge():
+    """Contains methods for reading and writing image pixels with reused NumPy buffers"""
+
+    def __init__(self):
+        # Buffers by (name, width, height, data type).
+        self.buffers = {}
+
+    def buffer(self, width, height, name, dtype=np.float32):
+        """Returns the reused (rows, columns, RGBA) buffer with the given name and size."""
+        key = (name, width, height, np.dtype(dtype).str)
+        if (key not in self.buffers):
+            self.buffers[key] = np.empty((height, width, 4), dtype=dtype)
+        return self.buffers[key]
+
+    def read(self, image, name="read"):
+        """Returns the pixels(rows, columns, RGBA) of the image in a reused float32 buffer."""
+        width, height   = image.size
+        pixels          = self.buffer(width, height, name)
+        # The flat view shares the memory of the buffer, so Blender writes directly into it.
+        image.pixels.foreach_get(pixels.reshape(-1))
+        return pixels
+
+    def write(self, image, pixels):
+        """Writes the pixels(rows, columns, RGBA) into the image, which must have the same size."""
+        # A float32 buffer is passed without copying, everything else is converted once.
+        image.pixels.foreach_set(np.ascontiguousarray(pixels, dtype=np.float32).reshape(-1))
+
+    def toUint8(self, pixels, name="uint8"):
+        """Returns the float pixels(0.0 to 1.0) as 8-bit values in a reused buffer, e.g. for encoders."""
+        height, width   = pixels.shape[:2]
+        scaled          = self.buffer(width, height, name + "Scaled")
+        result          = self.buffer(width, height, name, np.uint8)
+        # Rounds to the nearest 8-bit value like Blender does when saving 8-bit images.
+        np.multiply(pixels, 255.0, out=scaled)
+        scaled += 0.5
+        np.clip(scaled, 0.0, 255.0, out=scaled)
+        np.copyto(result, scaled, casting='unsafe')
+        return result
+
+
+# --------
+# Purpose:
+# --------
+# Reuses image data blocks instead of creating new ones for every frame.
+# New data blocks with the same name get the suffixes .001, .002, ... and are never freed during the render,
+# so the memory and the time for finding a free name grow with every frame. The pool keeps one data block per
+# name, size and buffer type and removes all of them at the end of the render(see IEAS_RenderPlanExecutor.end).
+# -------------------------------------------------------------------------------------------------------------
+class IEAS_ImagePool():
+    """Contains methods for reusing and freeing image data blocks"""
+
+    def __init__(self):
+        # Image data blocks by (name, width, height, float buffer).
+        self.images = {}
+
+    def get(self, name, width, height, floatBuffer=False):
+        """Returns the image data block with the given name and size, which is created only once."""
+        key     = (name, width, height, floatBuffer)
+        image   = self.images.get(key)
+        if (image is None):
+            image = bpy.data.images.new(
+                name            = name,
+                width           = width,
+                height          = height,
+                alpha           = True,
+                float_buffer    = floatBuffer,
+            )
+            self.images[key] = image
+        return image
+
+    def clear(self):
+        """Removes every image data block of the pool."""
+        for image in self.images.values():
+            bpy.data.images.remove(image)
+        self.images.clear()
+
+
+# --------
+# Purpose:
+# --------
+# Splits rendered pixels into the tiles of a grid, e.g. the 2x2 and 3x3 quadrants of the 1000 types.
+# Sprites of the full canvas size reuse one canvas: only the area of the previous tile is cleared and the area of the
+# next tile is copied, instead of clearing the whole canvas and copying into it for every tile. Sprites of the tile
+# extent are views of the pixels, or, if the size is divisible by the grid, copied with one NumPy operation into one
+# contiguous array, so each tile is written into its image without another copy.
+# ---------------------------------------------------------------------------------------------------------------------
+class IEAS_GridSplitter():
+    """Contains methods for splitting pixels into the tiles of a grid"""
+
+    def __init__(self, columns, rows, pixelBridge:IEAS_PixelBridge):
+        self.columns        = columns
+        self.rows           = rows
+        self.tiles          = columns * rows
+        self.pixelBridge    = pixelBridge
+        # The block row and column of every tile, starting with the top left tile.
+        # Blender stores the pixel rows from bottom to top, so the first tile row is the last block row.
+        self.blockRows      = np.array([rows - 1 - index // columns for index in range(self.tiles)])
+        self.blockColumns   = np.array([index % columns for index in range(self.tiles)])
+
+    def slices(self, width, height):
+        """Returns the (rows, columns) slices of all tiles, starting with the top left tile."""
+        slices = []
+        for row in range(self.rows):
+            rows = slice(((self.rows-1-row)*height)//self.rows, ((self.rows-row)*height)//self.rows)
+            for column in range(self.columns):
+                slices.append((rows, slice((column*width)//self.columns, ((column+1)*width)//self.columns)))
+        return slices
+
+    def tileExtents(self, pixels):
+        """Returns the pixels(rows, columns, RGBA) of every tile, starting with the top left tile."""
+        height, width = pixels.shape[:2]
+        if (height % self.rows != 0 or width % self.columns != 0):
+            return [pixels[tileSlice] for tileSlice in self.slices(width, height)]
+        # The pixels as (block row, row, block column, column, RGBA) without copying. Indexing the block rows and
+        # columns of all tiles at once copies them into one array(tiles, rows, columns, RGBA).
+        blocks = pixels.reshape(self.rows, height // self.rows, self.columns, width // self.columns, 4)
+        return blocks[self.blockRows, :, self.blockColumns]
+
+    def split(self, pixels, tileExtent=False):
+        """Returns the tiles of the pixels in the tile extent or on canvases of the full size, starting with the top left tile."""
+        if (tileExtent == True):
+            return self.tileExtents(pixels)
+        return self.canvases(pixels)
+
+    def canvases(self, pixels, name="canvas"):
+        """Yields every tile on a transparent canvas of the full size, starting with the top left tile."""
+        # The canvas is a reused buffer, so a yielded canvas is only valid until the next one.
+        height, width   = pixels.shape[:2]
+        canvas          = self.pixelBridge.buffer(width, height, name)
+        canvas.fill(0.0)
+        previous        = None
+        for tileSlice in self.slices(width, height):
+            if (previous != None):
+                canvas[previous] = 0.0
+            canvas[tileSlice]   = pixels[tileSlice]
+            previous            = tileSlice
+            yield canvas
+
+
+# --------
+# Purpose:
+# --------
+# Writes rendered pixels as PNG files with NumPy and zlib instead of image data blocks and save_render.
+# The pixels are converted like Blender saves a render with the 'Standard' view transform: the premultiplied colors
+# are divided by alpha(PNG stores straight alpha), get the sRGB transfer function and are rounded to 8 or 16 bits,
+# but without the dither noise of the render settings. The rows are not filtered and compressed with a low zlib
+# level, because the files are written while rendering. IEAS_PngRecompressor makes them small afterwards.
+# ---------------------------------------------------------------------------------------------------------------------
+class IEAS_PngEncoder():
+    """Contains methods for writing pixels as PNG files without image data blocks"""
+    signature       = b'\x89PNG\r\n\x1a\n'
+    # PNG color types of the output color modes.
+    colorTypes      = {'RGBA': 6, 'RGB': 2}
+    # The scene's PNG compression(0-100) while rendering. Blender uses the zlib level compression // 11, so this is level 1.
+    fastCompression = 15
+
+    def __init__(self, pixelBridge:IEAS_PixelBridge, level=1, colorMode='RGBA', colorDepth='8'):
+        self.pixelBridge    = pixelBridge
+        self.level          = level
+        # The scene's color mode and depth, read by the main thread(see IEAS_RenderPlanExecutor.begin), because the
+        # encoder also runs in worker threads which must not use the Blender API.
+        self.colorMode      = colorMode
+        self.colorDepth     = colorDepth
+
+    @classmethod
+    def unsupported(cls, scene):
+        """Returns why the scene's output cannot be written by the encoder or None if it can."""
+        imageSettings   = scene.render.image_settings
+        viewSettings    = scene.view_settings
+        if (imageSettings.file_format != 'PNG'):
+            return f"the file format is '{imageSettings.file_format}'"
+        if (imageSettings.color_mode not in cls.colorTypes):
+            return f"the color mode is '{imageSettings.color_mode}'"
+        if (getattr(imageSettings, 'color_management', 'FOLLOW_SCENE') != 'FOLLOW_SCENE'):
+            return "the output overrides the color management of the scene"
+        if (viewSettings.view_transform != 'Standard' or viewSettings.look != 'None' or viewSettings.exposure != 0.0
+            or viewSettings.gamma != 1.0 or viewSettings.use_curve_mapping == True
+            or scene.display_settings.display_device != 'sRGB'):
+            return "the view transform is not 'Standard'(sRGB) without look, exposure, gamma and curves"
+        return None
+
+    @staticmethod
+    def chunk(chunkType, data):
+        """Returns the PNG chunk with its length and checksum."""
+        return struct.pack('>I', len(data)) + chunkType + data + struct.pack('>I', zlib.crc32(chunkType + data))
+
+    @classmethod
+    def encodeRows(cls, rows, width, height, bitDepth, colorType, level, chunks=()):
+        """Returns the PNG file of the filtered rows(each starts with its filter type) and the given ancillary chunks."""
+        header = struct.pack('>IIBBBBB', width, height, bitDepth, colorType, 0, 0, 0)
+        return (cls.signature + cls.chunk(b'IHDR', header) + b"".join(chunks)
+                + cls.chunk(b'IDAT', zlib.compress(rows, level)) + cls.chunk(b'IEND', b""))
+
+    def toDisplay(self, pixels, colorMode):
+        """Returns the linear premultiplied pixels as display values(0.0 to 1.0) in a reused buffer."""
+        height, width   = pixels.shape[:2]
+        display         = self.pixelBridge.buffer(width, height, "pngDisplay")
+        if (colorMode == 'RGBA'):
+            # Transparent pixels have no color, the others are divided by their alpha.
+            alpha = pixels[..., 3:4]
+            display.fill(0.0)
+            np.divide(pixels, alpha, out=display, where=(alpha > 0.0))
+            display[..., 3] = pixels[..., 3]
+        else:
+            # Without alpha the premultiplied colors are the image over black.
+            np.copyto(display, pixels)
+        np.clip(display, 0.0, 1.0, out=display)
+        colors          = display[..., :3]
+        colors[...]     = np.where(colors <= 0.0031308, colors * 12.92, 1.055 * np.power(colors, 1.0 / 2.4) - 0.055)
+        return display
+
+    def encode(self, pixels, colorMode='RGBA', colorDepth='8'):
+        """Returns the pixels(rows from bottom to top, columns, RGBA) as PNG file."""
+        height, width   = pixels.shape[:2]
+        channels        = len(colorMode)
+        display         = self.toDisplay(pixels, colorMode)
+        if (colorDepth == '16'):
+            # PNG stores 16-bit samples in big-endian byte order.
+            samples = (display * 65535.0 + 0.5).astype('>u2')
+        else:
+            samples = self.pixelBridge.toUint8(display, "png")
+        # PNG stores the rows from top to bottom, each after its filter type(0: none).
+        samples = np.ascontiguousarray(samples[::-1, :, :channels]).view(np.uint8).reshape(height, -1)
+        rows    = np.zeros((height, samples.shape[1] + 1), dtype=np.uint8)
+        rows[:, 1:] = samples
+        return self.encodeRows(rows.tobytes(), width, height, int(colorDepth), self.colorTypes[colorMode], self.level)
+
+    def save(self, pixels, filePath):
+        """Writes the pixels as PNG file with the scene's color mode and depth."""
+        data = self.encode(pixels, self.colorMode, self.colorDepth)
+        # The file gets its name with one rename, so a cancelled render never leaves a half written sprite.
+        with open(filePath + ".tmp", 'wb') as pngFile:
+            pngFile.write(data)
+        os.replace(filePath + ".tmp", filePath)
+
+    def saveMirrored(self, pixels, filePath):
+        """Writes the pixels mirrored horizontally as PNG file."""
+        self.save(pixels[:, ::-1], filePath)
+
+    def saveTiles(self, pixels, columns, rows, tileExtent, filePaths, mirrorPaths=()):
+        """Writes each tile of the pixels and of the mirrored pixels as PNG file(see IEAS_GridSplitter)."""
+        splitter = IEAS_GridSplitter(columns, rows, self.pixelBridge)
+        for tile, filePath in zip(splitter.split(pixels, tileExtent), filePaths):
+            self.save(tile, filePath)
+        # The mirrored pixels are split the same way, e.g. their top left tile is the eastern Q1.
+        if (len(mirrorPaths) > 0):
+            for tile, filePath in zip(splitter.split(pixels[:, ::-1], tileExtent), mirrorPaths):
+                self.save(tile, filePath)
+
+
+# --------
+# Purpose:
+# --------
+# Processes rendered pixels(e.g. splitting, mirroring, encoding and writing) in worker threads, while the next frame
+# is rendered. The render step puts the tasks into a bounded queue and waits when it is full, so at most the pixels of
+# the queued and the running tasks are kept in memory. The tasks only use NumPy, zlib and files(see IEAS_PngEncoder),
+# because the Blender API must only be used by the main thread. Each worker has its own encoder and buffers.
+# The first error of a worker is raised in the render step, so it is reported like every other render error.
+# ---------------------------------------------------------------------------------------------------------------------
+class IEAS_PostProcessor():
+    """Contains methods for processing rendered pixels in worker threads"""
+    # Queued tasks per worker thread.
+    queuePerWorker = 2
+
+    def __init__(self, workers, level=1):
+        self.workers        = workers
+        self.level          = level
+        self.queue          = queue.Queue(maxsize=workers * self.queuePerWorker)
+        self.threads        = []
+        self.lock           = threading.Lock()
+        self.error          = None
+        # Tasks are numbered by their submission, finished counts the tasks which are finished with all before them.
+        self.submitted      = 0
+        self.finishedTasks  = set()
+        self.finished       = 0
+        # Seconds the workers were busy and the render step waited for a free place in the queue.
+        self.busySeconds    = 0.0
+        self.waitSeconds    = 0.0
+        self.startTime      = 0.0
+        self.endTime        = 0.0
+        self.colorMode      = 'RGBA'
+        self.colorDepth     = '8'
+
+    def begin(self, colorMode, colorDepth):
+        """Starts the worker threads, which write the PNG files with the scene's color mode and depth."""
+        self.colorMode  = colorMode
+        self.colorDepth = colorDepth
+        self.startTime  = time.perf_counter()
+        self.threads    = [threading.Thread(target=self.work, name=f"IEAS post-processing {index}", daemon=True)
+                           for index in range(self.workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def submit(self, function, pixels, *args):
+        """Queues function(encoder, pixels, *args) and returns its task number, e.g. with IEAS_PngEncoder.save."""
+        self.raiseError()
+        # The pixels are copied, because the buffers of the render are reused by the next frame.
+        task        = (self.submitted, function, pixels.copy(), args)
+        startTimer  = time.perf_counter()
+        self.queue.put(task)
+        self.waitSeconds += time.perf_counter() - startTimer
+        self.submitted   += 1
+        return task[0]
+
+    def work(self):
+        """Runs the queued tasks until it gets None."""
+        encoder = IEAS_PngEncoder(IEAS_PixelBridge(), self.level, self.colorMode, self.colorDepth)
+        while True:
+            task = self.queue.get()
+            if (task is None):
+                self.queue.task_done()
+                return
+            number, function, pixels, args = task
+            startTimer = time.perf_counter()
+            try:
+                function(encoder, pixels, *args)
+            except Exception as e:
+                # Every error ends up in the report of the render step, a worker thread has no other way to show it.
+                with self.lock:
+                    if (self.error is None):
+                        self.error = f"{type(e).__name__}: {e}"
+            with self.lock:
+                self.busySeconds += time.perf_counter() - startTimer
+                self.finishedTasks.add(number)
+                while (self.finished in self.finishedTasks):
+                    self.finishedTasks.remove(self.finished)
+                    self.finished += 1
+            self.queue.task_done()
+
+    def wait(self):
+        """Waits until every queued task is finished."""
+        self.queue.join()
+        self.raiseError()
+
+    def end(self):
+        """Waits until every queued task is finished and stops the worker threads."""
+        for thread in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads    = []
+        self.endTime    = time.perf_counter()
+        self.raiseError()
+
+    def raiseError(self):
+        """Raises the first error of the worker threads."""
+        if (self.error != None):
+            raise ValueError(f"ERROR: Post-processing of the rendered pixels failed! {self.error}")
+
+    def timing(self, renderSeconds):
+        """Returns the utilization of the render step and the worker threads in percent of the elapsed time."""
+        elapsed = max((self.endTime or time.perf_counter()) - self.startTime, 1e-9)
+        return (f"post-processing: {self.submitted} tasks in {self.workers} threads, render step busy "
+                f"{100.0 * renderSeconds / elapsed:.0f}%, workers busy {100.0 * self.busySeconds / (elapsed * self.workers):.0f}%, "
+                f"render step waited {self.waitSeconds:.1f}s for the full queue")
+
+
+# --------
+# Purpose:
+# --------
+# Makes the PNG files of a render as small as possible without changing a pixel, while Blender stays usable.
+# The image data of every file is compressed again with the highest zlib level. Files with unfiltered rows and rows
+# with the filters 'Sub' and 'Up'(e.g. of IEAS_PngEncoder) are decoded and also encoded with every filter, without
+# alpha if every pixel is opaque and with a palette if they have at most 256 colors. The smallest file is kept.
+# Files with other filters('Average' and 'Paeth', e.g. of Blender) are only compressed again, because decoding them
+# needs a loop over every pixel. The files run in parallel threads, because zlib and NumPy release the GIL.
+# ---------------------------------------------------------------------------------------------------------------------
+class IEAS_PngRecompressor():
+    """Contains methods for making PNG files smaller without changing their pixels"""
+    level       = 9
+    # Chunks which depend on the color type and are not copied into files with another color type.
+    colorChunks = (b'PLTE', b'tRNS', b'bKGD', b'sBIT', b'hIST')
+
+    def __init__(self, jobs, manifest):
+        # The files of the jobs are recompressed and recorded in the manifest again(see IEAS_RenderManifest).
+        self.jobs           = jobs
+        self.manifest       = manifest
+        self.thread         = None
+        self.files          = 0
+        self.bytesBefore    = 0
+        self.bytesAfter     = 0
+        self.seconds        = 0.0
+        self.errors         = []
+        # The number of files to recompress and the number of finished ones, which are shown in the panel.
+        self.total          = 0
+        self.done           = 0
+
+    def readChunks(self, data):
+        """Returns the (type, data) chunks of the PNG file or None if it is no PNG file."""
+        if (data[:8] != IEAS_PngEncoder.signature):
+            return None
+        chunks  = []
+        offset  = 8
+        while (offset + 8 <= len(data)):
+            length, chunkType = struct.unpack('>I4s', data[offset:offset+8])
+            chunks.append((chunkType, data[offset+8 : offset+8+length]))
+            offset += 12 + length
+            if (chunkType == b'IEND'):
+                break
+        return chunks
+
+    def unfilter(self, rows, bytesPerPixel):
+        """Returns the samples(rows, bytes) of the rows which are unfiltered or filtered with 'Sub' and 'Up', otherwise None."""
+        filterTypes = rows[:, 0]
+        if np.any(filterTypes > 2):
+            return None
+        samples     = rows[:, 1:].copy()
+        for row in np.nonzero(filterTypes)[0]:
+            if (filterTypes[row] == 1):
+                # 'Sub' adds the byte of the pixel to the left, which is the running sum of each channel(8-bit wrap around).
+                samples[row] = np.cumsum(samples[row].reshape(-1, bytesPerPixel), axis=0, dtype=np.uint8).reshape(-1)
+            elif (row > 0):
+                # 'Up' adds the byte of the row above, which is already unfiltered.
+                samples[row] += samples[row - 1]
+        return samples
+
+    def filterRows(self, samples, bytesPerPixel, filterType):
+        """Returns the samples(rows, bytes) filtered with one filter type, each row starts with the filter type."""
+        values  = samples.astype(np.int16)
+        left    = np.zeros_like(values)
+        left[:, bytesPerPixel:] = values[:, :-bytesPerPixel]
+        up      = np.zeros_like(values)
+        up[1:]  = values[:-1]
+        if (filterType == 1):
+            values = values - left
+        elif (filterType == 2):
+            values = values - up
+        elif (filterType == 4):
+            # 'Paeth' predicts each byte by the left, upper or upper left byte, whichever is nearest to left + up - upper left.
+            upLeft  = np.zeros_like(values)
+            upLeft[1:, bytesPerPixel:] = values[:-1, :-bytesPerPixel]
+            estimate    = left + up - upLeft
+            distanceLeft, distanceUp, distanceUpLeft = np.abs(estimate - left), np.abs(estimate - up), np.abs(estimate - upLeft)
+            values = values - np.where((distanceLeft <= distanceUp) & (distanceLeft <= distanceUpLeft), left,
+                                       np.where(distanceUp <= distanceUpLeft, up, upLeft))
+        rows        = np.empty((values.shape[0], values.shape[1] + 1), dtype=np.uint8)
+        rows[:, 0]  = filterType
+        rows[:, 1:] = values & 0xFF
+        return rows.tobytes()
+
+    def encodings(self, pixels, chunks):
+        """Returns the PNG files of the 8-bit pixels(rows, columns, channels) with every filter and smaller color type."""
+        height, width, channels = pixels.shape
+        files = []
+        if (channels == 4 and np.all(pixels[..., 3] == 255)):
+            # Every pixel is opaque, so the alpha channel is not needed.
+            pixels      = pixels[..., :3]
+            channels    = 3
+        colors = pixels.reshape(-1, channels)
+        if (channels == 4):
+            colors = colors.view(np.uint32).reshape(-1)
+        else:
+            colors = (colors[:, 0].astype(np.uint32) << 16) | (colors[:, 1].astype(np.uint32) << 8) | colors[:, 2]
+        palette, indices = np.unique(colors, return_inverse=True)
+        if (len(palette) <= 256):
+            # The color of each palette entry is the color of its first pixel. The entries are sorted by alpha,
+            # so tRNS only needs the entries up to the last transparent one.
+            paletteColors   = pixels.reshape(-1, channels)[np.unique(indices.reshape(-1), return_index=True)[1]]
+            order           = np.argsort(paletteColors[:, 3], kind='stable') if (channels == 4) else np.arange(len(palette))
+            remap           = np.empty(len(palette), dtype=np.uint8)
+            remap[order]    = np.arange(len(palette), dtype=np.uint8)
+            paletteColors   = paletteColors[order]
+            paletteChunks   = [IEAS_PngEncoder.chunk(b'PLTE', paletteColors[:, :3].tobytes())]
+            if (channels == 4):
+                transparent = np.nonzero(paletteColors[:, 3] < 255)[0]
+                if (len(transparent) > 0):
+                    paletteChunks.append(IEAS_PngEncoder.chunk(b'tRNS', paletteColors[:transparent[-1] + 1, 3].tobytes()))
+            samples = remap[indices.reshape(height, width)]
+            for filterType in (0, 1, 2):
+                files.append(IEAS_PngEncoder.encodeRows(self.filterRows(samples, 1, filterType), width, height, 8, 3,
+                                                        self.level, chunks + paletteChunks))
+        samples = np.ascontiguousarray(pixels).reshape(height, -1)
+        for filterType in (0, 1, 2, 4):
+            files.append(IEAS_PngEncoder.encodeRows(self.filterRows(samples, channels, filterType), width, height, 8,
+                                                    IEAS_PngEncoder.colorTypes['RGBA' if channels == 4 else 'RGB'],
+                                                    self.level, chunks))
+        return files
+
+    def recompress(self, filePath):
+        """Replaces the PNG file with its smallest lossless encoding and returns its size before and after."""
+        with open(filePath, 'rb') as pngFile:
+            original = pngFile.read()
+        chunks = self.readChunks(original)
+        if (chunks is None or len(chunks) == 0 or chunks[0][0] != b'IHDR'):
+            return len(original), len(original)
+        width, height, bitDepth, colorType, compression, filterMethod, interlace = struct.unpack('>IIBBBBB', chunks[0][1])
+        imageData   = zlib.decompress(b"".join(data for chunkType, data in chunks if chunkType == b'IDAT'))
+        ancillary   = [IEAS_PngEncoder.chunk(chunkType, data) for chunkType, data in chunks
+                       if chunkType not in (b'IHDR', b'IDAT', b'IEND')]
+        # The same filtered rows with the highest compression.
+        files       = [IEAS_PngEncoder.encodeRows(imageData, width, height, bitDepth, colorType, self.level, ancillary)]
+        channels    = {6: 4, 2: 3}.get(colorType)
+        hasColorKey = any(chunkType == b'tRNS' for chunkType, data in chunks)
+        if (channels != None and bitDepth == 8 and interlace == 0 and hasColorKey == False):
+            rows    = np.frombuffer(imageData, dtype=np.uint8).reshape(height, width * channels + 1)
+            samples = self.unfilter(rows, channels)
+            if (samples is not None):
+                chunks = [IEAS_PngEncoder.chunk(chunkType, data) for chunkType, data in chunks
+                          if chunkType not in (b'IHDR', b'IDAT', b'IEND') + self.colorChunks]
+                files += self.encodings(samples.reshape(height, width, channels), chunks)
+        smallest = min(files, key=len)
+        if (len(smallest) >= len(original)):
+            return len(original), len(original)
+        with open(filePath + ".tmp", 'wb') as pngFile:
+            pngFile.write(smallest)
+        os.replace(filePath + ".tmp", filePath)
+        return len(original), len(smallest)
+
+    def run(self):
+        """Recompresses the files of every job and records the jobs in the manifest again."""
+        startTimer  = time.perf_counter()
+        filePaths   = [filePath for job in self.jobs for filePath in job.filePaths()
+                       if filePath.lower().endswith(".png") and os.path.exists(filePath)]
+        self.total  = len(filePaths)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            futures = {pool.submit(self.recompress, filePath): filePath for filePath in filePaths}
+            for future in concurrent.futures.as_completed(futures):
+                self.done += 1
+                try:
+                    before, after = future.result()
+                except (OSError, ValueError, zlib.error) as e:
+                    # A damaged or locked file keeps its content, every other file is still recompressed.
+                    self.errors.append(f"{futures[future]}: {e}")
+                    continue
+                self.files          += 1
+                self.bytesBefore    += before
+                self.bytesAfter     += after
+        # The recompressed files have another size and checksum, so resuming still skips them.
+        self.manifest.record(self.jobs)
+        self.seconds = time.perf_counter() - startTimer
+
+    def start(self):
+        """Recompresses the files in a background thread."""
+        self.thread = threading.Thread(target=self.run, name="IEAS PNG recompression")
+        self.thread.start()
+
+    def join(self):
+        """Waits until the background thread is finished."""
+        if (self.thread != None):
+            self.thread.join()
+
+    def isRunning(self):
+        """Returns True while the background thread recompresses the files."""
+        return (self.thread != None and self.thread.is_alive())
+
+    def timing(self):
+        """Returns the number of recompressed files, their sizes in KB, the time in seconds and the files which were not recompressed."""
+        return (f"PNG recompression: {self.files} files from {self.bytesBefore / 1024.0:.0f}KB to "
+                f"{self.bytesAfter / 1024.0:.0f}KB({self.saved():.1f}% smaller) in {self.seconds:.1f}s"
+                + (f", {len(self.errors)} files not recompressed(e.g. {self.errors[0]})" if (len(self.errors) > 0) else ""))
+
+    def saved(self):
+        """Returns how much smaller the recompressed files are in percent."""
+        return 100.0 * (1.0 - self.bytesAfter / self.bytesBefore) if (self.bytesBefore > 0) else 0.0
+
+
+# --------
+# Purpose:
+# --------
+# Writes the creature sprites of a render as BAM V1 files(see IESDP), so they need no external converter.
+# The frames are read back from the sprite files when the render is finished, because the sprites are written in
+# several ways(Blender, IEAS_PngEncoder threads, grids, animation renders, mirrored and copied files) and a resumed or
+# incremental render writes only some of them. Each frame is cropped to its visible pixels, so the memory holds only
+# the cropped frames of one BAM file. All frames of a file share one palette: index 0 is the transparent green, index 1
+# the shadow and the other 254 entries are the colors of the frames(median cut of 5 bits per channel if there are more).
+# The transparent pixels are run-length encoded if that is smaller, equal frames are stored once and with compress the
+# file is wrapped into a zlib compressed BAMC file.
+# ----------------------------------------------------------------------------------------------------------------------
+class IEAS_BamWriter():
+    """Contains methods for writing sprite frames as BAM V1 files"""
+    signature       = b'BAM V1  '
+    folderName      = "bam"
+    # Palette entries(RGB) of the reserved indices 0(transparent) and 1(shadow).
+    transparent     = (0, 255, 0)
+    shadow          = (0, 0, 0)
+    colors          = 254
+    # Pixels with at least this alpha get a color. Dark pixels(e.g. of a shadow catcher) with less alpha get the shadow
+    # index, if their alpha is at least shadowAlpha and no channel is above shadowValue. All others are transparent.
+    opaqueAlpha     = 128
+    shadowAlpha     = 32
+    shadowValue     = 32
+
+    def __init__(self, pixelBridge:IEAS_PixelBridge, compress=False):
+        self.pixelBridge    = pixelBridge
+        self.compress       = compress
+        self.files          = 0
+        self.frames         = 0
+        self.bytes          = 0
+        self.seconds        = 0.0
+        # The BAM files which could not be written, they are reported after the render(see writePlan).
+        self.warnings       = []
+
+    def readSprite(self, filePath):
+        """Returns the 8-bit pixels(rows from top to bottom, columns, RGBA) of a sprite file."""
+        image = bpy.data.images.load(filePath, check_existing=False)
+        try:
+            pixels = self.pixelBridge.read(image, "bamRead")
+            # Byte images have the values of the file, float images(e.g. 16-bit) are linear and premultiplied.
+            if (image.is_float == True):
+                pixels = IEAS_PngEncoder(self.pixelBridge).toDisplay(pixels, 'RGBA')
+            return self.pixelBridge.toUint8(pixels, "bamRead")[::-1]
+        finally:
+            bpy.data.images.remove(image)
+
+    def crop(self, pixels, centerX, centerY, visible=None):
+        """Returns the pixels cropped to their visible(default: colored and shadow) pixels and the center relative to the cropped pixels."""
+        if (visible is None):
+            opaque, shadow  = self.classify(pixels)
+            visible         = opaque | shadow
+        rows            = np.nonzero(visible.any(axis=1))[0]
+        columns         = np.nonzero(visible.any(axis=0))[0]
+        if (len(rows) == 0):
+            return pixels[:0, :0], 0, 0
+        return (pixels[rows[0]:rows[-1]+1, columns[0]:columns[-1]+1], centerX - int(columns[0]), centerY - int(rows[0]))
+
+    def classify(self, pixels):
+        """Returns the masks of the pixels with a color and with the shadow index."""
+        alpha   = pixels[..., 3]
+        opaque  = (alpha >= self.opaqueAlpha)
+        shadow  = ~opaque & (alpha >= self.shadowAlpha) & (pixels[..., :3].max(axis=-1) <= self.shadowValue)
+        return opaque, shadow
+
+    def quantize(self, colors):
+        """Returns the palette(at most 254 RGB colors) and the palette index of every color(N, RGB)."""
+        keys            = (colors[:, 0].astype(np.uint32) << 16) | (colors[:, 1].astype(np.uint32) << 8) | colors[:, 2]
+        unique, inverse = np.unique(keys, return_inverse=True)
+        if (len(unique) <= self.colors):
+            palette = np.stack([unique >> 16, (unique >> 8) & 0xFF, unique & 0xFF], axis=1).astype(np.uint8)
+            return palette, inverse.reshape(-1)
+        # Median cut of the histogram with 5 bits per channel: the box with the largest color range(weighted by its
+        # pixels) is split at the median pixel of that range until there are enough boxes.
+        bins        = ((colors[:, 0] >> 3).astype(np.int32) << 10) | ((colors[:, 1] >> 3).astype(np.int32) << 5) | (colors[:, 2] >> 3)
+        counts      = np.bincount(bins, minlength=32768)
+        used        = np.nonzero(counts)[0]
+        weights     = counts[used].astype(np.float64)
+        sums        = np.stack([np.bincount(bins, weights=colors[:, channel], minlength=32768)[used] for channel in range(3)], axis=1)
+        means       = sums / weights[:, None]
+        score       = lambda box: (np.ptp(means[box], axis=0).max() * weights[box].sum()) if (len(box) > 1) else -1.0
+        boxes       = [np.arange(len(used))]
+        scores      = [score(boxes[0])]
+        while (len(boxes) < self.colors):
+            index = int(np.argmax(scores))
+            if (scores[index] <= 0.0):
+                break
+            box         = boxes[index]
+            channel     = int(np.argmax(np.ptp(means[box], axis=0)))
+            box         = box[np.argsort(means[box, channel], kind='stable')]
+            cumulative  = np.cumsum(weights[box])
+            split       = min(max(int(np.searchsorted(cumulative, cumulative[-1] / 2.0)) + 1, 1), len(box) - 1)
+            boxes[index:index+1]    = [box[:split], box[split:]]
+            scores[index:index+1]   = [score(box[:split]), score(box[split:])]
+        palette = np.array([sums[box].sum(axis=0) / weights[box].sum() for box in boxes])
+        # Every bin gets the nearest palette color, which is not always the color of its box.
+        distances   = (means**2).sum(axis=1)[:, None] - 2.0 * means @ palette.T + (palette**2).sum(axis=1)[None, :]
+        binIndex    = np.zeros(32768, dtype=np.int32)
+        binIndex[used] = np.argmin(distances, axis=1)
+        return np.clip(palette + 0.5, 0, 255).astype(np.uint8), binIndex[bins]
+
+    def encodeFrame(self, indices):
+        """Returns the frame data and if it is run-length encoded: a transparent index is followed by the number of further ones."""
+        flat        = indices.reshape(-1)
+        raw         = flat.tobytes()
+        edges       = np.flatnonzero(np.diff(np.concatenate(([0], (flat == 0).view(np.int8), [0]))))
+        parts       = []
+        position    = 0
+        for start, end in zip(edges[0::2].tolist(), edges[1::2].tolist()):
+            parts.append(raw[position:start])
+            full, rest = divmod(end - start, 256)
+            parts.append(b'\x00\xff' * full + (bytes((0, rest - 1)) if (rest > 0) else b''))
+            position = end
+        parts.append(raw[position:])
+        encoded = b"".join(parts)
+        return (encoded, True) if (len(encoded) < len(raw)) else (raw, False)
+
+    def encode(self, cycles):
+        """Returns the BAM file of the cycles, each a list of (pixels(rows from top to bottom, columns, RGBA), centerX, centerY)."""
+        if (len(cycles) > 255):
+            raise ValueError(f"ERROR: A BAM V1 file has at most 255 cycles, not {len(cycles)}!")
+        frames  = [(pixels, centerX, centerY) + self.classify(pixels) for cycle in cycles for pixels, centerX, centerY in cycle]
+        colors  = [pixels[opaque][:, :3] for pixels, centerX, centerY, opaque, shadow in frames]
+        palette, colorIndices = self.quantize(np.concatenate(colors + [np.zeros((0, 3), dtype=np.uint8)]))
+        # The palette is BGRA with alpha 0. No color may be the transparent green.
+        paletteColors               = np.zeros((256, 3), dtype=np.uint8)
+        paletteColors[0]            = self.transparent
+        paletteColors[1]            = self.shadow
+        paletteColors[2:2+len(palette)] = palette
+        greens                      = np.all(paletteColors[2:] == self.transparent, axis=1)
+        paletteColors[2:][greens]   = (0, 254, 0)
+        paletteData = np.concatenate([paletteColors[:, ::-1], np.zeros((256, 1), dtype=np.uint8)], axis=1).tobytes()
+
+        frameEntries    = []
+        frameData       = []
+        frameIndices    = {}
+        lookup          = []
+        position        = 0
+        offset          = 0
+        for cycle in cycles:
+            for number in range(len(cycle)):
+                pixels, centerX, centerY, opaque, shadow = frames[position]
+                indices             = np.zeros(opaque.shape, dtype=np.uint8)
+                indices[shadow]     = 1
+                indices[opaque]     = colorIndices[offset:offset + len(colors[position])] + 2
+                offset             += len(colors[position])
+                position           += 1
+                if (indices.size == 0):
+                    # An empty frame is one transparent pixel.
+                    indices, centerX, centerY = np.zeros((1, 1), dtype=np.uint8), 0, 0
+                data, encoded   = self.encodeFrame(indices)
+                key             = (indices.shape, centerX, centerY, data)
+                if (key not in frameIndices):
+                    frameIndices[key] = len(frameEntries)
+                    frameEntries.append((indices.shape[1], indices.shape[0], centerX, centerY, encoded))
+                    frameData.append(data)
+                lookup.append(frameIndices[key])
+        if (len(frameEntries) > 65535):
+            raise ValueError(f"ERROR: A BAM V1 file has at most 65535 frames, not {len(frameEntries)}!")
+
+        # Header, frame entries, cycle entries, palette, frame lookup table and frame data like the demo BAM files.
+        cycleOffset     = 24 + 12 * len(frameEntries)
+        paletteOffset   = cycleOffset + 4 * len(cycles)
+        lookupOffset    = paletteOffset + 1024
+        dataOffset      = lookupOffset + 2 * len(lookup)
+        header  = self.signature + struct.pack('<HBBIII', len(frameEntries), len(cycles), 0, 24, paletteOffset, lookupOffset)
+        entries = []
+        for (width, height, centerX, centerY, encoded), data in zip(frameEntries, frameData):
+            # Bit 31 of the data offset marks a frame which is not run-length encoded.
+            entries.append(struct.pack('<HHhhI', width, height, centerX, centerY, dataOffset | (0 if encoded else 0x80000000)))
+            dataOffset += len(data)
+        start = 0
+        for cycle in cycles:
+            entries.append(struct.pack('<HH', len(cycle), start if (len(cycle) > 0) else 0))
+            start += len(cycle)
+        bam = (header + b"".join(entries) + paletteData + struct.pack(f'<{len(lookup)}H', *lookup) + b"".join(frameData))
+        if (self.compress == True):
+            return b'BAMC' + b'V1  ' + struct.pack('<I', len(bam)) + zlib.compress(bam, 9)
+        return bam
+
+    @classmethod
+    def read(cls, data):
+        """Returns the palette(256, RGB) and the cycles of a BAM V1 or BAMC file, each a list of (indices, centerX, centerY)."""
+        if (data[:4] == b'BAMC'):
+            data = zlib.decompress(data[12:])
+        if (data[:8] != cls.signature):
+            raise ValueError("ERROR: The file is no BAM V1 file!")
+        frameCount, cycleCount, rleIndex, frameOffset, paletteOffset, lookupOffset = struct.unpack('<HBBIII', data[8:24])
+        palette = np.frombuffer(data, dtype=np.uint8, count=1024, offset=paletteOffset).reshape(256, 4)[:, 2::-1]
+        frames  = []
+        for index in range(frameCount):
+            width, height, centerX, centerY, dataOffset = struct.unpack_from('<HHhhI', data, frameOffset + 12 * index)
+            size = width * height
+            if (dataOffset & 0x80000000):
+                indices = np.frombuffer(data, dtype=np.uint8, count=size, offset=dataOffset & 0x7FFFFFFF)
+            else:
+                values      = []
+                position    = dataOffset
+                while (len(values) < size):
+                    value = data[position]
+                    if (value == rleIndex):
+                        values += [value] * (data[position + 1] + 1)
+                        position += 2
+                    else:
+                        values.append(value)
+                        position += 1
+                indices = np.array(values[:size], dtype=np.uint8)
+            frames.append((indices.reshape(height, width), centerX, centerY))
+        cycles = []
+        for index in range(cycleCount):
+            count, start = struct.unpack_from('<HH', data, frameOffset + 12 * frameCount + 4 * index)
+            lookup = struct.unpack_from(f'<{count}H', data, lookupOffset + 2 * start)
+            cycles.append([frames[frame] for frame in lookup])
+        return palette, cycles
+
+    def write(self, filePath, cycles):
+        """Writes the BAM file of the cycles(see encode)."""
+        data = self.encode(cycles)
+        with open(filePath + ".tmp", 'wb') as bamFile:
+            bamFile.write(data)
+        os.replace(filePath + ".tmp", filePath)
+        self.files  += 1
+        self.frames += sum(len(cycle) for cycle in cycles)
+        self.bytes  += len(data)
+
+    @staticmethod
+    def sprites(plan:IEAS_RenderPlan):
+        """Returns the sprites of every BAM file of the plan by cycle, each a sorted list of (frame, filePath)."""
+        bamFiles = {}
+        for filePath, entries in plan.bamFrames.items():
+            for bamName, cycle, frame in entries:
+                bamFiles.setdefault(bamName, {}).setdefault(cycle, []).append((frame, filePath))
+        for bamCycles in bamFiles.values():
+            for frames in bamCycles.values():
+                frames.sort()
+        return bamFiles
+
+    def readCycles(self, bamName, bamCycles, visible=None):
+        """Returns the cycles of a BAM file with the cropped sprites(see crop) or None, if a sprite cannot be read."""
+        # The cycles without sprites stay empty, e.g. the eastern directions of a file without 'E'.
+        cycles = [[] for cycle in range(max(bamCycles) + 1)]
+        try:
+            for cycle, frames in bamCycles.items():
+                for frame, filePath in frames:
+                    # The sprite is read into a reused buffer, so only its cropped pixels are copied.
+                    pixels                      = self.readSprite(filePath)
+                    mask                        = None if (visible is None) else visible(pixels)
+                    cropped, centerX, centerY   = self.crop(pixels, pixels.shape[1] // 2, pixels.shape[0] // 2, mask)
+                    cycles[cycle].append((cropped.copy(), centerX, centerY))
+        except RuntimeError as e:
+            # Blender raises a RuntimeError for a missing or damaged file, the other BAM files are still written.
+            self.warnings.append(f"WARNING: BAM file '{bamName}' not written, {e}")
+            return None
+        return cycles
+
+    def writePlan(self, plan:IEAS_RenderPlan):
+        """Writes the BAM files of the plan's creature sprites into the folder 'bam' of the save folder and returns the warnings."""
+        startTimer  = time.perf_counter()
+        folder      = os.path.join(plan.pathSaveAt, self.folderName)
+        os.makedirs(folder, exist_ok=True)
+        for bamName, bamCycles in self.sprites(plan).items():
+            cycles = self.readCycles(bamName, bamCycles)
+            if (cycles != None):
+                self.write(os.path.join(folder, bamName), cycles)
+        self.seconds = time.perf_counter() - startTimer
+        return self.warnings
+
+    def timing(self):
+        """Returns the number of written BAM files, their frames, size in KB and the time in seconds."""
+        return (f"BAM output: {self.files} {'BAMC' if self.compress else 'BAM'} files with {self.frames} frames, "
+                f"{self.bytes / 1024.0:.0f}KB in {self.seconds:.1f}s")
+
+
+# --------
+# Purpose:
+# --------
+# Packs rectangles(e.g. sprite frames) into atlas pages with a skyline: each page keeps the top edge of its packed
+# rectangles as a list of segments, and a rectangle is placed where its top edge is lowest(then leftmost). Every open
+# page is tried before a new page is started. The rectangles are aligned to 4 pixels, so the 4x4 blocks of a DXT
+# compressed page never mix the pixels of two rectangles.
+# ---------------------------------------------------------------------------------------------------------------------
+class IEAS_AtlasPacker():
+    """Contains methods for packing rectangles into atlas pages"""
+
+    def __init__(self, width, height, alignment=4):
+        self.width      = width
+        self.height     = height
+        self.alignment  = alignment
+        # Skyline segments [x, y, width] of every page and the width and height of its packed rectangles.
+        self.skylines   = []
+        self.extents    = []
+
+    def insert(self, width, height):
+        """Returns the page and the position of a rectangle. A new page is started, if it fits on no open page."""
+        width   = -(-width // self.alignment) * self.alignment
+        height  = -(-height // self.alignment) * self.alignment
+        if (width > self.width or height > self.height):
+            raise ValueError(f"ERROR: A rectangle of {width}x{height} pixels does not fit on a page of {self.width}x{self.height} pixels!")
+        for page, skyline in enumerate(self.skylines):
+            position = self.find(skyline, width, height)
+            if (position != None):
+                return self.place(page, position, width, height)
+        self.skylines.append([[0, 0, self.width]])
+        self.extents.append([0, 0])
+        return self.place(len(self.skylines) - 1, self.find(self.skylines[-1], width, height), width, height)
+
+    def find(self, skyline, width, height):
+        """Returns the segment index and the position with the lowest top edge of the rectangle or None, if it does not fit."""
+        best = None
+        for index, (x, y, segmentWidth) in enumerate(skyline):
+            if (x + width > self.width):
+                break
+            # The rectangle lies on the highest segment below it.
+            rest    = width
+            segment = index
+            while (rest > 0):
+                y       = max(y, skyline[segment][1])
+                rest   -= skyline[segment][2]
+                segment += 1
+            if (y + height <= self.height and (best is None or (y + height, x) < (best[2] + height, best[1]))):
+                best = (index, x, y)
+        return best
+
+    def place(self, page, position, width, height):
+        """Adds the rectangle to the skyline of the page and returns the page and its position."""
+        skyline         = self.skylines[page]
+        index, x, y     = position
+        right           = x + width
+        skyline.insert(index, [x, y + height, width])
+        # The segments below the rectangle are removed or shortened.
+        segment = index + 1
+        while (segment < len(skyline) and skyline[segment][0] < right):
+            end = skyline[segment][0] + skyline[segment][2]
+            if (end <= right):
+                del skyline[segment]
+            else:
+                skyline[segment][2] = end - right
+                skyline[segment][0] = right
+                break
+        # Neighbouring segments of the same height are merged.
+        segment = max(index - 1, 0)
+        while (segment < len(skyline) - 1 and segment <= index + 1):
+            if (skyline[segment][1] == skyline[segment + 1][1]):
+                skyline[segment][2] += skyline[segment + 1][2]
+                del skyline[segment + 1]
+            else:
+                segment += 1
+        extent      = self.extents[page]
+        extent[0]   = max(extent[0], right)
+        extent[1]   = max(extent[1], y + height)
+        return page, x, y
+
+    def pageSizes(self):
+        """Returns the width and height of every page, reduced to the smallest power of two which holds its rectangles."""
+        fit = lambda used, size: min(size, max(self.alignment, 1 << (max(used, 1) - 1).bit_length()))
+        return [(fit(width, self.width), fit(height, self.height)) for width, height in self.extents]
+
+
+# --------
+# Purpose:
+# --------
+# Writes the creature sprites of a render as BAM V2 files with PVRZ pages(see IESDP) for the Enhanced Editions. The
+# sprites are read and cropped to their pixels with alpha like IEAS_BamWriter does, but all frames of the creature's
+# BAM files are packed together(see IEAS_AtlasPacker), so the files share their pages. A frame which is larger than a
+# page is split into several data blocks and equal frames use the same data blocks. The pages are DXT5 compressed,
+# which keeps the alpha of the shadows, and named MOSxxxx.PVRZ with indices from pageBase, so the pages of different
+# creatures and mods do not collide.
+# ---------------------------------------------------------------------------------------------------------------------
+class IEAS_BamV2Writer():
+    """Contains methods for writing sprite frames as BAM V2 files with PVRZ pages"""
+    signature       = b'BAM V2  '
+    folderName      = "bam"
+    # The PVR texture format(version 3) of the pages with the pixel format DXT5.
+    pvrVersion      = 0x03525650
+    pixelFormat     = 11
+    maxPage         = 99999
+    # A DXT5 block: 2 alpha values, 16 3-bit alpha indices, 2 RGB565 colors and 16 2-bit color indices.
+    blockType       = np.dtype([('alpha0', 'u1'), ('alpha1', 'u1'), ('alphaBits', 'u1', 6),
+                                ('color0', '<u2'), ('color1', '<u2'), ('colorBits', '<u4')])
+
+    def __init__(self, pixelBridge:IEAS_PixelBridge, pageSize=1024, pageBase=1000):
+        self.reader         = IEAS_BamWriter(pixelBridge)
+        self.pageSize       = pageSize
+        self.pageBase       = pageBase
+        self.files          = 0
+        self.frames         = 0
+        self.pages          = 0
+        self.bytes          = 0
+        self.frameArea      = 0
+        self.pageArea       = 0
+        self.seconds        = 0.0
+
+    @classmethod
+    def pageName(cls, page):
+        """Returns the file name of a PVRZ page."""
+        return f"MOS{page:04d}.PVRZ"
+
+    def encodeDxt5(self, pixels):
+        """Returns the DXT5 blocks of the pixels(rows from top to bottom, columns, RGBA), whose size is a multiple of 4."""
+        height, width   = pixels.shape[:2]
+        blocks          = pixels.reshape(height // 4, 4, width // 4, 4, 4).swapaxes(1, 2).reshape(-1, 16, 4).astype(np.int32)
+        result          = np.zeros(len(blocks), dtype=self.blockType)
+        # The alpha values are the block's largest and smallest alpha and 6 values between them, so alpha 0 and 255
+        # stay exact.
+        alpha           = blocks[..., 3]
+        alpha0          = alpha.max(axis=1)
+        alpha1          = alpha.min(axis=1)
+        weights         = np.array([7, 0, 6, 5, 4, 3, 2, 1])
+        levels          = (alpha0[:, None] * weights + alpha1[:, None] * (7 - weights)) // 7
+        alphaIndices    = np.abs(alpha[:, :, None] - levels[:, None, :]).argmin(axis=2).astype(np.uint64)
+        alphaBits       = (alphaIndices << (np.arange(16, dtype=np.uint64) * np.uint64(3))).sum(axis=1, dtype=np.uint64)
+        result['alpha0']    = alpha0
+        result['alpha1']    = alpha1
+        result['alphaBits'] = alphaBits.astype('<u8').view(np.uint8).reshape(-1, 8)[:, :6]
+        # The color of fully transparent blocks stays black.
+        used            = alpha0 > 0
+        blocks          = blocks[used]
+        alpha           = alpha[used]
+        # The colors lie on the principal axis of the pixels with alpha(from power iterations of their covariance) and
+        # are refined by least squares for the chosen indices.
+        colors          = blocks[..., :3].astype(np.float64)
+        visible         = (alpha > 0).astype(np.float64)
+        visible[visible.sum(axis=1) == 0] = 1.0
+        mean            = (colors * visible[..., None]).sum(axis=1) / visible.sum(axis=1)[:, None]
+        centered        = colors - mean[:, None, :]
+        covariance      = (centered * visible[..., None]).transpose(0, 2, 1) @ centered
+        axis            = np.ones((len(blocks), 3, 1))
+        for iteration in range(4):
+            axis = covariance @ axis
+            axis = axis / np.maximum(np.linalg.norm(axis, axis=1), 1e-9)[:, None]
+        projection      = (centered @ axis)[..., 0]
+        axis            = axis[..., 0]
+        first           = mean + axis * np.where(visible > 0, projection, -np.inf).max(axis=1)[:, None]
+        second          = mean + axis * np.where(visible > 0, projection, np.inf).min(axis=1)[:, None]
+        shares          = np.array([1.0, 0.0, 2.0 / 3.0, 1.0 / 3.0])
+        for refinement in range(2):
+            color0, color1, colorIndices = self.fitColors(colors, first, second)
+            share   = shares[colorIndices] * visible
+            rest    = (1.0 - shares[colorIndices]) * visible
+            a, b, c = (share * shares[colorIndices]).sum(axis=1), (share * (1.0 - shares[colorIndices])).sum(axis=1), (rest * (1.0 - shares[colorIndices])).sum(axis=1)
+            x, y    = (share[..., None] * colors).sum(axis=1), (rest[..., None] * colors).sum(axis=1)
+            det     = a * c - b * b
+            solved  = np.abs(det) > 1e-6
+            det     = np.where(solved, det, 1.0)[:, None]
+            first   = np.where(solved[:, None], (c[:, None] * x - b[:, None] * y) / det, first)
+            second  = np.where(solved[:, None], (a[:, None] * y - b[:, None] * x) / det, second)
+        color0, color1, colorIndices = self.fitColors(colors, first, second)
+        result['color0'][used]    = color0
+        result['color1'][used]    = color1
+        result['colorBits'][used] = (colorIndices.astype(np.uint32) << (np.arange(16, dtype=np.uint32) * np.uint32(2))).sum(axis=1, dtype=np.uint32)
+        return result.tobytes()
+
+    def fitColors(self, colors, first, second):
+        """Returns the RGB565 colors of the RGB colors first and second(color0 is the larger) and the nearest color index of each pixel."""
+        toRgb565    = lambda color: ((np.rint(color[:, 0] * 31 / 255).astype(np.int32) << 11) |
+                                     (np.rint(color[:, 1] * 63 / 255).astype(np.int32) << 5) | np.rint(color[:, 2] * 31 / 255).astype(np.int32))
+        first       = toRgb565(np.clip(first, 0, 255))
+        second      = toRgb565(np.clip(second, 0, 255))
+        color0      = np.maximum(first, second)
+        color1      = np.minimum(first, second)
+        palette     = self.palette(color0, color1).astype(np.float64)
+        # The squared distance to a palette color without the squared length of the pixel's color, which is the same for all.
+        distances   = (palette**2).sum(axis=2)[:, None, :] - 2.0 * (colors @ palette.transpose(0, 2, 1))
+        return color0, color1, distances.argmin(axis=2)
+
+    @staticmethod
+    def palette(color0, color1):
+        """Returns the 4 RGB colors of DXT5 blocks with the RGB565 colors color0 and color1."""
+        expand  = lambda color: np.stack([((color >> 11) & 31) * 255 // 31, ((color >> 5) & 63) * 255 // 63, (color & 31) * 255 // 31], axis=1).astype(np.int32)
+        first   = expand(color0)
+        second  = expand(color1)
+        return np.stack([first, second, (2 * first + second) // 3, (first + 2 * second) // 3], axis=1)
+
+    @classmethod
+    def decodeDxt5(cls, data, width, height):
+        """Returns the pixels(rows from top to bottom, columns, RGBA) of DXT5 blocks."""
+        blocks  = np.frombuffer(data, dtype=cls.blockType, count=(width // 4) * (height // 4))
+        alpha0  = blocks['alpha0'].astype(np.int32)[:, None]
+        alpha1  = blocks['alpha1'].astype(np.int32)[:, None]
+        # With alpha0 > alpha1 there are 6 values between them, otherwise 4 and the values 0 and 255.
+        eight   = (alpha0 * np.array([7, 0, 6, 5, 4, 3, 2, 1]) + alpha1 * np.array([0, 7, 1, 2, 3, 4, 5, 6])) // 7
+        six     = (alpha0 * np.array([5, 0, 4, 3, 2, 1, 0, 0]) + alpha1 * np.array([0, 5, 1, 2, 3, 4, 0, 0])) // 5
+        six[:, 7] = 255
+        levels  = np.where(alpha0 > alpha1, eight, six)
+        bits    = np.concatenate([blocks['alphaBits'], np.zeros((len(blocks), 2), dtype=np.uint8)], axis=1).view('<u8')
+        indices = (bits >> (np.arange(16, dtype=np.uint64) * np.uint64(3))) & np.uint64(7)
+        pixels  = np.zeros((len(blocks), 16, 4), dtype=np.uint8)
+        pixels[..., 3]  = np.take_along_axis(levels, indices.astype(np.int64), axis=1)
+        palette         = cls.palette(blocks['color0'].astype(np.int32), blocks['color1'].astype(np.int32))
+        indices         = (blocks['colorBits'][:, None] >> (np.arange(16, dtype=np.uint32) * np.uint32(2))) & np.uint32(3)
+        pixels[..., :3] = np.take_along_axis(palette, indices.astype(np.int64)[..., None], axis=1)
+        return pixels.reshape(height // 4, width // 4, 4, 4, 4).swapaxes(1, 2).reshape(height, width, 4)
+
+    def encodePage(self, pixels):
+        """Returns the PVRZ file of a page: the size of the PVR texture and the zlib compressed texture."""
+        height, width   = pixels.shape[:2]
+        pvr             = struct.pack('<IIQIIIIIIIII', self.pvrVersion, 0, self.pixelFormat, 0, 0, height, width, 1, 1, 1, 1, 0) + self.encodeDxt5(pixels)
+        return struct.pack('<I', len(pvr)) + zlib.compress(pvr, 9)
+
+    @classmethod
+    def readPage(cls, data):
+        """Returns the pixels of a PVRZ file."""
+        pvr = zlib.decompress(data[4:])
+        version, flags, pixelFormat, colorSpace, channelType, height, width, depth, surfaces, faces, mipmaps, metaData = struct.unpack_from('<IIQIIIIIIIII', pvr)
+        if (version != cls.pvrVersion or pixelFormat != cls.pixelFormat):
+            raise ValueError("ERROR: The file is no DXT5 PVRZ file!")
+        return cls.decodeDxt5(pvr[52 + metaData:], width, height)
+
+    def encode(self, bamFiles):
+        """Returns the BAM V2 files and the pages(pixels) of the BAM files, each a list of cycles(see IEAS_BamWriter.encode)."""
+        startTimer  = time.perf_counter()
+        # Every frame is split into blocks of at most the page size and equal frames are packed once.
+        frames      = {}
+        for cycles in bamFiles.values():
+            for cycle in cycles:
+                for pixels, centerX, centerY in cycle:
+                    if (pixels.size == 0):
+                        pixels = np.zeros((1, 1, 4), dtype=np.uint8)
+                    frames.setdefault((pixels.shape, pixels.tobytes()), pixels)
+        tiles = [(key, x, y, min(self.pageSize, pixels.shape[1] - x), min(self.pageSize, pixels.shape[0] - y))
+                 for key, pixels in frames.items()
+                 for y in range(0, pixels.shape[0], self.pageSize) for x in range(0, pixels.shape[1], self.pageSize)]
+        # The highest blocks first leave the fewest gaps below the skyline.
+        tiles.sort(key=lambda tile: (tile[4], tile[3]), reverse=True)
+        packer      = IEAS_AtlasPacker(self.pageSize, self.pageSize)
+        blocks      = {}
+        for key, x, y, width, height in tiles:
+            page, pageX, pageY = packer.insert(width, height)
+            blocks.setdefault(key, []).append((page, pageX, pageY, width, height, x, y))
+        if (self.pageBase + len(packer.extents) - 1 > self.maxPage):
+            raise ValueError(f"ERROR: The {len(packer.extents)} PVRZ pages from index {self.pageBase} exceed the index {self.maxPage}!")
+        pages = [np.zeros((height, width, 4), dtype=np.uint8) for width, height in packer.pageSizes()]
+        for key, pixels in frames.items():
+            for page, pageX, pageY, width, height, x, y in blocks[key]:
+                pages[page][pageY:pageY+height, pageX:pageX+width] = pixels[y:y+height, x:x+width]
+        self.frameArea  += sum(pixels.shape[0] * pixels.shape[1] for pixels in frames.values())
+        self.pageArea   += sum(page.shape[0] * page.shape[1] for page in pages)
+
+        bams = {}
+        for bamName, cycles in bamFiles.items():
+            frameEntries    = []
+            cycleEntries    = []
+            blockEntries    = []
+            frameBlocks     = {}
+            for cycle in cycles:
+                cycleEntries.append(struct.pack('<HH', len(cycle), len(frameEntries) if (len(cycle) > 0) else 0))
+                for pixels, centerX, centerY in cycle:
+                    if (pixels.size == 0):
+                        pixels, centerX, centerY = np.zeros((1, 1, 4), dtype=np.uint8), 0, 0
+                    key = (pixels.shape, pixels.tobytes())
+                    # The data blocks of equal frames are written once per file.
+                    if (key not in frameBlocks):
+                        frameBlocks[key] = len(blockEntries)
+                        blockEntries += [struct.pack('<7I', self.pageBase + page, pageX, pageY, width, height, x, y)
+                                         for page, pageX, pageY, width, height, x, y in blocks[key]]
+                    frameEntries.append(struct.pack('<HHhhHH', pixels.shape[1], pixels.shape[0], centerX, centerY,
+                                                    frameBlocks[key], len(blocks[key])))
+            if (len(frameEntries) > 65535 or len(blockEntries) > 65535):
+                raise ValueError(f"ERROR: A BAM V2 file has at most 65535 frames and data blocks, not {len(frameEntries)} and {len(blockEntries)}!")
+            # Header, frame entries, cycle entries and data blocks.
+            frameOffset = 32
+            cycleOffset = frameOffset + 12 * len(frameEntries)
+            blockOffset = cycleOffset + 4 * len(cycleEntries)
+            header      = self.signature + struct.pack('<6I', len(frameEntries), len(cycleEntries), len(blockEntries),
+                                                        frameOffset, cycleOffset, blockOffset)
+            bams[bamName] = header + b"".join(frameEntries) + b"".join(cycleEntries) + b"".join(blockEntries)
+        self.seconds += time.perf_counter() - startTimer
+        return bams, pages
+
+    @classmethod
+    def read(cls, data, pages):
+        """Returns the cycles of a BAM V2 file with the pages(by index), each a list of (pixels, centerX, centerY)."""
+        if (data[:8] != cls.signature):
+            raise ValueError("ERROR: The file is no BAM V2 file!")
+        frameCount, cycleCount, blockCount, frameOffset, cycleOffset, blockOffset = struct.unpack_from('<6I', data, 8)
+        frames = []
+        for index in range(frameCount):
+            width, height, centerX, centerY, start, count = struct.unpack_from('<HHhhHH', data, frameOffset + 12 * index)
+            pixels = np.zeros((height, width, 4), dtype=np.uint8)
+            for block in range(start, start + count):
+                page, pageX, pageY, blockWidth, blockHeight, x, y = struct.unpack_from('<7I', data, blockOffset + 28 * block)
+                pixels[y:y+blockHeight, x:x+blockWidth] = pages[page][pageY:pageY+blockHeight, pageX:pageX+blockWidth]
+            frames.append((pixels, centerX, centerY))
+        cycles = []
+        for index in range(cycleCount):
+            count, start = struct.unpack_from('<HH', data, cycleOffset + 4 * index)
+            cycles.append(frames[start:start+count])
+        return cycles
+
+    def writeFile(self, filePath, data):
+        """Writes a file atomically."""
+        with open(filePath + ".tmp", 'wb') as outputFile:
+            outputFile.write(data)
+        os.replace(filePath + ".tmp", filePath)
+        self.bytes += len(data)
+
+    def writePlan(self, plan:IEAS_RenderPlan):
+        """Writes the BAM V2 files and PVRZ pages of the plan's creature sprites into the folder 'bam' of the save folder and returns the warnings."""
+        startTimer  = time.perf_counter()
+        folder      = os.path.join(plan.pathSaveAt, self.folderName)
+        os.makedirs(folder, exist_ok=True)
+        # All files are packed together, so the cropped frames of the whole creature are kept in memory.
+        bamFiles    = {}
+        for bamName, bamCycles in self.reader.sprites(plan).items():
+            cycles = self.reader.readCycles(bamName, bamCycles, lambda pixels: pixels[..., 3] > 0)
+            if (cycles != None):
+                bamFiles[bamName] = cycles
+        bams, pages = self.encode(bamFiles)
+        for page, pixels in enumerate(pages):
+            self.writeFile(os.path.join(folder, self.pageName(self.pageBase + page)), self.encodePage(pixels))
+        for bamName, data in bams.items():
+            self.writeFile(os.path.join(folder, bamName), data)
+        self.files      = len(bams)
+        self.frames     = sum(len(cycle) for cycles in bamFiles.values() for cycle in cycles)
+        self.pages      = len(pages)
+        self.seconds    = time.perf_counter() - startTimer
+        return self.reader.warnings
+
+    def timing(self):
+        """Returns the number of written BAM files, frames and pages, the packing efficiency, their size in KB and the time in seconds."""
+        pages = f"{self.pageName(self.pageBase)} to {self.pageName(self.pageBase + self.pages - 1)}" if (self.pages > 0) else "none"
+        return (f"BAM V2 output: {self.files} BAM files with {self.frames} frames on {self.pages} PVRZ pages({pages}), "
+                f"{self.frameArea / max(self.pageArea, 1):.0%} of the pages used, {self.bytes / 1024.0:.0f}KB in {self.seconds:.1f}s")
+
+
+# --------
+# Purpose:
+# --------
+# Changes the visibility of collections only if it differs from the current one and counts the changes.
+# Every change of 'exclude' rebuilds the view layer, which can take longer than the render of big scenes.
+# Layer collections(lower part, weapons and armor) stay visible until another layer needs a different state,
+# so renders of the same layer one after another(see IEAS_RenderPlanExecutor.sortGroups) need no change at all.
+# With useHideRender the layer collections are hidden with 'hide_render' instead of 'exclude'. Their objects are
+# still evaluated then, but the view layer is not rebuilt for every change.
+# ----------------------------------------------------------------------------------------------------------------
+class IEAS_VisibilityState():
+    """Contains methods for changing the visibility of collections with as few changes as possible"""
+
+    def __init__(self, useHideRender=False):
+        self.useHideRender  = useHideRender
+        # Number of changed collection properties.
+        self.changes        = 0
+        # Layer collections which are visible at the moment.
+        self.shown          = set()
+        # Values before the first change by (collection name, property name), see restore.
+        self.originals      = {}
+
+    def set(self, collectionName, attribute, value):
+        """Sets the property('exclude', 'holdout' or 'hide_render') of the collection if it differs."""
+        layerCollection = bpy.context.view_layer.layer_collection.children[collectionName]
+        # 'hide_render' is a property of the collection, the others of the layer collection.
+        target = layerCollection.collection if (attribute == 'hide_render') else layerCollection
+        if (getattr(target, attribute) != value):
+            self.originals.setdefault((collectionName, attribute), getattr(target, attribute))
+            setattr(target, attribute, value)
+            self.changes += 1
+
+    def restore(self, collectionName, attribute):
+        """Sets the property of the collection back to its value before the first change."""
+        if ((collectionName, attribute) in self.originals):
+            self.set(collectionName, attribute, self.originals[(collectionName, attribute)])
+
+    def setVisible(self, collectionName, visible):
+        """Shows or hides a layer collection with 'exclude' or 'hide_render'."""
+        if (self.useHideRender == True):
+            self.set(collectionName, 'exclude', False)
+            self.set(collectionName, 'hide_render', not visible)
+        else:
+            self.set(collectionName, 'exclude', not visible)
+
+    def begin(self, layerNames):
+        """Hides every layer collection of the plan before the first render."""
+        for collectionName in layerNames:
+            self.setVisible(collectionName, False)
+        self.shown.clear()
+
+    def showOnly(self, layerNames):
+        """Shows the given layer collections and hides every other visible layer collection."""
+        for collectionName in [name for name in self.shown if name not in layerNames]:
+            self.setVisible(collectionName, False)
+            self.shown.discard(collectionName)
+        for collectionName in layerNames:
+            if (collectionName not in self.shown):
+                self.setVisible(collectionName, True)
+                self.shown.add(collectionName)
+
+
+# --------
+# Purpose:
+# --------
+# Renders all weapon layers of a frame in one render instead of one render per weapon.
+# Python cannot read the render passes, so the compositor splits the render: a Cryptomatte node per weapon
+# collection selects the pixels of its objects and a File Output node saves every weapon into its own file.
+# The creature is a holdout like in the single weapon renders, so it still hides the weapons behind it.
+# If two weapons share a pixel, the split files would differ from single weapon renders, so render returns
+# False and the weapons of the frame are rendered one by one(see IEAS_AnimationTypes.renderLayers).
+# ---------------------------------------------------------------------------------------------------------
+class IEAS_WeaponPass():
+    """Contains methods for rendering and splitting all weapon layers of a frame with one render"""
+    nodePrefix      = "IEAS Weapon"
+    viewerImageName = "Viewer Node"
+    # Largest difference of a channel between the weapon pass and a single weapon render which counts as equal.
+    verifyTolerance = 2.0 / 255.0
+
+    def __init__(self, weaponLayers, pathSaveAt, pixelBridge:IEAS_PixelBridge):
+        # Names of all weapon collections of the plan, each gets one file output slot.
+        self.weaponLayers   = weaponLayers
+        # The process id keeps the files of parallel render processes apart.
+        self.tempFolder     = os.path.join(pathSaveAt, f"temp{os.getpid()}")
+        self.pixelBridge    = pixelBridge
+        # The first weapon pass is compared with single weapon renders(see verify). If they differ, e.g. because the
+        # weapons shade each other, failed contains the reason and the weapons are rendered one by one.
+        self.verified       = False
+        self.failed         = None
+        # The compositor and pass settings before begin, None until they are stored.
+        self.original       = None
+
+    def begin(self):
+        """Adds the compositor nodes and enables the Cryptomatte pass."""
+        scene       = bpy.context.scene
+        viewLayer   = bpy.context.view_layer
+        # Stores the compositor and pass settings to be restored by end.
+        self.original = (scene.use_nodes, scene.render.use_compositing, viewLayer.use_pass_cryptomatte_object)
+        scene.use_nodes                         = True
+        scene.render.use_compositing            = True
+        viewLayer.use_pass_cryptomatte_object   = True
+        os.makedirs(self.tempFolder, exist_ok=True)
+
+        tree        = scene.node_tree
+        imageSocket = IEAS_AnimationTypes.compositeImageSocket(tree.nodes)
+        output      = self.newNode(tree, 'CompositorNodeOutputFile', "Output")
+        output.base_path = self.tempFolder
+        # The weapon files get the same format as the renders.
+        imageSettings = scene.render.image_settings
+        output.format.file_format   = imageSettings.file_format
+        output.format.color_mode    = imageSettings.color_mode
+        output.format.color_depth   = imageSettings.color_depth
+        output.format.compression   = imageSettings.compression
+        output.file_slots.clear()
+        # The File Output node is muted except for the weapon pass, otherwise every other render would write its files.
+        output.mute                 = True
+        self.output                 = output
+        self.imageSocket            = imageSocket
+        self.setAlphas              = []
+
+        # The sum of all weapon masks is greater than 1 where two weapons share a pixel.
+        overlapSocket = None
+        for index, weaponLayer in enumerate(self.weaponLayers):
+            collection              = bpy.data.collections[weaponLayer]
+            cryptomatte             = self.newNode(tree, 'CompositorNodeCryptomatteV2', f"Cryptomatte{index}")
+            cryptomatte.source      = 'RENDER'
+            cryptomatte.scene       = scene
+            cryptomatte.layer_name  = f"{viewLayer.name}.CryptoObject"
+            cryptomatte.matte_id    = ",".join(obj.name for obj in collection.all_objects)
+            tree.links.new(imageSocket, cryptomatte.inputs['Image'])
+            # Every pixel touched by the weapon is taken completely, like in the single weapon render.
+            mask                    = self.newNode(tree, 'CompositorNodeMath', f"Mask{index}")
+            mask.operation          = 'GREATER_THAN'
+            mask.inputs[1].default_value = 0.0
+            tree.links.new(cryptomatte.outputs['Matte'], mask.inputs[0])
+            setAlpha                = self.newNode(tree, 'CompositorNodeSetAlpha', f"SetAlpha{index}")
+            setAlpha.mode           = 'APPLY'
+            tree.links.new(imageSocket, setAlpha.inputs['Image'])
+            tree.links.new(mask.outputs[0], setAlpha.inputs['Alpha'])
+            self.setAlphas.append(setAlpha)
+            output.file_slots.new(f"weapon{index}_####")
+            tree.links.new(setAlpha.outputs['Image'], output.inputs[index])
+            if (overlapSocket is None):
+                overlapSocket = mask.outputs[0]
+            else:
+                add             = self.newNode(tree, 'CompositorNodeMath', f"Overlap{index}")
+                add.operation   = 'ADD'
+                tree.links.new(overlapSocket, add.inputs[0])
+                tree.links.new(mask.outputs[0], add.inputs[1])
+                overlapSocket   = add.outputs[0]
+
+        self.viewer = self.newNode(tree, 'CompositorNodeViewer', "Viewer")
+        tree.links.new(overlapSocket, self.viewer.inputs['Image'])
+        # Receives a weapon of the pass or a single weapon render for the comparison(see verify).
+        self.check  = self.newNode(tree, 'CompositorNodeViewer', "Check")
+
+    def newNode(self, tree, nodeType, name):
+        """Adds a compositor node which is removed by end."""
+        node        = tree.nodes.new(nodeType)
+        node.name   = f"{self.nodePrefix} {name}"
+        return node
+
+    def end(self):
+        """Removes the compositor nodes and temporary files and restores the compositor and pass settings."""
+        scene       = bpy.context.scene
+        viewLayer   = bpy.context.view_layer
+        # Also works after a begin which failed halfway.
+        if (scene.node_tree != None):
+            for node in [node for node in scene.node_tree.nodes if node.name.startswith(self.nodePrefix)]:
+                scene.node_tree.nodes.remove(node)
+        if (self.original != None):
+            scene.use_nodes, scene.render.use_compositing, viewLayer.use_pass_cryptomatte_object = self.original
+        shutil.rmtree(self.tempFolder, ignore_errors=True)
+
+    def render(self, weaponJobs, visibility):
+        """Renders the weapon jobs of the current frame at once and returns False if two weapons overlap."""
+        visibility.showOnly([job.layer for job in weaponJobs])
+        # Blender writes only the pixels of the active Viewer node into the viewer image, so the Viewer node of the
+        # overlap is only active for this render and other Viewer nodes(see beginViewer) keep working.
+        nodes               = bpy.context.scene.node_tree.nodes
+        previousActive      = nodes.active
+        nodes.active        = self.viewer
+        self.output.mute    = False
+        try:
+            bpy.ops.render.render(False, animation=False, write_still=False)
+        finally:
+            self.output.mute    = True
+            nodes.active        = previousActive
+
+        # The Viewer node contains the number of weapons per pixel.
+        overlap = self.pixelBridge.read(bpy.data.images[self.viewerImageName], "overlap")
+        if (overlap[..., 0].max() > 1.5):
+            return False
+        if (self.verified == False):
+            difference = self.verify(weaponJobs, visibility)
+            if (difference > self.verifyTolerance):
+                self.failed = f"weapons rendered one by one(the weapon pass differs from single weapon renders by {difference:.3f})"
+                return False
+            self.verified = True
+
+        # The File Output node replaces '####' with the frame number.
+        frame = bpy.context.scene.frame_current
+        for job in weaponJobs:
+            index       = self.weaponLayers.index(job.layer)
+            weaponFile  = os.path.join(self.tempFolder, f"weapon{index}_{frame:04d}.png")
+            if not os.path.exists(weaponFile):
+                raise ValueError(f"Weapon file '{weaponFile}' was not written by the compositor!")
+            # Moving is only a rename, the file is not written again.
+            os.replace(weaponFile, job.outputPaths[0])
+        return True
+
+    def verify(self, weaponJobs, visibility):
+        """Returns the largest difference between each weapon of the pass and a render of this weapon alone."""
+        # Weapons which shade each other(e.g. shadows, ambient occlusion) look different in the pass.
+        tree            = bpy.context.scene.node_tree
+        previousActive  = tree.nodes.active
+        tree.nodes.active = self.check
+        difference      = 0.0
+        try:
+            for job in weaponJobs:
+                visibility.showOnly([weaponJob.layer for weaponJob in weaponJobs])
+                tree.links.new(self.setAlphas[self.weaponLayers.index(job.layer)].outputs['Image'], self.check.inputs['Image'])
+                bpy.ops.render.render(False, animation=False, write_still=False)
+                passPixels  = self.pixelBridge.read(bpy.data.images[self.viewerImageName], "weaponPass")
+                visibility.showOnly([job.layer])
+                tree.links.new(self.imageSocket, self.check.inputs['Image'])
+                bpy.ops.render.render(False, animation=False, write_still=False)
+                single      = self.pixelBridge.read(bpy.data.images[self.viewerImageName], "weaponSingle")
+                difference  = max(difference, float(np.abs(passPixels - single).max()))
+        finally:
+            tree.nodes.active = previousActive
+        return difference
+
+
+# --------
+# Purpose:
+# --------
+# Renders the armor layers of the 5000/6000 types with the creature as holdout and composites them over the creature.
+# The creature is rendered once per frame and each armor collection only with its own objects, the creature is not
+# shaded again but cuts the armor out where it is in front of it. So every armor level adds one small layer render
+# instead of another render of the whole character, and the layer needs no depth to be composited.
+# The pixels of both layers are read from the compositor Viewer node(see IEAS_AnimationTypes.beginViewer) and stay in
+# memory, nothing is written to disk before the composited sprite.
+# The armor does not cast shadows onto the creature, so the result can differ slightly from a render of both together.
+# --------------------------------------------------------------------------------------------------------------------
+class IEAS_ArmorLayers():
+    """Contains methods for rendering armor layers and compositing them over the creature"""
+    viewerImageName = "Viewer Node"
+
+    def __init__(self, pixelBridge:IEAS_PixelBridge, imagePool:IEAS_ImagePool):
+        self.pixelBridge    = pixelBridge
+        self.imagePool      = imagePool
+        # Saves the layers without write_still if it is set(see IEAS_AnimationTypes.saveRender and IEAS_PngEncoder).
+        self.saveRender     = None
+
+    def renderLayer(self, name, filePath=None):
+        """Renders the visible collections and returns their pixels, saving the render if filePath is given."""
+        writeStill = (filePath != None and self.saveRender is None)
+        if (writeStill == True):
+            bpy.context.scene.render.filepath = filePath
+        bpy.ops.render.render(False, animation=False, write_still=writeStill)
+        # The Viewer buffer is reused by every render, so the pixels are read into a buffer of this layer.
+        pixels = self.pixelBridge.read(bpy.data.images[self.viewerImageName], name)
+        if (filePath != None and self.saveRender != None):
+            self.saveRender(pixels, filePath, "ArmorLayer")
+        return pixels
+
+    def composite(self, creature, armor):
+        """Returns the armor layer composited over the creature layer."""
+        # Both layers are premultiplied and the armor is already cut out by the creature in front of it(holdout),
+        # so 'armor over creature' is armor + creature * (1 - armor alpha).
+        return armor + creature * (1.0 - armor[..., 3:4])
+
+    def saveComposite(self, pixels, filePath):
+        """Saves the composited pixels like a render, with the scene's color management and output format."""
+        if (self.saveRender != None):
+            self.saveRender(pixels, filePath, "ArmorLayer")
+            return
+        height, width   = pixels.shape[:2]
+        image           = self.imagePool.get("ArmorLayer", width, height, floatBuffer=True)
+        self.pixelBridge.write(image, pixels)
+        image.save_render(filePath, scene=bpy.context.scene)
+
+
+# --------
+# Purpose:
+# --------
+# Renders several sprites as tiles of one bigger render, which is split into the sprites again.
+# The camera shows the whole grid with the same pixel size, so each tile is exactly the image of a single render.
+# This needs an orthographic camera, otherwise every tile would be seen from a different angle.
+# The tiles are separated by transparent gaps. Anything visible in a gap reached out of its tile(e.g. a glow or a
+# shadow), so the grid is checked for bleeding after every render(see bleeding).
+# ----------------------------------------------------------------------------------------------------------------
+class IEAS_TileGrid():
+    """Contains methods for rendering several sprites as tiles of one render"""
+    viewerImageName = "Viewer Node"
+    # Transparent space between the tiles relative to the tile size. Parts of the creature which reach a little out of
+    # its frame are cut off like in a single render instead of showing up in the next tile.
+    gapFactor       = 0.25
+    # The largest alpha value in the gaps which does not count as bleeding(one 8-bit step).
+    bleedTolerance  = 1.0 / 255.0
+    # The largest difference between a tile and a single render of the same sprite(two 8-bit steps), e.g. for noise.
+    verifyTolerance = 2.0 / 255.0
+    # The largest image side of the render engines. EEVEE and Workbench render on the GPU and are limited by its textures.
+    maxSides        = {'CYCLES': 65536}
+    maxSide         = 16384
+    # The largest grid in pixels, which keeps the float32 buffer of the Viewer pixels at 256 MB.
+    maxPixels       = 4096 * 4096
+
+    def __init__(self, tiles, pixelBridge:IEAS_PixelBridge):
+        # The grid is about square, e.g. 3x3 for 9 tiles.
+        self.columns        = math.ceil(math.sqrt(tiles))
+        self.rows           = math.ceil(tiles / self.columns)
+        self.tiles          = tiles
+        self.pixelBridge    = pixelBridge
+
+    @staticmethod
+    def unsupported(scene):
+        """Returns why the scene cannot be rendered as a grid or None if it can."""
+        camera = scene.camera
+        if (camera is None):
+            return "the scene has no camera"
+        if (camera.data.type != 'ORTHO'):
+            return "the camera is not orthographic"
+        # The orthographic scale and the shift refer to the larger side of the image only with 'Auto'.
+        if (camera.data.sensor_fit != 'AUTO'):
+            return "the sensor fit of the camera is not 'Auto'"
+        if (scene.render.pixel_aspect_x != scene.render.pixel_aspect_y):
+            return "the pixel aspect is not 1:1"
+        return None
+
+    @classmethod
+    def maxTiles(cls, scene):
+        """Returns the largest number of tiles whose grid can be rendered with the scene's resolution and engine."""
+        render  = scene.render
+        width   = (render.resolution_x * render.resolution_percentage) // 100
+        height  = (render.resolution_y * render.resolution_percentage) // 100
+        gap     = math.ceil(max(width, height) * cls.gapFactor)
+        maxSide = cls.maxSides.get(render.engine, cls.maxSide)
+        # A grid of n tiles needs n*pitch-gap pixels per side.
+        columns = (maxSide + gap) // (width + gap)
+        rows    = (maxSide + gap) // (height + gap)
+        tiles   = min(columns, rows) ** 2
+        # The square grid is made smaller until it also fits into the pixel budget.
+        while (tiles > 1 and (math.ceil(math.sqrt(tiles)) * (width + gap)) * (math.ceil(tiles / math.ceil(math.sqrt(tiles))) * (height + gap)) > cls.maxPixels):
+            tiles -= 1
+        return max(tiles, 1)
+
+    def begin(self):
+        """Calculates the render and camera settings of the grid."""
+        scene   = bpy.context.scene
+        render  = scene.render
+        camera  = scene.camera
+        # The render and camera settings of a single sprite, which are used by every other render.
+        self.original = (   render.resolution_x, render.resolution_y, render.resolution_percentage,
+                            camera.data.ortho_scale, camera.data.shift_x, camera.data.shift_y   )
+        # Size of one tile in pixels, as it is rendered without the grid.
+        self.width      = (render.resolution_x * render.resolution_percentage) // 100
+        self.height     = (render.resolution_y * render.resolution_percentage) // 100
+        self.gap        = math.ceil(max(self.width, self.height) * self.gapFactor)
+        self.pitchX     = self.width + self.gap
+        self.pitchY     = self.height + self.gap
+        gridWidth       = self.columns * self.pitchX - self.gap
+        gridHeight      = self.rows * self.pitchY - self.gap
+        largest         = max(self.width, self.height)
+        gridLargest     = max(gridWidth, gridHeight)
+        # The orthographic scale is the width of the larger side, so the scaled one keeps the size of a pixel.
+        # The first tile(top left) is where a single render would be, so the view is shifted by the rest of the grid.
+        self.grid = (   gridWidth, gridHeight, 100, self.original[3] * gridLargest / largest,
+                        (self.original[4] * largest + (gridWidth - self.width) / 2) / gridLargest,
+                        (self.original[5] * largest - (gridHeight - self.height) / 2) / gridLargest )
+        # The tiles are placed along the camera's right and up axes with the size of a pixel as unit.
+        pixelSize   = self.original[3] / largest
+        self.right  = camera.matrix_world.col[0].xyz.normalized() * pixelSize
+        self.up     = camera.matrix_world.col[1].xyz.normalized() * pixelSize
+        # Every pixel which is not part of a tile.
+        self.gapMask = np.ones((gridHeight, gridWidth), dtype=bool)
+        for index in range(self.tiles):
+            self.gapMask[self.tileSlice(index, gridHeight)] = False
+
+    def apply(self, settings):
+        """Sets the render and camera settings(see begin), so other renders keep the size of a single sprite."""
+        render  = bpy.context.scene.render
+        camera  = bpy.context.scene.camera.data
+        (   render.resolution_x, render.resolution_y, render.resolution_percentage,
+            camera.ortho_scale, camera.shift_x, camera.shift_y  ) = settings
+
+    def offset(self, index):
+        """Returns the distance of the tile from the first tile in the scene."""
+        column, row = index % self.columns, index // self.columns
+        return self.right * (column * self.pitchX) - self.up * (row * self.pitchY)
+
+    def tileSlice(self, index, gridHeight):
+        """Returns the (rows, columns) slice of the tile in the grid pixels."""
+        column, row = index % self.columns, index // self.columns
+        # Blender stores the pixel rows from bottom to top, so the first tile row is at the end.
+        top = gridHeight - row * self.pitchY
+        return (slice(top - self.height, top), slice(column * self.pitchX, column * self.pitchX + self.width))
+
+    def render(self, count):
+        """Renders the grid and returns the grid pixels and the pixels of the first count tiles."""
+        self.apply(self.grid)
+        try:
+            bpy.ops.render.render(False, animation=False, write_still=False)
+        finally:
+            self.apply(self.original)
+        pixels = self.pixelBridge.read(bpy.data.images[self.viewerImageName], "grid")
+        return pixels, [pixels[self.tileSlice(index, pixels.shape[0])] for index in range(count)]
+
+    def bleeding(self, pixels):
+        """Returns the largest alpha value in the gaps between the tiles if it is above the tolerance, otherwise None."""
+        alpha = pixels[..., 3][self.gapMask]
+        if (alpha.size == 0 or alpha.max() <= self.bleedTolerance):
+            return None
+        return float(alpha.max())
+
+
+# --------
+# Purpose:
+# --------
+# Renders all directions of a frame with one render instead of one render per direction(see IEAS_TileGrid).
+# The creature collection is instanced once for every further direction, rotated by the difference to the first
+# direction and placed on its tile. Only the creature collection is instanced: objects of other collections appear
+# only in the first tile and lights inside the collection are instanced as well. Multi-view with one camera per
+# direction is not used, because it still renders every view on its own.
+# ------------------------------------------------------------------------------------------------------------------
+class IEAS_DirectionGrid():
+    """Contains methods for rendering all directions of a frame as tiles of one render"""
+    objectPrefix    = "IEAS Direction"
+
+    def __init__(self, collectionName, objectName, directions, pixelBridge:IEAS_PixelBridge):
+        # The collection which is instanced and the object whose rotation is the first direction.
+        self.collectionName = collectionName
+        self.objectName     = objectName
+        # The grid has a tile for each direction of a frame.
+        self.tileGrid       = IEAS_TileGrid(directions, pixelBridge)
+        self.tiles          = directions
+        # One instance for every tile except the first one, which shows the collection itself.
+        self.instances      = []
+        self.originalOffset = None
+        # The single renders of the first grid are compared with its tiles once(see IEAS_AnimationTypes.renderGrid).
+        self.verified       = False
+
+    def begin(self):
+        """Calculates the grid settings and adds the hidden collection instances."""
+        self.tileGrid.begin()
+        collection              = bpy.data.collections[self.collectionName]
+        self.originalOffset     = tuple(collection.instance_offset)
+        for index in range(1, self.tiles):
+            instance                        = bpy.data.objects.new(f"{self.objectPrefix} {index}", None)
+            instance.instance_type          = 'COLLECTION'
+            instance.instance_collection    = collection
+            instance.hide_render            = True
+            bpy.context.scene.collection.objects.link(instance)
+            self.instances.append(instance)
+
+    def end(self):
+        """Removes the collection instances and restores the instance offset of the collection."""
+        for instance in self.instances:
+            bpy.data.objects.remove(instance, do_unlink=True)
+        self.instances = []
+        if (self.originalOffset != None):
+            bpy.data.collections[self.collectionName].instance_offset = self.originalOffset
+
+    def render(self, jobs):
+        """Renders the directions of the jobs(one per tile) and returns the grid pixels and the pixels of each tile."""
+        objectCurrent   = bpy.data.objects[self.objectName]
+        location        = objectCurrent.matrix_world.translation.copy()
+        # The instances are rotated around the object's origin like the object itself.
+        bpy.data.collections[self.collectionName].instance_offset = location
+        for index, instance in enumerate(self.instances, start=1):
+            instance.hide_render = (index >= len(jobs))
+            if (index < len(jobs)):
+                instance.location       = location + self.tileGrid.offset(index)
+                # The object is already rotated to the first direction, which is part of every instance.
+                instance.rotation_euler = (0.0, 0.0, math.radians(jobs[index].angle - jobs[0].angle))
+        try:
+            return self.tileGrid.render(len(jobs))
+        finally:
+            for instance in self.instances:
+                instance.hide_render = True
+
+
+# --------
+# Purpose:
+# --------
+# Renders several frames(and directions) of an animation with one render(see IEAS_TileGrid), which is faster for
+# small sprites, because the fixed cost of a render call is much larger than the cost of the pixels.
+# A collection instance always shows the same pose, so the creature collection is copied once for every further
+# tile instead. The copies share the mesh and armature data(linked duplicates), the copied object plays the action
+# with an NLA strip which is shifted by the frame difference, and each copy is placed and rotated on its tile.
+# The first render is compared with single renders of its sprites, so shadows or light of the copies which fall
+# onto other tiles are found(see IEAS_AnimationTypes.renderFrames).
+# ------------------------------------------------------------------------------------------------------------------
+class IEAS_FrameGrid():
+    """Contains methods for rendering several frames of an animation as tiles of one render"""
+    collectionName  = "IEAS Frames"
+
+    def __init__(self, creatureCollectionName, objectName, tiles, pixelBridge:IEAS_PixelBridge):
+        # The collection which is copied and the object which is animated and rotated.
+        self.creatureCollectionName = creatureCollectionName
+        self.objectName             = objectName
+        self.tileGrid               = IEAS_TileGrid(tiles, pixelBridge)
+        self.tiles                  = tiles
+        # The copies of every tile except the first one, which shows the creature itself.
+        # Each tile has its (original, copy) pairs, the pairs without copied parent, the object copy and its NLA track.
+        self.copies                 = []
+        self.collection             = None
+        # The single renders of the first grid are compared with its tiles once(see IEAS_AnimationTypes.renderGrid).
+        self.verified               = False
+
+    @staticmethod
+    def unsupported(creatureCollectionName, objectName):
+        """Returns why the creature collection cannot be copied or None if it can."""
+        creature = bpy.data.collections.get(creatureCollectionName)
+        if (creature is None or objectName not in [obj.name for obj in creature.all_objects]):
+            return f"the object '{objectName}' is not part of the collection '{creatureCollectionName}'"
+        return None
+
+    def begin(self):
+        """Calculates the grid settings and adds a hidden copy of the creature collection for every further tile."""
+        self.tileGrid.begin()
+        scene       = bpy.context.scene
+        creature    = bpy.data.collections[self.creatureCollectionName]
+        self.collection = bpy.data.collections.new(self.collectionName)
+        scene.collection.children.link(self.collection)
+        self.collection.hide_render = True
+        for index in range(1, self.tiles):
+            # Copies every object, the data(mesh, armature) is shared.
+            copies = {obj: obj.copy() for obj in creature.all_objects}
+            for original, copy in copies.items():
+                self.collection.objects.link(copy)
+                # Parents, modifiers(e.g. Armature) and constraints use the copies of the same tile.
+                if (original.parent in copies):
+                    copy.parent = copies[original.parent]
+                for modifier in copy.modifiers:
+                    if (getattr(modifier, 'object', None) in copies):
+                        modifier.object = copies[modifier.object]
+                for constraint in copy.constraints:
+                    if (getattr(constraint, 'target', None) in copies):
+                        constraint.target = copies[constraint.target]
+            pairs       = list(copies.items())
+            roots       = [(original, copy) for original, copy in pairs if original.parent not in copies]
+            objectCopy  = copies[bpy.data.objects[self.objectName]]
+            # The copied object plays the action only by its NLA strip(see render).
+            objectCopy.animation_data.action = None
+            self.copies.append((pairs, roots, objectCopy, objectCopy.animation_data.nla_tracks.new()))
+
+    def end(self):
+        """Removes the copies of the creature collection."""
+        if (self.collection != None):
+            for obj in list(self.collection.objects):
+                bpy.data.objects.remove(obj, do_unlink=True)
+            bpy.data.collections.remove(self.collection)
+            self.collection = None
+        self.copies = []
+
+    def render(self, jobs):
+        """Renders the frames and directions of the jobs(one per tile) and returns the grid pixels and the pixels of each tile."""
+        objectCurrent   = bpy.data.objects[self.objectName]
+        action          = objectCurrent.animation_data.action
+        for index, (pairs, roots, objectCopy, track) in enumerate(self.copies, start=1):
+            # Only the copies of the used tiles are visible.
+            for original, copy in pairs:
+                copy.hide_render = (index >= len(jobs)) or original.hide_render
+            if (index >= len(jobs)):
+                continue
+            # The strip starts earlier by the frame difference, so the copy shows the frame of its job.
+            start = int(action.frame_range[0]) + jobs[0].frame - jobs[index].frame
+            strip = track.strips[0] if (len(track.strips) > 0) else None
+            if (strip is None or strip.action != action or strip.frame_start != start):
+                if (strip != None):
+                    track.strips.remove(strip)
+                track.strips.new(action.name, start, action)
+            for original, copy in roots:
+                copy.location = original.location + self.tileGrid.offset(index)
+            objectCopy.rotation_euler[2] = math.radians(jobs[index].angle)
+        self.collection.hide_render = False
+        try:
+            return self.tileGrid.render(len(jobs))
+        finally:
+            self.collection.hide_render = True
 
 
+# --------
+# Purpose:
+# --------
+# Changes the direction by switching between cameras around the object instead of rotating the object(see
+# IEAS_RenderPlanExecutor.step). A rotated object has to be evaluated again with its whole hierarchy(armature, meshes,
+# modifiers) for every direction. Instead each direction gets a copy of the camera and the lights, rotated the other way
+# around the object's Z-axis, so the object and its pose stay untouched and only the active camera and lights change.
+# Lights which are children of the object rotate with it anyway and are not copied. The world(e.g. an HDRI) and objects
+# which are not children of the object(e.g. a ground plane) are not rotated, so they are seen from another side.
+# -----------------------------------------------------------------------------------------------------------------------
+class IEAS_CameraOrbit():
+    """Contains methods for changing the direction by switching between cameras around the object"""
+    collectionName  = "IEAS Orbit"
+
+    def __init__(self, objectName, angles):
+        # The object which is shown in every direction and the angles of the directions.
+        self.objectName     = objectName
+        self.angles         = angles
+        # The camera copy and the light copies of every direction by its angle.
+        self.cameras        = {}
+        self.lights         = {}
+        self.currentAngle   = None
+        # The camera and lights before begin, None until they are stored.
+        self.originalCamera = None
+        self.originalLights = []
+        self.collection     = None
+
+    @staticmethod
+    def isChild(obj, parent):
+        """Returns True if the object is the parent or one of its children."""
+        while (obj != None):
+            if (obj == parent):
+                return True
+            obj = obj.parent
+        return False
+
+    @classmethod
+    def unsupported(cls, scene, objectName):
+        """Returns why the camera cannot orbit the object or None if it can."""
+        if (scene.camera is None):
+            return "the scene has no camera"
+        if (cls.isChild(scene.camera, bpy.data.objects[objectName])):
+            return f"the camera is a child of the object '{objectName}'"
+        return None
+
+    def begin(self):
+        """Adds a copy of the camera and the lights for every direction."""
+        scene           = bpy.context.scene
+        objectCurrent   = bpy.data.objects[self.objectName]
+        self.originalCamera = scene.camera
+        self.originalLights = [ obj for obj in scene.objects
+                                if obj.type == 'LIGHT' and obj.hide_render == False and not self.isChild(obj, objectCurrent) ]
+        self.collection = bpy.data.collections.new(self.collectionName)
+        scene.collection.children.link(self.collection)
+        pivot           = objectCurrent.matrix_world.translation.copy()
+        # The index '2' corresponds to the Z-axis in Blender's rotation_euler tuple.
+        rotation        = objectCurrent.rotation_euler[2]
+        for angle in self.angles:
+            # Rotating the object to the angle looks the same as rotating the camera and lights the other way around it.
+            orbit   = Matrix.Translation(pivot) @ Matrix.Rotation(rotation - math.radians(angle), 4, 'Z') @ Matrix.Translation(-pivot)
+            copies  = []
+            for original in [self.originalCamera] + self.originalLights:
+                copy = original.copy()
+                self.collection.objects.link(copy)
+                copy.matrix_world   = orbit @ original.matrix_world
+                copy.hide_render    = True
+                copies.append(copy)
+            self.cameras[angle] = copies[0]
+            self.lights[angle]  = copies[1:]
+        # The original lights are replaced by the lights of the current direction(see select).
+        for light in self.originalLights:
+            light.hide_render = True
+
+    def select(self, angle):
+        """Makes the camera and lights of the direction active."""
+        bpy.context.scene.camera = self.cameras[angle]
+        if (self.currentAngle != None):
+            for light in self.lights[self.currentAngle]:
+                light.hide_render = True
+        for light in self.lights[angle]:
+            light.hide_render = False
+        self.currentAngle = angle
+
+    def end(self):
+        """Removes the copies and restores the camera and lights."""
+        if (self.originalCamera != None):
+            bpy.context.scene.camera = self.originalCamera
+        for light in self.originalLights:
+            light.hide_render = False
+        if (self.collection != None):
+            for obj in list(self.collection.objects):
+                bpy.data.objects.remove(obj, do_unlink=True)
+            bpy.data.collections.remove(self.collection)
+            self.collection = None
+        self.cameras        = {}
+        self.lights         = {}
+        self.currentAngle   = None
+
+# --------
+# Purpose:
+# --------
+# Bakes the armature deformation of the meshes into point cache files(PC2) before rendering, so the renders read the
+# vertex positions instead of evaluating the armature for every frame, direction and layer again.
+# Only the leading modifiers of a mesh which move vertices without other objects(Armature of the rig, smoothing) are
+# baked and replaced by a Mesh Cache modifier, the following modifiers(e.g. Subdivision) still work as usual.
+# Only meshes which are children of the rig are baked, because their deformation does not depend on its rotation.
+# The files are named by the hash of the action, mesh(vertices, weights, shape keys and transform), modifiers and the
+# rig(rest pose, constraints and drivers), so they are reused while nothing changed.
+# --------------------------------------------------------------------------------------------------------------------
+class IEAS_VertexCache():
+    """Contains methods for baking the mesh deformation of the actions into point cache files"""
+    folderName      = "ieas_cache"
+    modifierName    = "IEAS Vertex Cache"
+    # Modifiers which only move the vertices of the mesh itself.
+    deformTypes     = {'ARMATURE', 'SMOOTH', 'CORRECTIVE_SMOOTH', 'LAPLACIANSMOOTH'}
+
+    def __init__(self, objectName, pathSaveAt, frames):
+        # The rig and the frames which are rendered of each action.
+        self.objectName     = objectName
+        self.folder         = os.path.join(pathSaveAt, self.folderName)
+        self.frames         = frames
+        # The baked meshes with their replaced modifiers and the original visibility of these modifiers.
+        self.meshes         = []
+        self.original       = []
+        # The cache file of every mesh and action.
+        self.files          = {}
+        # Number of cache files which were baked or reused and the time of baking in seconds(see timing).
+        self.filesBaked     = 0
+        self.filesReused    = 0
+        self.bakeTime       = 0.0
+
+    def bakedModifiers(self, obj, rig):
+        """Returns the leading modifiers of the mesh which are baked or an empty list if the rig does not deform it."""
+        modifiers = []
+        for modifier in obj.modifiers:
+            if (modifier.type not in self.deformTypes or (modifier.type == 'ARMATURE' and modifier.object != rig)):
+                break
+            modifiers.append(modifier)
+        if not any(modifier.type == 'ARMATURE' for modifier in modifiers):
+            return []
+        return modifiers
+
+    def bakeFrames(self, frames):
+        """Returns the first frame and the step of the evenly spaced frames which contain all given frames."""
+        step = 0
+        for frame in frames:
+            step = math.gcd(step, frame - frames[0])
+        return frames[0], max(step, 1)
+
+    def meshState(self, hashes, obj, modifiers, rig):
+        """Returns the hash of everything the baked vertex positions depend on except the action of the rig."""
+        mesh        = obj.data
+        digest      = hashlib.sha256()
+        coordinates = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', coordinates)
+        digest.update(coordinates.tobytes())
+        # The Armature modifier deforms each vertex by the bones of its vertex groups and their weights.
+        digest.update(repr([group.name for group in obj.vertex_groups]).encode('utf-8'))
+        weights = np.array([(index, group.group, group.weight) for index, vertex in enumerate(mesh.vertices)
+                            for group in vertex.groups], dtype=np.float64)
+        digest.update(weights.tobytes())
+        # The shape keys are applied before the baked modifiers, also with their own action.
+        shapeKeys   = []
+        if (mesh.shape_keys != None):
+            for keyBlock in mesh.shape_keys.key_blocks:
+                keyBlock.data.foreach_get('co', coordinates)
+                digest.update(coordinates.tobytes())
+                shapeKeys.append((keyBlock.name, keyBlock.value, keyBlock.mute, keyBlock.relative_key.name, keyBlock.vertex_group))
+            animationData = mesh.shape_keys.animation_data
+            if (animationData != None and animationData.action != None):
+                shapeKeys.append(hashes.actionHash(animationData.action))
+        # The mesh moves with the rig by its transform relative to it.
+        matrices    = [tuple(tuple(row) for row in matrix) for matrix in (obj.matrix_parent_inverse, obj.matrix_local)]
+        bones       = [(bone.name, tuple(bone.head_local), tuple(bone.tail_local), bone.use_deform) for bone in rig.data.bones]
+        # Constraints and drivers of the rig change the pose of the action.
+        constraints = [(poseBone.name, constraint.type, constraint.mute, constraint.influence,
+                        getattr(getattr(constraint, 'target', None), 'name', None), getattr(constraint, 'subtarget', None))
+                       for poseBone in rig.pose.bones for constraint in poseBone.constraints]
+        drivers     = []
+        if (rig.animation_data != None):
+            for fcurve in rig.animation_data.drivers:
+                driver = fcurve.driver
+                drivers.append((fcurve.data_path, fcurve.array_index, fcurve.mute, driver.type, driver.expression,
+                                [(variable.name, variable.type, [(getattr(target.id, 'name', None), target.data_path,
+                                  target.bone_target, target.transform_type, target.transform_space) for target in variable.targets])
+                                 for variable in driver.variables]))
+        settings    = [(modifier.type, modifier.show_render) + tuple(getattr(modifier, name, None) for name in
+                       ('factor', 'iterations', 'use_deform_preserve_volume', 'use_vertex_groups', 'use_bone_envelopes'))
+                       for modifier in modifiers]
+        return hashes.digest(obj.name, mesh.name, digest.hexdigest(), shapeKeys, matrices, bones, constraints, drivers, settings)
+
+    def meshHash(self, hashes, meshState, actionHash, frames):
+        """Returns the hash of everything the baked vertex positions of an action depend on."""
+        return hashes.digest(meshState, actionHash, frames)
+
+    def writePC2(self, filePath, samples, firstFrame, step):
+        """Writes the vertex positions(samples, vertices, 3) as PC2 file."""
+        header = np.zeros(1, dtype=[('signature', 'S12'), ('version', '<i4'), ('points', '<i4'),
+                                    ('start', '<f4'), ('sampling', '<f4'), ('samples', '<i4')])
+        header[0] = (b"POINTCACHE2\0", 1, samples.shape[1], firstFrame, step, samples.shape[0])
+        # Writes into a temporary file first, so a cancelled bake does not leave a damaged cache file.
+        tempPath = filePath + ".tmp"
+        with open(tempPath, 'wb') as cacheFile:
+            cacheFile.write(header.tobytes())
+            cacheFile.write(samples.astype('<f4').tobytes())
+        os.replace(tempPath, filePath)
+
+    def begin(self):
+        """Bakes the missing cache files and replaces the baked modifiers of every mesh by a Mesh Cache modifier."""
+        startTimer  = time.perf_counter()
+        scene       = bpy.context.scene
+        rig         = bpy.data.objects[self.objectName]
+        hashes      = IEAS_RenderHashes(self.folder)
+        # Only the meshes of collections in the view layer are evaluated.
+        for obj in bpy.context.view_layer.objects:
+            if (obj.type == 'MESH' and obj != rig and IEAS_CameraOrbit.isChild(obj, rig)):
+                modifiers = self.bakedModifiers(obj, rig)
+                if (len(modifiers) > 0):
+                    self.meshes.append((obj, modifiers))
+        if (len(self.meshes) == 0):
+            return
+        os.makedirs(self.folder, exist_ok=True)
+
+        originalAction  = rig.animation_data.action
+        originalFrame   = scene.frame_current
+        # The evaluated meshes show the modifiers of the viewport, so they get the render state for baking.
+        originalShow    = [(modifier, modifier.show_viewport) for obj, modifiers in self.meshes for modifier in obj.modifiers]
+        # The state of each mesh is the same for every action.
+        meshStates      = {obj.name: self.meshState(hashes, obj, modifiers, rig) for obj, modifiers in self.meshes}
+        try:
+            for obj, modifiers in self.meshes:
+                for modifier in obj.modifiers:
+                    modifier.show_viewport = modifier.show_render if (modifier in modifiers) else False
+            for actionName, frames in self.frames.items():
+                firstFrame, step    = self.bakeFrames(frames)
+                bakeFrames          = list(range(firstFrame, frames[-1] + 1, step))
+                actionHash          = hashes.actionHash(bpy.data.actions[actionName])
+                missing             = []
+                for obj, modifiers in self.meshes:
+                    filePath = os.path.join(self.folder, self.meshHash(hashes, meshStates[obj.name], actionHash, bakeFrames) + ".pc2")
+                    self.files[(obj.name, actionName)] = (filePath, firstFrame, step)
+                    if os.path.exists(filePath):
+                        self.filesReused += 1
+                    else:
+                        missing.append((obj, filePath, np.empty((len(bakeFrames), len(obj.data.vertices), 3), dtype=np.float32)))
+                if (len(missing) == 0):
+                    continue
+                # Every frame is evaluated once for all meshes.
+                rig.animation_data.action = bpy.data.actions[actionName]
+                for index, frame in enumerate(bakeFrames):
+                    scene.frame_set(frame)
+                    depsgraph = bpy.context.evaluated_depsgraph_get()
+                    for obj, filePath, samples in missing:
+                        objectEvaluated = obj.evaluated_get(depsgraph)
+                        mesh            = objectEvaluated.to_mesh()
+                        mesh.vertices.foreach_get('co', samples[index].reshape(-1))
+                        objectEvaluated.to_mesh_clear()
+                for obj, filePath, samples in missing:
+                    self.writePC2(filePath, samples, firstFrame, step)
+                    self.filesBaked += 1
+        finally:
+            for modifier, show in originalShow:
+                modifier.show_viewport = show
+            rig.animation_data.action = originalAction
+            scene.frame_set(originalFrame)
+
+        # The Mesh Cache modifier replaces the baked modifiers at the top of the stack.
+        for obj, modifiers in self.meshes:
+            self.original.append([(modifier, modifier.show_viewport, modifier.show_render) for modifier in modifiers])
+            for modifier in modifiers:
+                modifier.show_viewport  = False
+                modifier.show_render    = False
+            cache = obj.modifiers.new(self.modifierName, 'MESH_CACHE')
+            obj.modifiers.move(len(obj.modifiers) - 1, 0)
+            cache.cache_format  = 'PC2'
+            cache.deform_mode   = 'OVERWRITE'
+            cache.interpolation = 'NONE'
+            cache.play_mode     = 'SCENE'
+            cache.time_mode     = 'FRAME'
+        self.bakeTime = time.perf_counter() - startTimer
+
+    def select(self, actionName):
+        """Makes the Mesh Cache modifiers read the cache files of the action."""
+        for obj, modifiers in self.meshes:
+            filePath, firstFrame, step  = self.files[(obj.name, actionName)]
+            cache                       = obj.modifiers[self.modifierName]
+            cache.filepath              = filePath
+            # The modifier reads the sample frame * frame_scale - frame_start, which is (frame - firstFrame) / step.
+            cache.frame_scale           = 1.0 / step
+            cache.frame_start           = firstFrame / step
+
+    def end(self):
+        """Removes the Mesh Cache modifiers and restores the baked modifiers."""
+        for (obj, modifiers), original in zip(self.meshes, self.original):
+            cache = obj.modifiers.get(self.modifierName)
+            if (cache != None):
+                obj.modifiers.remove(cache)
+            for modifier, showViewport, showRender in original:
+                modifier.show_viewport  = showViewport
+                modifier.show_render    = showRender
+        self.original = []
+
+    def timing(self):
+        """Returns the number of baked and reused cache files and the time of baking."""
+        return (f"vertex cache of {len(self.meshes)} meshes with {self.filesBaked} baked and {self.filesReused} reused files "
+                f"in {self.bakeTime:.1f}s")
+
+# --------
+# Purpose:
+# --------
+# Finds frames whose pose is the same as the one of the previous rendered frame, e.g. the holds of idle, dead and sleep
+# actions, so their sprites are copied instead of rendered. The state of a frame is the evaluated pose of the rig(bone
+# matrices, including constraints and drivers), its transform and the values of every other animated data block in the
+# view layer(e.g. shape keys and materials). Frames are compared with the last rendered frame, not the previous
+# frame, so small changes cannot add up over a long hold. The files are copied and not hard-linked, because a
+# later render of the source frame would overwrite the linked file as well.
+# ---------------------------------------------------------------------------------------------------------------------
+class IEAS_StaticFrames():
+    """Contains methods for copying the sprites of frames which do not differ from the previous rendered frame"""
+
+    def __init__(self, objectName, tolerance):
+        # The rig whose pose is compared and the largest difference of a value which counts as the same pose.
+        self.objectName     = objectName
+        self.tolerance      = tolerance
+        # Number of compared frames and frames which are copied and the time of the comparison in seconds(see timing).
+        self.framesTotal    = 0
+        self.framesStatic   = 0
+        self.analyzeTime    = 0.0
+
+    def animatedBlocks(self, rig):
+        """Returns the data blocks of the view layer, except the rig, which are animated by an action."""
+        blocks = []
+        for obj in bpy.context.view_layer.objects:
+            if (obj == rig):
+                continue
+            candidates = [obj, obj.data, getattr(obj.data, 'shape_keys', None)]
+            for slot in getattr(obj, 'material_slots', []):
+                if (slot.material != None):
+                    candidates += [slot.material, slot.material.node_tree]
+            for block in candidates:
+                animationData = getattr(block, 'animation_data', None)
+                if (animationData != None and animationData.action != None and block not in blocks):
+                    blocks.append(block)
+        return blocks
+
+    def state(self, rig, blocks, frame):
+        """Returns every value which changes the rendered pose at the frame."""
+        bpy.context.scene.frame_set(frame)
+        matrices = np.empty(len(rig.pose.bones) * 16, dtype=np.float32)
+        rig.pose.bones.foreach_get('matrix', matrices)
+        values = [fcurve.evaluate(frame) for block in blocks for fcurve in block.animation_data.action.fcurves]
+        return np.concatenate([matrices, np.array([value for row in rig.matrix_world for value in row], dtype=np.float32),
+                               np.array(values, dtype=np.float32)])
+
+    def analyze(self, jobs):
+        """Returns the (job, source job) pairs of the jobs whose frame is the same as the previous rendered one."""
+        startTimer  = time.perf_counter()
+        scene       = bpy.context.scene
+        rig         = bpy.data.objects[self.objectName]
+        blocks      = self.animatedBlocks(rig)
+        frames      = {}
+        for job in jobs:
+            frames.setdefault(job.animation, set()).add(job.frame)
+        # The source frame of every static frame by (animation, frame).
+        sources         = {}
+        originalAction  = rig.animation_data.action
+        originalFrame   = scene.frame_current
+        try:
+            for animation, animationFrames in frames.items():
+                rig.animation_data.action = bpy.data.actions[animation]
+                renderedState = None
+                for frame in sorted(animationFrames):
+                    state = self.state(rig, blocks, frame)
+                    if (renderedState is not None and float(np.abs(state - renderedState).max(initial=0.0)) <= self.tolerance):
+                        sources[(animation, frame)] = renderedFrame
+                    else:
+                        renderedState, renderedFrame = state, frame
+                self.framesTotal += len(animationFrames)
+        finally:
+            rig.animation_data.action = originalAction
+            scene.frame_set(originalFrame)
+        self.framesStatic = len(sources)
+
+        # Every sprite of a static frame is copied from the same sprite(animation, direction and layer) of its source.
+        jobKeys = {(job.animationKey, job.animation, job.positionKey, job.layer, job.layerKind, job.frame): job for job in jobs}
+        copies  = []
+        for job in jobs:
+            sourceFrame = sources.get((job.animation, job.frame))
+            if (sourceFrame is None):
+                continue
+            source = jobKeys.get((job.animationKey, job.animation, job.positionKey, job.layer, job.layerKind, sourceFrame))
+            if (source != None and len(source.filePaths()) == len(job.filePaths())):
+                copies.append((job, source))
+        self.analyzeTime = time.perf_counter() - startTimer
+        return copies
+
+    def copy(self, source:IEAS_RenderJob, job:IEAS_RenderJob):
+        """Copies the rendered files of the source job to the files of the job."""
+        for sourcePath, filePath in zip(source.filePaths(), job.filePaths()):
+            # Writes into a temporary file first, so a cancelled copy does not leave a half written sprite.
+            tempPath = filePath + ".tmp"
+            shutil.copyfile(sourcePath, tempPath)
+            os.replace(tempPath, filePath)
+
+    def timing(self):
+        """Returns the number of static frames and the time of the comparison."""
+        return f"{self.framesStatic} of {self.framesTotal} frames static(compared in {self.analyzeTime:.1f}s)"
+
 # --------
 # Purpose:
 # --------
 # Collection of methods for preparing animation types for rendering.
-# ------------------------------------------------------------------
+# The file names and folders are already part of the render jobs(see IEAS_RenderPlanCompiler),
+# so these methods only control the collection visibility and render.
+# ---------------------------------------------------------------------------------------------
 class IEAS_AnimationTypes():
     """Contains methods for handling different animation types before rendering"""
-    
+    # Name of the compositor node which receives the rendered pixels(see beginViewer).
+    viewerNodeName  = "IEAS Viewer"
+    # Name of the image data block which Blender fills with the pixels of the active Viewer node.
+    viewerImageName = "Viewer Node"
+
+    def __init__(self):
+        # The pixel buffers and image data blocks are reused for every frame of the render(see IEAS_PixelBridge and IEAS_ImagePool).
+        self.pixelBridge    = IEAS_PixelBridge()
+        self.imagePool      = IEAS_ImagePool()
+        # Folders which already contain the placeholder image of the quadrant types.
+        self.placeholders   = set()
+        # Renders all weapons of a frame at once if it is set(see IEAS_WeaponPass).
+        self.weaponPass     = None
+        # Composites the armor layers over the creature if it is set(see IEAS_ArmorLayers).
+        self.armorLayers    = None
+        # Renders several sprites with one render if it is set(see IEAS_DirectionGrid and IEAS_FrameGrid).
+        self.grid           = None
+        # Changes the visibility of the layer collections(see IEAS_VisibilityState).
+        self.visibility     = IEAS_VisibilityState()
+        # Splits the quadrant types by their divisor(see IEAS_GridSplitter) and saves only the quadrants if it is set.
+        self.splitters      = {}
+        self.tileExtent     = False
+        # Writes the sprites without image data blocks and write_still if it is set(see IEAS_PngEncoder),
+        # in worker threads if the post-processor is also set(see IEAS_PostProcessor).
+        self.pngEncoder     = None
+        self.postProcessor  = None
+        # Reasons why a faster way of rendering was given up during the render, which are shown in the timing summary.
+        self.fallbacks      = []
+        # The compositor state before beginViewer, None until it is stored.
+        self.originalViewer = None
+
+    def excludeCollections(self, typeParameters:IEAS_AnimationTypesParameters):
+        """Deactivates every collection and activates only the creature collection."""
+        # Checks the collection name in the scene collection
+        if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
+            # This is needed for the self.report error message in exception handling
+            raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
+
+        # Deactivates every collection found.
+        for collection in bpy.context.view_layer.layer_collection.children:
+            collection.exclude = True
+        # Activates only creature collection.
+        bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
+
+    def renderStill(self, filePath, mirrorPaths=()):
+        """Renders the current scene state as a still image into the given file and its mirrored files."""
+        if (self.pngEncoder != None):
+            # The Viewer pixels of the render are written by the encoder.
+            pixels = self.renderPixels()
+            self.saveRender(pixels, filePath, "Render")
+            for mirrorPath in mirrorPaths:
+                self.saveMirrored(pixels, mirrorPath)
+            return
+        # Sets the scene's render output file path. This tells Blender where to save the next rendered image.
+        bpy.context.scene.render.filepath = filePath
+        # This is the actual rendering process.
+        # `animation=False` renders a single still image.
+        # `write_still=True` saves the rendered image to the specified `filepath`.
+        # The first `False` argument disables undo support for the operation.
+        renderFrame = bpy.ops.render.render
+        renderFrame(  False,
+                      animation     =False,
+                      write_still   =True)
+        # The eastern sprites are the same render mirrored(see IEAS_RenderPlanCompiler.mirrorEastern).
+        for mirrorPath in mirrorPaths:
+            self.saveMirrored(self.pixelBridge.read(bpy.data.images[self.viewerImageName], "render"), mirrorPath)
+
+    def renderAnimation(self, typeParameters:IEAS_AnimationTypesParameters, tempFolder):
+        """Renders the creature jobs(same action and direction, evenly spaced frames) as one animation render."""
+        # An animation render keeps the render session(e.g. BVH, shaders and textures) from one frame to the next,
+        # while every still render starts a new one.
+        jobs    = typeParameters.jobs
+        scene   = bpy.context.scene
+        render  = scene.render
+        # Only the creature is visible, with its original 'holdout' state(same as a 'MAIN' job in renderLayers).
+        self.visibility.showOnly([])
+        self.visibility.restore(typeParameters.CreatureCollectionName, 'holdout')
+        self.visibility.restore(typeParameters.CreatureCollectionName, 'hide_render')
+        original = (scene.frame_start, scene.frame_end, scene.frame_step, render.filepath)
+        try:
+            scene.frame_start   = jobs[0].frame
+            scene.frame_end     = jobs[-1].frame
+            scene.frame_step    = (jobs[-1].frame - jobs[0].frame) // (len(jobs) - 1)
+            # Blender replaces '####' with the frame number and adds the file extension.
+            render.filepath     = os.path.join(tempFolder, "frame_####")
+            bpy.ops.render.render(False, animation=True, write_still=False)
+            framePaths = [render.frame_path(frame=job.frame) for job in jobs]
+        finally:
+            scene.frame_start, scene.frame_end, scene.frame_step, render.filepath = original
+        for job, framePath in zip(jobs, framePaths):
+            if not os.path.exists(framePath):
+                raise ValueError(f"Frame file '{framePath}' was not written by the animation render!")
+            # The file gets its sprite name with one rename, so a cancelled render never leaves a half written sprite.
+            os.replace(framePath, job.outputPaths[0])
+
+    def mirrorPixels(self, pixels):
+        """Returns the pixels mirrored horizontally in a reused buffer."""
+        height, width   = pixels.shape[:2]
+        mirrored        = self.pixelBridge.buffer(width, height, "mirror")
+        # Reverses the columns of every row, the rows stay in place.
+        np.copyto(mirrored, pixels[:, ::-1])
+        return mirrored
+
+    def saveMirrored(self, pixels, filePath):
+        """Saves the pixels mirrored horizontally like a render, with the scene's color management and output format."""
+        if (self.pngEncoder != None):
+            self.postProcess(IEAS_PngEncoder.saveMirrored, pixels, filePath)
+            return
+        self.saveRender(self.mirrorPixels(pixels), filePath, "Mirror")
+
+    def postProcess(self, function, pixels, *args):
+        """Runs function(encoder, pixels, *args) of IEAS_PngEncoder in a worker thread or right away without post-processor."""
+        if (self.postProcessor != None):
+            self.postProcessor.submit(function, pixels, *args)
+        else:
+            function(self.pngEncoder, pixels, *args)
+
+    def saveRender(self, pixels, filePath, imageName):
+        """Saves the pixels like a render(write_still), with the scene's color management and output format."""
+        if (self.pngEncoder != None):
+            self.postProcess(IEAS_PngEncoder.save, pixels, filePath)
+            return
+        height, width   = pixels.shape[:2]
+        # The Viewer pixels are linear float values like the render result, so the image needs a float buffer.
+        image           = self.imagePool.get(imageName, width, height, floatBuffer=True)
+        self.pixelBridge.write(image, pixels)
+        image.save_render(filePath, scene=bpy.context.scene)
+
+    def beginViewer(self):
+        """Adds a compositor Viewer node, so rendered pixels can be read without a temporary file."""
+        scene = bpy.context.scene
+        # Stores the compositor state to be restored by endViewer.
+        self.originalViewer = (scene.use_nodes, scene.render.use_compositing)
+        scene.use_nodes                 = True
+        scene.render.use_compositing    = True
+        nodes = scene.node_tree.nodes
+        viewer          = nodes.new('CompositorNodeViewer')
+        viewer.name     = self.viewerNodeName
+        # Older Blender versions ignore the alpha channel without this option.
+        if hasattr(viewer, 'use_alpha'):
+            viewer.use_alpha = True
+        # The Viewer node gets the same image as the Composite node, so the pixels match the saved renders.
+        scene.node_tree.links.new(self.compositeImageSocket(nodes), viewer.inputs['Image'])
+        # Blender writes only the pixels of the active Viewer node into the viewer image.
+        nodes.active    = viewer
+
+    @staticmethod
+    def compositeImageSocket(nodes):
+        """Returns the compositor socket whose image is saved by a render(the input of the Composite node)."""
+        composite       = next((node for node in nodes if node.type == 'COMPOSITE'), None)
+        if (composite != None and composite.inputs['Image'].is_linked):
+            return composite.inputs['Image'].links[0].from_socket
+        renderLayers    = next((node for node in nodes if node.type == 'R_LAYERS'), None)
+        if (renderLayers is None):
+            renderLayers = nodes.new('CompositorNodeRLayers')
+        return renderLayers.outputs['Image']
+
+    def endViewer(self):
+        """Removes the compositor Viewer node and restores the compositor state."""
+        scene = bpy.context.scene
+        viewer = scene.node_tree.nodes.get(self.viewerNodeName) if (scene.node_tree != None) else None
+        if (viewer != None):
+            scene.node_tree.nodes.remove(viewer)
+        if (self.originalViewer != None):
+            scene.use_nodes, scene.render.use_compositing = self.originalViewer
+            self.originalViewer = None
+
+    def renderPixels(self):
+        """Renders the current scene state and returns its pixels(rows, columns, RGBA) without saving a file."""
+        bpy.ops.render.render(False, animation=False, write_still=False)
+        # Reads all pixels at once into a reused float32 buffer(height, width, channels).
+        return self.pixelBridge.read(bpy.data.images[self.viewerImageName], "render")
+
+    def renderLayers(self, typeParameters:IEAS_AnimationTypesParameters):
+        """Renders all layer jobs(creature, lower part, weapons and armor) of one frame."""
+        # The visibility is only changed where it differs from the previous render(see IEAS_VisibilityState).
+        visibility  = self.visibility
+        creature    = typeParameters.CreatureCollectionName
+        # True if all weapons of the frame were rendered at once(see IEAS_WeaponPass).
+        weaponsRendered = False
+        weaponJobs      = [job for job in typeParameters.jobs if job.layerKind == 'WEAPON']
+        # Mirrored weapon files are saved from the Viewer pixels, which the weapon pass does not provide.
+        mirrorWeapons   = any(len(job.mirrorPaths) > 0 for job in weaponJobs)
+        if (self.weaponPass != None and self.weaponPass.failed is None and len(weaponJobs) > 1 and mirrorWeapons == False):
+            # Activates 'holdout' (invisibility for rendering) specifically for the creature collection.
+            # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
+            visibility.set(creature, 'holdout', True)
+            weaponsRendered = self.weaponPass.render(weaponJobs, visibility)
+            if (self.weaponPass.failed != None):
+                self.fallbacks.append(self.weaponPass.failed)
+        # Pixels of the creature layer for compositing the armor layers(see IEAS_ArmorLayers).
+        creatureLayer   = None
+        useArmorLayers  = self.armorLayers != None and any(job.layerKind == 'ARMOR' for job in typeParameters.jobs)
+
+        for job in typeParameters.jobs:
+            if (job.layerKind == 'MAIN'):
+                # Only the creature is visible, with its original 'holdout' state.
+                visibility.showOnly([])
+                visibility.restore(creature, 'holdout')
+                visibility.restore(creature, 'hide_render')
+                if (useArmorLayers == True):
+                    # The creature render is saved and kept for compositing the armor layers.
+                    creatureLayer = self.armorLayers.renderLayer("creature", job.outputPaths[0])
+                    for mirrorPath in job.mirrorPaths:
+                        self.saveMirrored(creatureLayer, mirrorPath)
+                else:
+                    self.renderStill(job.outputPaths[0], job.mirrorPaths)
+
+            elif (job.layerKind == 'UPPER'):
+                # Makes the main/upper creature collection visible for rendering.
+                visibility.set(creature, 'hide_render', False)
+                # Ensures the Lower Part collection remains invisible.
+                visibility.showOnly([])
+                self.renderStill(job.outputPaths[0], job.mirrorPaths)
+
+            elif (job.layerKind == 'LOWER'):
+                # Hides the main/upper creature collection (makes it invisible for the next render).
+                visibility.set(creature, 'hide_render', True)
+                # Makes only the Lower Part collection visible.
+                visibility.showOnly([job.layer])
+                self.renderStill(job.outputPaths[0], job.mirrorPaths)
+
+            elif (job.layerKind == 'WEAPON'):
+                if (weaponsRendered == True):
+                    continue
+                # Activates 'holdout' (invisibility for rendering) specifically for the creature collection.
+                # This ensures only weapon sprites are rendered when collections are toggled.
+                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
+                visibility.set(creature, 'holdout', True)
+                # Only one weapon collection is visible at any given time, all other weapon collections remain invisible.
+                visibility.showOnly([job.layer])
+                self.renderStill(job.outputPaths[0], job.mirrorPaths)
+
+            elif (job.layerKind == 'ARMOR' and useArmorLayers == True):
+                visibility.restore(creature, 'holdout')
+                visibility.restore(creature, 'hide_render')
+                # The creature layer is needed even if its own sprites(ARMOR1) are not rendered.
+                if (creatureLayer is None):
+                    visibility.showOnly([])
+                    creatureLayer = self.armorLayers.renderLayer("creature")
+                # The creature is not shaded but cuts out the armor behind it, so no depth is needed for compositing.
+                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
+                visibility.set(creature, 'holdout', True)
+                visibility.showOnly([job.layer])
+                armorLayer = self.armorLayers.renderLayer("armor")
+                composite  = self.armorLayers.composite(creatureLayer, armorLayer)
+                self.armorLayers.saveComposite(composite, job.outputPaths[0])
+                for mirrorPath in job.mirrorPaths:
+                    self.saveMirrored(composite, mirrorPath)
+
+            elif (job.layerKind == 'ARMOR'):
+                visibility.restore(creature, 'holdout')
+                visibility.restore(creature, 'hide_render')
+                # Only one armor collection is visible at any given time for subsequent renders.
+                visibility.showOnly([job.layer])
+                self.renderStill(job.outputPaths[0], job.mirrorPaths)
+
+    def renderGrid(self, typeParameters:IEAS_AnimationTypesParameters):
+        """Renders the creature jobs with one render(see IEAS_TileGrid) and returns False if the tiles affect each other,
+        the reason is shown in the timing(see fallbacks)."""
+        jobs = typeParameters.jobs
+        # Only the creature is visible, with its original 'holdout' state(same as a 'MAIN' job in renderLayers).
+        self.visibility.showOnly([])
+        self.visibility.restore(typeParameters.CreatureCollectionName, 'holdout')
+        self.visibility.restore(typeParameters.CreatureCollectionName, 'hide_render')
+        pixels, tiles = self.grid.render(jobs)
+
+        # Something in the gaps between the tiles reached out of its tile, e.g. a glow or a shadow.
+        bleeding = self.grid.tileGrid.bleeding(pixels)
+        if (bleeding != None):
+            self.fallbacks.append(f"sprites rendered one by one(the grid tiles bleed into each other with alpha {bleeding:.3f})")
+            return False
+        # Shadows or light which fall onto another tile are found by comparing the first grid with single renders.
+        # The first tile shows the creature itself and the last one the farthest copy, which is enough as a sample.
+        if (self.grid.verified == False):
+            objectCurrent   = bpy.data.objects[self.grid.objectName]
+            difference      = 0.0
+            # The index '2' corresponds to the Z-axis in Blender's rotation_euler tuple.
+            for job, tile in [(jobs[0], tiles[0]), (jobs[-1], tiles[-1])]:
+                bpy.context.scene.frame_current     = job.frame
+                objectCurrent.rotation_euler[2]     = math.radians(job.angle)
+                difference = max(difference, float(np.abs(self.renderPixels() - tile).max()))
+            bpy.context.scene.frame_current         = jobs[0].frame
+            objectCurrent.rotation_euler[2]         = math.radians(jobs[0].angle)
+            if (difference > self.grid.tileGrid.verifyTolerance):
+                self.fallbacks.append(f"sprites rendered one by one(the grid tiles differ from single renders by {difference:.3f})")
+                return False
+            self.grid.verified = True
+
+        for job, tile in zip(jobs, tiles):
+            self.saveRender(tile, job.outputPaths[0], "Tile")
+            for mirrorPath in job.mirrorPaths:
+                self.saveMirrored(tile, mirrorPath)
+        return True
+
+    def renderQuadrants(self, typeParameters:IEAS_AnimationTypesParameters, divisor, imageName, placeholder=False):
+        """Renders a frame and splits it into divisor x divisor quadrant sprites."""
+        for job in typeParameters.jobs:
+            # The pixels are taken from the compositor Viewer node(see beginViewer) instead of a temporary file.
+            arrPixelsReshaped   = self.renderPixels()
+            height, width       = arrPixelsReshaped.shape[:2]
+
+            # The placeholder is the same for every frame, so it is saved once per folder.
+            if (placeholder == True and job.folder not in self.placeholders):
+                # Creates a path for a transparent pixel that serves as a placeholder for the unused cycles in the BAM file.
+                placeholder_path    = os.path.join(job.folder, "placeholder.png")
+                placeholderImage    = self.imagePool.get(imageName + "Placeholder", 1, 1)
+                placeholderImage.pixels = [0,0,0,0]  # One transparent pixel (RGBA)
+                # Set the new image's file path and format.
+                placeholderImage.filepath_raw   = placeholder_path
+                placeholderImage.file_format    = 'PNG'
+                # Save the new image data block to a file.
+                placeholderImage.save()
+                self.placeholders.add(job.folder)
+
+            # Processes the pixels for each quadrant and writes them as an image to a specific location.
+            if (self.pngEncoder != None):
+                self.postProcess(IEAS_PngEncoder.saveTiles, arrPixelsReshaped, divisor, divisor, self.tileExtent,
+                                 job.outputPaths, job.mirrorPaths)
+                continue
+            splitter = self.splitters.setdefault(divisor, IEAS_GridSplitter(divisor, divisor, self.pixelBridge))
+            self.saveQuadrants(arrPixelsReshaped, splitter, job.outputPaths, imageName)
+            # The mirrored render is split the same way, e.g. its top left quadrant is the eastern Q1.
+            if (len(job.mirrorPaths) > 0):
+                self.saveQuadrants(self.mirrorPixels(arrPixelsReshaped), splitter, job.mirrorPaths, imageName)
+
+    def saveQuadrants(self, arrPixelsReshaped, splitter:IEAS_GridSplitter, filePaths, imageName):
+        """Saves each quadrant of the pixels as an image of the full size or of the quadrant(see tileExtent) into its file."""
+        # Each quadrant in its own size or on an otherwise transparent image of the full size.
+        quadrants = splitter.split(arrPixelsReshaped, self.tileExtent)
+        for quadrantPixels, quadrantFile_path in zip(quadrants, filePaths):
+            self.saveRender(quadrantPixels, quadrantFile_path, imageName)
+
     def type0000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 0000 type logic."""
         # ----- Controls the 'exclude' and 'hide_render' visibility of collections -----
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type0000: Executing 'exclude' logic for 0000 type.")
-            print("typeParameters.CreatureCollectionName:",typeParameters.CreatureCollectionName)
+            self.excludeCollections(typeParameters)
         else:
-            # Makes the main collection visible for rendering.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render  = False
-            # Ensures the Lower Part collection remains excluded (invisible) on the View Layer.
-            if (typeParameters.CreatureCollectionNameLP in bpy.context.view_layer.layer_collection.children):
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionNameLP].exclude = True            
-            
-            # Constructs the filename for the current sprite, including prefix,resref and padded frame number.
-            fileName = f"{typeParameters.prefixResref}_MAIN_{str(typeParameters.frame).zfill(5)}.png"                    
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                          
-            # ----- Setup for SECOND RENDER PASS: Lower Collection Part -----
-            if (typeParameters.CreatureCollectionNameLP in bpy.context.view_layer.layer_collection.children):
-                # Constructs the output folder path for lower part.
-                lowerpart_folder            = os.path.join(typeParameters.pathSaveAt, typeParameters.CreatureCollectionNameLP)
-                # Creates a subfolder for the specific animation and position angle.
-                lowerpart_position_folder   = os.path.join(lowerpart_folder, typeParameters.positionKey)
-                if not os.path.exists(lowerpart_position_folder):
-                    os.makedirs(lowerpart_position_folder)
-                    
-                # Hides the main collection (makes it invisible for the next render).
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render = True             
-                # Un-excludes the Lower Part collection, making its LayerCollection enabled
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionNameLP].exclude = False
-                # Constructs the filename for the current sprite, including prefix,resref and padded frame number.
-                fileName = f"{typeParameters.prefixResref}_LOWER_{str(typeParameters.frame).zfill(5)}.png"
-                
-                # Sets Blender's render output filepath for the current lower-part image.
-                bpy.context.scene.render.filepath = os.path.join(lowerpart_position_folder, fileName)
-                # This is the actual rendering process.
-                # `animation=False` renders a single still image.
-                # `write_still=True` saves the rendered image to the specified `filepath`.
-                # The first `False` argument disables undo support for the operation.
-                renderFrame = bpy.ops.render.render
-                renderFrame(  False,
-                              animation     =False,
-                              write_still   =True)
-                              
-                # Restores the render visibility of the main/upper creature collection (visible for subsequent calls).
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render  = False
-                          
+            self.renderLayers(typeParameters)
+
     def type1000_monster_quadrant(self, typeParameters:IEAS_AnimationTypesParameters):
         """Handles the logic for rendering and processing monster quadrants of type 1000."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'WK':'G1', 
-                'SD':'G2', 'SC':'G2', 'GH':'G2', 'DE':'G2', 'TW':'G2',
-                'A1':'G3', 'A2':'G3', 'A3':'G3',
-            }
-            animationKey    = sequences[typeParameters.animationKey]    # Gets e.g. G1.
-            width           = bpy.context.scene.render.resolution_x
-            height          = bpy.context.scene.render.resolution_y
-            fileName        = "temp.png"
-            # Used to identify which quadrant has which coordinates for slicing.
             # Since the image is divided into four parts, a divisor of 2 is required.
-            quadrants = {
-                'Q1': (slice(height//2, height), slice(0, width//2)),   'Q2': (slice(height//2, height), slice(width//2, width)),
-                'Q3': (slice(0, height//2), slice(0, width//2)),        'Q4': (slice(0, height//2), slice(width//2, width)),
-            }
-            quadrantsNumbers = {
-                'Q1': "1", 'Q2': "2",
-                'Q3': "3", 'Q4': "4"
-            }                                        
-            # This tells Blender where to save the next (temporary) rendered image.
-            temp_folder = os.path.join(typeParameters.position_folder, "temp")
-            if not os.path.exists(temp_folder):
-                os.makedirs(temp_folder)
-            # This tells Blender where to save the next (temporary) rendered image.                    
-            bpy.context.scene.render.filepath = os.path.join(temp_folder, fileName)                 
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-            # Loads the rendered image from disk and retrieves its pixel data.      
-            renderedImage       = bpy.data.images.load(bpy.context.scene.render.filepath)                       
-            pixels              = renderedImage.pixels
-            arrPixels           = np.array(pixels)# (flat array)  
-            channels            = 4
-            # Reshapes the 1D pixel array into a 3D array (height, width, channels).
-            arrPixelsReshaped   = np.reshape(arrPixels, (height, width, channels))
-            arrPixelsFlipped    = arrPixelsReshaped
-            
-            # Processes the pixels for each quadrant and writes them as an image to a specific location.
-            for quadrant, coordinate in quadrants.items():                                                          
-                # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-                if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                    fileNameQuadrant = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}{quadrantsNumbers[quadrant]}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                else:
-                    fileNameQuadrant = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}{quadrantsNumbers[quadrant]}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                
-                # Zeroes out the pixels of all quadrants except the current one.
-                # This clever approach avoids the need for if-statements to handle each quadrant's logic separately.
-                quadrant_path = os.path.join(typeParameters.position_folder, f"{quadrant}")
-                if not os.path.exists(quadrant_path):
-                    os.makedirs(quadrant_path)
-                    
-                quadrantFile_path       = os.path.join(quadrant_path, fileNameQuadrant)
-                # Prevents referencing the original values of the variables
-                tempQuadrants           = quadrants.copy()
-                tempArrPixelsReshaped   = arrPixelsReshaped.copy()
-                # Deletes the current quadrant coordinate, so the remaining quadrants values can be set(Benefit: No if statements needed).
-                del tempQuadrants[quadrant]
-                for remainingCoordinate in tempQuadrants.values():
-                    tempArrPixelsReshaped[remainingCoordinate] = 0 # Transparent
-                    
-                # Flattens the array so it can be stored into a blender image data block.
-                arrPixelsFlatten = np.reshape(tempArrPixelsReshaped,arrPixels.shape)               
-                # Creates a new Blender image data block.
-                quadrantImage = bpy.data.images.new(
-                    name="QuadrantType1000MQ",
-                    width=width,
-                    height=height,
-                    alpha=True,
-                )               
-                # Assign the manipulated NumPy array's pixel data to the new Blender image.
-                quadrantImage.pixels = arrPixelsFlatten             
-                # Set the new image's file path and format.
-                quadrantImage.filepath_raw = quadrantFile_path
-                quadrantImage.file_format = 'PNG'
-                # Save the new image data block to a file.
-                quadrantImage.save()
-                
-            # Deletes the temporary folder.
-            shutil.rmtree(temp_folder)
-            
+            self.renderQuadrants(typeParameters, 2, "QuadrantType1000MQ")
+
     def type1000_monster_multi_sp0(self, typeParameters:IEAS_AnimationTypesParameters):
         """Handles the logic for rendering and processing monster multi of type 1000(split_bams = 0)."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'WK':'G1',
-                'SD':'G2', 'SC':'G2', 'SP':'G2',
-                'A1':'G3', 'A2':'G3', 'A3':'G3',
-                'GH':'G4', 'DE':'G4', 'SL':'G4', 'GU':'G4', 'DE':'G4', 'TW':'G4',
-                'SP':'G5', 'CA':'G5',
-            }
-            animationKey    = sequences[typeParameters.animationKey]    # Gets e.g. G1.
-            width           = bpy.context.scene.render.resolution_x
-            height          = bpy.context.scene.render.resolution_y
-            fileName        = "temp.png"
-            # Used to identify which quadrant has which coordinates for slicing.
             # Since the image is divided into four parts, a divisor of 2 is required.
-            quadrants = {
-                'Q1': (slice(height//2, height), slice(0, width//2)),   'Q2': (slice(height//2, height), slice(width//2, width)),
-                'Q3': (slice(0, height//2), slice(0, width//2)),        'Q4': (slice(0, height//2), slice(width//2, width)),
-            }
-            quadrantsNumbers = {
-                'Q1': "1", 'Q2': "2",
-                'Q3': "3", 'Q4': "4"
-            }
-            # This tells Blender where to save the next (temporary) rendered image.
-            temp_folder = os.path.join(typeParameters.position_folder, "temp")
-            if not os.path.exists(temp_folder):
-                os.makedirs(temp_folder)
-            # This tells Blender where to save the next (temporary) rendered image.                    
-            bpy.context.scene.render.filepath = os.path.join(temp_folder, fileName)                 
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-            # Loads the rendered image from disk and retrieves its pixel data.      
-            renderedImage       = bpy.data.images.load(bpy.context.scene.render.filepath)                       
-            pixels              = renderedImage.pixels
-            arrPixels           = np.array(pixels)# (flat array)  
-            channels            = 4
-            # Reshapes the 1D pixel array into a 3D array (height, width, channels).
-            arrPixelsReshaped   = np.reshape(arrPixels, (height, width, channels))
-            arrPixelsFlipped    = arrPixelsReshaped
-                        
-            # Processes the pixels for each quadrant and writes them as an image to a specific location.
-            for quadrant, coordinate in quadrants.items():                                                          
-                # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-                fileNameQuadrant = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}{quadrantsNumbers[quadrant]}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                
-                # Zeroes out the pixels of all quadrants except the current one.
-                # This clever approach avoids the need for if-statements to handle each quadrant's logic separately.
-                quadrant_path = os.path.join(typeParameters.position_folder, f"{quadrant}")
-                if not os.path.exists(quadrant_path):
-                    os.makedirs(quadrant_path)
-                    
-                quadrantFile_path       = os.path.join(quadrant_path, fileNameQuadrant)
-                # Prevents referencing the original values of the variables
-                tempQuadrants           = quadrants.copy()
-                tempArrPixelsReshaped   = arrPixelsReshaped.copy()
-                # Deletes the current quadrant coordinate, so the remaining quadrants values can be set(Benefit: No if statements needed).
-                del tempQuadrants[quadrant]
-                for remainingCoordinate in tempQuadrants.values():
-                    tempArrPixelsReshaped[remainingCoordinate] = 0 # Transparent
-                    
-                # Flattens the array so it can be stored into a blender image data block.
-                arrPixelsFlatten = np.reshape(tempArrPixelsReshaped,arrPixels.shape)               
-                # Creates a new Blender image data block.
-                quadrantImage = bpy.data.images.new(
-                    name="QuadrantType1000MMsp0",
-                    width=width,
-                    height=height,
-                    alpha=True,
-                )               
-                # Assign the manipulated NumPy array's pixel data to the new Blender image.
-                quadrantImage.pixels = arrPixelsFlatten
-                # Set the new image's file path and format.
-                quadrantImage.filepath_raw = quadrantFile_path
-                quadrantImage.file_format = 'PNG'
-                # Save the new image data block to a file.
-                quadrantImage.save()
-                
-            # Deletes the temporary folder.
-            shutil.rmtree(temp_folder)
-    
+            self.renderQuadrants(typeParameters, 2, "QuadrantType1000MMsp0")
+
     def type1000_monster_multi_sp1(self, typeParameters:IEAS_AnimationTypesParameters):
         """Handles the logic for rendering and processing monster multi of type 1000(split_bams = 1)."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'WK':'G1',
-                'SD':'G2', 'SC':'G2', 'SP':'G2',
-                'A1':'G3', 'A2':'G3', 'A3':'G3',
-                'GH':'G4', 'DE':'G4', 'SL':'G4', 'GU':'G4', 'DE':'G4', 'TW':'G4',
-                'SP':'G5', 'CA':'G5',
-            }
-            animationKey    = sequences[typeParameters.animationKey]    # Gets e.g. G1.
-            width           = bpy.context.scene.render.resolution_x
-            height          = bpy.context.scene.render.resolution_y
-            fileName        = "temp.png"
-            # Used to identify which quadrant has which coordinates for slicing.
             # Since the image is divided into nine parts, a divisor of 3 is required.
-            rowsA       = slice((2*height)//3, height)
-            rowsC       = slice(0, height//3)
-            rowsB       = slice(height//3, (2*height)//3)
-            columnsA    = slice(0, width//3)
-            columnsB    = slice(width//3, (2*width)//3)
-            columnsC    = slice((2*width)//3, width)
-            quadrants = {
-                'Q1': (rowsA, columnsA), 'Q2': (rowsA, columnsB), 'Q3': (rowsA, columnsC),
-                'Q4': (rowsB, columnsA), 'Q5': (rowsB, columnsB), 'Q6': (rowsB, columnsC),
-                'Q7': (rowsC, columnsA), 'Q8': (rowsC, columnsB), 'Q9': (rowsC, columnsC),
-            }
-            quadrantsNumbers = {
-                'Q1': "1", 'Q2': "2",'Q3': "3",
-                'Q4': "4", 'Q5': "5",'Q6': "6",
-                'Q7': "7", 'Q8': "8",'Q9': "9",
-            }
-            directions = {
-            'south':        "00", 'south_south_west': "01",
-            'south_west':   "02", 'west_south_west':  "03",
-            'west':         "04", 'west_north_west':  "05",
-            'north_west':   "06", 'north_north_west': "07",
-            'north':        "08",
-            }
-            
-            # --- Debugging: TODO - Delete all following prints
-#            print(f"rowsA: {rowsA.start} to {rowsA.stop}")
-#            print(f"rowsB: {rowsB.start} to {rowsB.stop}")
-#            print(f"rowsC: {rowsC.start} to {rowsC.stop}")
-#            print(f"columnsA: {columnsA.start} to {columnsA.stop}")
-#            print(f"columnsB: {columnsB.start} to {columnsB.stop}")
-#            print(f"columnsC: {columnsC.start} to {columnsC.stop}")
-            
-            # This tells Blender where to save the next (temporary) rendered image.
-            temp_folder = os.path.join(typeParameters.position_folder, "temp")
-            if not os.path.exists(temp_folder):
-                os.makedirs(temp_folder)
-            # This tells Blender where to save the next (temporary) rendered image.                    
-            bpy.context.scene.render.filepath = os.path.join(temp_folder, fileName)                 
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-            # Loads the rendered image from disk and retrieves its pixel data.      
-            renderedImage       = bpy.data.images.load(bpy.context.scene.render.filepath)                       
-            pixels              = renderedImage.pixels
-            arrPixels           = np.array(pixels)# (flat array)  
-            channels            = 4
-            # Reshapes the 1D pixel array into a 3D array (height, width, channels).
-            arrPixelsReshaped   = np.reshape(arrPixels, (height, width, channels))
-            arrPixelsFlipped    = arrPixelsReshaped          
-            # Creates a path for a transparent pixel that serves as a placeholder for the unused cycles in the BAM file.
-            placeholder_path    = os.path.join(typeParameters.position_folder, "placeholder.png")              
-            # Creates a new Blender image data block.        
-            placeholderImage = bpy.data.images.new(
-                    name    = "QuadrantType1000MMsp1Placeholder",
-                    width   = 1,
-                    height  = 1,
-                    alpha   = True,
-            )
-            placeholderImage.pixels = [0,0,0,0]  # One transparent pixel (RGBA)             
-            # Set the new image's file path and format.
-            placeholderImage.filepath_raw   = placeholder_path
-            placeholderImage.file_format    = 'PNG'
-            # Save the new image data block to a file.
-            placeholderImage.save()
-                    
-            # Processes the pixels for each quadrant and writes them as an image to a specific location.
-            for quadrant, coordinate in quadrants.items():                                                          
-                # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-                fileNameQuadrant = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}{quadrantsNumbers[quadrant]}{directions[typeParameters.positionKey]}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                
-                # Zeroes out the pixels of all quadrants except the current one.
-                # This clever approach avoids the need for if-statements to handle each quadrant's logic separately.
-                quadrant_path = os.path.join(typeParameters.position_folder, f"{quadrant}")
-                if not os.path.exists(quadrant_path):
-                    os.makedirs(quadrant_path)
-                    
-                quadrantFile_path       = os.path.join(quadrant_path, fileNameQuadrant)
-                # Prevents referencing the original values of the variables
-                tempQuadrants           = quadrants.copy()
-                tempArrPixelsReshaped   = arrPixelsReshaped.copy()
-                # Deletes the current quadrant coordinate, so the remaining quadrants values can be set(Benefit: No if statements needed).
-                del tempQuadrants[quadrant]
-                for remainingCoordinate in tempQuadrants.values():
-                    tempArrPixelsReshaped[remainingCoordinate] = 0 # Transparent
-                    
-                # Flattens the array so it can be stored into a blender image data block.
-                arrPixelsFlatten = np.reshape(tempArrPixelsReshaped,arrPixels.shape)               
-                # Creates a new Blender image data block.
-                quadrantImage = bpy.data.images.new(
-                    name    = "QuadrantType1000MMsp1",
-                    width   = width,
-                    height  = height,
-                    alpha   = True,
-                )               
-                # Assign the manipulated NumPy array's pixel data to the new Blender image.
-                quadrantImage.pixels = arrPixelsFlatten
-                # Set the new image's file path and format.
-                quadrantImage.filepath_raw  = quadrantFile_path
-                quadrantImage.file_format   = 'PNG'
-                # Save the new image data block to a file.
-                quadrantImage.save()
-                
-            # Deletes the temporary folder.
-            shutil.rmtree(temp_folder)
-            
+            self.renderQuadrants(typeParameters, 3, "QuadrantType1000MMsp1", placeholder=True)
+
     def type1000_multi_new_sp0(self, typeParameters:IEAS_AnimationTypesParameters):
         """Handles the logic for rendering and processing multi new of type 1000(split_bams = 0)."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
-                'A1':'G2', 'A2':'G2', 'A3':'G2', 'A4':'G2', 'A5':'G2', 'SP':'G2', 'CA':'G2',
-            }
-            animationKey    = sequences[typeParameters.animationKey]    # Gets e.g. G1.
-            width           = bpy.context.scene.render.resolution_x
-            height          = bpy.context.scene.render.resolution_y
-            fileName        = "temp.png"
-            # Used to identify which quadrant has which coordinates for slicing.
             # Since the image is divided into four parts, a divisor of 2 is required.
-            quadrants = {
-                'Q1': (slice(height//2, height), slice(0, width//2)),   'Q2': (slice(height//2, height), slice(width//2, width)),
-                'Q3': (slice(0, height//2), slice(0, width//2)),        'Q4': (slice(0, height//2), slice(width//2, width)),
-            }
-            quadrantsNumbers = {
-                'Q1': "1", 'Q2': "2",
-                'Q3': "3", 'Q4': "4"
-            }
-            # This tells Blender where to save the next (temporary) rendered image.
-            temp_folder = os.path.join(typeParameters.position_folder, "temp")
-            if not os.path.exists(temp_folder):
-                os.makedirs(temp_folder)
-            # This tells Blender where to save the next (temporary) rendered image.                    
-            bpy.context.scene.render.filepath = os.path.join(temp_folder, fileName)                 
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     = False,
-                          write_still   = True)
-            # Loads the rendered image from disk and retrieves its pixel data.      
-            renderedImage       = bpy.data.images.load(bpy.context.scene.render.filepath)                       
-            pixels              = renderedImage.pixels
-            arrPixels           = np.array(pixels)# (flat array)  
-            channels            = 4
-            # Reshapes the 1D pixel array into a 3D array (height, width, channels).
-            arrPixelsReshaped   = np.reshape(arrPixels, (height, width, channels))
-            arrPixelsFlipped    = arrPixelsReshaped
-            
-            # Processes the pixels for each quadrant and writes them as an image to a specific location.
-            for quadrant, coordinate in quadrants.items():                                                          
-                # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-                fileNameQuadrant = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}{quadrantsNumbers[quadrant]}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                
-                # Zeroes out the pixels of all quadrants except the current one.
-                # This clever approach avoids the need for if-statements to handle each quadrant's logic separately.
-                quadrant_path = os.path.join(typeParameters.position_folder, f"{quadrant}")
-                if not os.path.exists(quadrant_path):
-                    os.makedirs(quadrant_path)
-                    
-                quadrantFile_path       = os.path.join(quadrant_path, fileNameQuadrant)
-                # Prevents referencing the original values of the variables
-                tempQuadrants           = quadrants.copy()
-                tempArrPixelsReshaped   = arrPixelsReshaped.copy()
-                # Deletes the current quadrant coordinate, so the remaining quadrants values can be set(Benefit: No if statements needed).
-                del tempQuadrants[quadrant]
-                for remainingCoordinate in tempQuadrants.values():
-                    tempArrPixelsReshaped[remainingCoordinate] = 0 # Transparent
-                    
-                # Flattens the array so it can be stored into a blender image data block.
-                arrPixelsFlatten = np.reshape(tempArrPixelsReshaped,arrPixels.shape)               
-                # Creates a new Blender image data block.
-                quadrantImage = bpy.data.images.new(
-                    name    = "QuadrantType1000MNsp0",
-                    width   = width,
-                    height  = height,
-                    alpha   = True,
-                )               
-                # Assign the manipulated NumPy array's pixel data to the new Blender image.
-                quadrantImage.pixels        = arrPixelsFlatten
-                # Set the new image's file path and format.
-                quadrantImage.filepath_raw  = quadrantFile_path
-                quadrantImage.file_format   = 'PNG'
-                # Save the new image data block to a file.
-                quadrantImage.save()
-                
-            # Deletes the temporary folder.
-            shutil.rmtree(temp_folder)
-         
+            self.renderQuadrants(typeParameters, 2, "QuadrantType1000MNsp0")
+
     def type1000_multi_new_sp1(self, typeParameters:IEAS_AnimationTypesParameters):
         """Handles the logic for rendering and processing multi new of type 1000(split_bams = 1)."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
-                'A1':'G2', 'A2':'G2', 'A3':'G2', 'A4':'G2', 'A5':'G2', 'SP':'G2', 'CA':'G2',
-            }
-            animationKey    = sequences[typeParameters.animationKey]    # Gets e.g. G1.
-            width           = bpy.context.scene.render.resolution_x
-            height          = bpy.context.scene.render.resolution_y
-            fileName        = "temp.png"
-            # Used to identify which quadrant has which coordinates for slicing.
             # Since the image is divided into four parts, a divisor of 2 is required.
-            quadrants = {
-                'Q1': (slice(height//2, height), slice(0, width//2)),   'Q2': (slice(height//2, height), slice(width//2, width)),
-                'Q3': (slice(0, height//2), slice(0, width//2)),        'Q4': (slice(0, height//2), slice(width//2, width)),
-            }
-            quadrantsNumbers = {
-                'Q1': "1", 'Q2': "2",
-                'Q3': "3", 'Q4': "4"
-            }
-            # This tells Blender where to save the next (temporary) rendered image.
-            temp_folder = os.path.join(typeParameters.position_folder, "temp")
-            if not os.path.exists(temp_folder):
-                os.makedirs(temp_folder)
-            # This tells Blender where to save the next (temporary) rendered image.                    
-            bpy.context.scene.render.filepath = os.path.join(temp_folder, fileName)                 
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     = False,
-                          write_still   = True)
-            # Loads the rendered image from disk and retrieves its pixel data.      
-            renderedImage       = bpy.data.images.load(bpy.context.scene.render.filepath)                       
-            pixels              = renderedImage.pixels
-            arrPixels           = np.array(pixels)# (flat array)  
-            channels            = 4
-            # Reshapes the 1D pixel array into a 3D array (height, width, channels).
-            arrPixelsReshaped   = np.reshape(arrPixels, (height, width, channels))
-            arrPixelsFlipped    = arrPixelsReshaped
-            
-            # Processes the pixels for each quadrant and writes them as an image to a specific location.
-            for quadrant, coordinate in quadrants.items():                                                          
-                # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-                fileNameQuadrant = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}{quadrantsNumbers[quadrant]}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                
-                # Zeroes out the pixels of all quadrants except the current one.
-                # This clever approach avoids the need for if-statements to handle each quadrant's logic separately.
-                quadrant_path = os.path.join(typeParameters.position_folder, f"{quadrant}")
-                if not os.path.exists(quadrant_path):
-                    os.makedirs(quadrant_path)
-                    
-                quadrantFile_path       = os.path.join(quadrant_path, fileNameQuadrant)
-                # Prevents referencing the original values of the variables
-                tempQuadrants           = quadrants.copy()
-                tempArrPixelsReshaped   = arrPixelsReshaped.copy()
-                # Deletes the current quadrant coordinate, so the remaining quadrants values can be set(Benefit: No if statements needed).
-                del tempQuadrants[quadrant]
-                for remainingCoordinate in tempQuadrants.values():
-                    tempArrPixelsReshaped[remainingCoordinate] = 0 # Transparent
-                    
-                # Flattens the array so it can be stored into a blender image data block.
-                arrPixelsFlatten = np.reshape(tempArrPixelsReshaped,arrPixels.shape)               
-                # Creates a new Blender image data block.
-                quadrantImage = bpy.data.images.new(
-                    name    = "QuadrantType1000MNsp1",
-                    width   = width,
-                    height  = height,
-                    alpha   = True,
-                )               
-                # Assign the manipulated NumPy array's pixel data to the new Blender image.
-                quadrantImage.pixels        = arrPixelsFlatten
-                # Set the new image's file path and format.
-                quadrantImage.filepath_raw  = quadrantFile_path
-                quadrantImage.file_format   = 'PNG'
-                # Save the new image data block to a file.
-                quadrantImage.save()
-                
-            # Deletes the temporary folder.
-            shutil.rmtree(temp_folder)
-            
+            self.renderQuadrants(typeParameters, 2, "QuadrantType1000MNsp1")
+
     def type2000(self, typeParameters:IEAS_AnimationTypesParameters):
-        """Method for handling 2000 type logic."""    
-        # ----- Deactivates/Activates collections      
+        """Method for handling 2000 type logic."""
+        # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type2000: Executing 'exclude' logic for 2000 type.")
+            self.excludeCollections(typeParameters)
         else:
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
-                'A1':'G2', 'A2':'G2', 'A3':'G2', 'SP':'G2', 'CA':'G2',
-            }
-            animationKey    = sequences[typeParameters.animationKey]    # Gets e.g. G1.
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                          
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)            
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                       
-            # TODO:Delete!
-            print("type2000: Executing complex logic for 2000 type.")
-            # Stores the initial 'holdout' state of the creature collection before modification.
-            # 'holdout' makes objects within the collection invisible during rendering without excluding them from the view layer. 
-            holdout = bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout
-            
-            # ----- Debugging
-            # TODO: Delete print
-            print("holdout:",holdout)
-                                            
-            # Activates 'holdout' (invisibility for rendering) specifically for the creature collection.
-            # This ensures only weapon sprites are rendered when collections are toggled.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = True
-            
-            # Iterates through all top-level collections in the current view layer to manage their visibility.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding weapon key for the collection name.
-                # "next" is used for a single, fast lookup with built-in error handling.
-                # This key is also used as the <wovl> (weapon overlay) identifier in the filename.
-                wovl = next((key for key,value in typeParameters.animationWeaponFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized weapon animation and if that weapon is enabled for rendering.
-                if ( (wovl != None) and (typeParameters.animationWeaponToggles[wovl] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    weapon_folder = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    weapon_animation_folder = os.path.join(weapon_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    weapon_position_folder = os.path.join(weapon_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(weapon_position_folder):
-                        os.makedirs(weapon_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    # animation key, camera position, and zero-padded frame number. East-facing sprites get an 'E' suffix.
-                    if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                        fileName = f"{typeParameters.prefixResref}{wovl}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    else:
-                        fileName = f"{typeParameters.prefixResref}{wovl}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(weapon_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",weapon_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",weapon_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
- 
-                # ----- Debugging
-                # TODO: Delete print
-                print("collectionName:",collectionName)
-                # TODO: Delete print
-                print("wovl:",wovl)
-            
-            # Resets the 'holdout' state of the creature collection to its original value.
-            # This ensures the creature is visible again after weapon rendering is complete, if it was originally visible.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = False
-    
+            self.renderLayers(typeParameters)
+
     def type3000_mirror0(self, typeParameters:IEAS_AnimationTypesParameters):
         """Handles the logic for rendering and processing type 3000(mirror = 0)."""
          # ----- Controls the 'exclude' and 'hide_render' visibility of collections -----
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type3000M0: Executing 'exclude' logic for 3000M0 type.")
-            print("typeParameters.CreatureCollectionName:",typeParameters.CreatureCollectionName)
+            self.excludeCollections(typeParameters)
         else:
-            # TODO:Delete!
-            print("type3000M0: Executing complex logic for 3000M0 type.") 
-             # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'DE':'G1', 'TW':'G1',       'SD':'G1',
-                'SC':'G2', 'EMERGE':'G2',   'HIDE':'G2',
-                'A1':'G3', 'CA':'G3',
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Makes the main/upper creature collection visible for rendering.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render  = False
-            # Ensures the Lower Part collection remains excluded (invisible) on the View Layer.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionNameLP].exclude = True
-            
-            # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-            # animation key, camera position, and zero-padded frame number. East-facing sprites get an 'E' suffix.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                          
-            # ----- Setup for SECOND RENDER PASS: Lower Creature Part -----                                                 
-            # Constructs the output folder path for the creature's lower part.
-            lowerpart_folder            = os.path.join(typeParameters.pathSaveAt, typeParameters.CreatureCollectionNameLP)
-            lowerpart_animation_folder  = os.path.join(lowerpart_folder, typeParameters.animation)
-             # Creates a subfolder for the specific animation and position angle.
-            lowerpart_position_folder   = os.path.join(lowerpart_animation_folder, typeParameters.positionKey)
-            if not os.path.exists(lowerpart_position_folder):
-                os.makedirs(lowerpart_position_folder)
-                
-            # Hides the main/upper creature collection (makes it invisible for the next render).
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render = True             
-            # Un-excludes the Lower Part collection, making its LayerCollection enabled
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionNameLP].exclude = False
-            
-            # Constructs the full filename for the current sprite (for the lower part), using the 'D' prefix.
-            # East-facing sprites get an 'E' suffix.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}D{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}D{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                
-             # Sets Blender's render output filepath for the current lower-part image.
-            bpy.context.scene.render.filepath = os.path.join(lowerpart_position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                          
-            # Restores the render visibility of the main/upper creature collection (visible for subsequent calls).
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render  = False
-                
+            self.renderLayers(typeParameters)
+
     def type3000_mirror1(self, typeParameters:IEAS_AnimationTypesParameters):
-        """Handles the logic for rendering and processing type 3000(mirror = 1)."""    
+        """Handles the logic for rendering and processing type 3000(mirror = 1)."""
         # ----- Controls the 'exclude' and 'hide_render' visibility of collections -----
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type3000M1: Executing 'exclude' logic for 3000M1 type.")
-            print("typeParameters.CreatureCollectionName:",typeParameters.CreatureCollectionName)
+            self.excludeCollections(typeParameters)
         else:
-            # TODO:Delete!
-            print("type3000M1: Executing complex logic for 3000M1 type.")
-            
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'DE':'G1', 'TW':'G1',       'SD':'G1',
-                'SC':'G2', 'EMERGE':'G2',   'HIDE':'G2',
-                'A1':'G3', 'CA':'G3',
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Makes the main/upper creature collection visible for rendering.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render  = False
-            # Ensures the Lower Part collection remains excluded (invisible) on the View Layer.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionNameLP].exclude = True
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                          
-            # ----- Setup for SECOND RENDER PASS: Lower Creature Part -----                                                 
-            # Constructs the output folder path for the creature's lower part.
-            lowerpart_folder            = os.path.join(typeParameters.pathSaveAt, typeParameters.CreatureCollectionNameLP)
-            lowerpart_animation_folder  = os.path.join(lowerpart_folder, typeParameters.animation)
-             # Creates a subfolder for the specific animation and position angle.
-            lowerpart_position_folder   = os.path.join(lowerpart_animation_folder, typeParameters.positionKey)
-            if not os.path.exists(lowerpart_position_folder):
-                os.makedirs(lowerpart_position_folder)
-                
-            # Hides the main/upper creature collection (makes it invisible for the next render).
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render = True             
-            # Un-excludes the Lower Part collection, making its LayerCollection enabled
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionNameLP].exclude = False
-            
-            # Constructs the full filename for the current sprite (for the lower part), using the 'D' prefix.
-            fileName = f"{typeParameters.prefixResref}D{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            
-            # Sets Blender's render output filepath for the current lower-part image.
-            bpy.context.scene.render.filepath = os.path.join(lowerpart_position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                          
-            # Restores the render visibility of the main/upper creature collection (visible for subsequent calls).
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].collection.hide_render  = False
-    
+            self.renderLayers(typeParameters)
+
     def type4000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 4000 type logic."""
         if (typeParameters.exclude == False):
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.                  
-            fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"              
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)        
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-    
+            self.renderLayers(typeParameters)
+
     def type5000and6000_character_sp0(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 5000/6000 character split bams 0 type logic."""
-        # ----- Deactivates/Activates collections      
+        # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type5000/6000: Executing 'exclude' logic for 5000/6000 character split bams 0 type.")
-        else:
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'WK':'G1', 'SC1':'G1', 'SD1':'G1', 'SC2':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1', 
-                'SD2':'G1','SD3':'G1', 'SL1':'G1', 'SL2':'G1',
-                'A1':'A1', 'A2':'A2', 'A3':'A3', 'A4':'A4', 'A5':'A5', 'A6':'A6', 'A7':'A7',
-                'A8':'A8', 'A9':'A9',
-                'SA':'SA', 'SS':'SS', 'SX':'SX',
-                'CA1':'CA','SP1':'CA','CA2':'CA','SP2':'CA','CA3':'CA','SP3':'CA','CA4':'CA',
-                'SP4':'CA',
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # For no armor type
-            if(typeParameters.animationArmorToggles['ARMOR1'] == True):
-                armor       = typeParameters.animationArmorFolderNames['ARMOR1']
-                if (animationKey != typeParameters.animationKey):
-                    fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                else:
-                    fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                # Constructs the base output folder path for the current weapon.
-                armor_folder            = os.path.join(typeParameters.pathSaveAt, armor)
-                armor_animation_folder  = os.path.join(armor_folder, typeParameters.animation)
-                
-                # Creates a subfolder for the specific weapon and camera angle.
-                armor_position_folder = os.path.join(armor_animation_folder, typeParameters.positionKey)                  
-                if not os.path.exists(armor_position_folder):
-                    os.makedirs(armor_position_folder)
-                                           
-                # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-                bpy.context.scene.render.filepath = os.path.join(armor_position_folder, fileName)            
-                # This is the actual rendering process.
-                # `animation=False` renders a single still image.
-                # `write_still=True` saves the rendered image to the specified `filepath`.
-                # The first `False` argument disables undo support for the operation.
-                renderFrame = bpy.ops.render.render
-                renderFrame(  False,
-                              animation     =False,
-                              write_still   =True)
-                
-            # TODO: For any other armor type.
-            # Iterates through all top-level collections in the current view layer to manage their visibility.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding armor key for the collection name.
-                armor = next((key for key,value in typeParameters.animationArmorFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized armor animation and if that armor is enabled for rendering.
-                if ( (armor != None) and (typeParameters.animationArmorToggles[armor] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    armor_folder            = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    armor_animation_folder  = os.path.join(armor_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    armor_position_folder = os.path.join(armor_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(armor_position_folder):
-                        os.makedirs(armor_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    armor = typeParameters.animationArmorFolderNames[armor]
-                    if (animationKey != typeParameters.animationKey):
-                        fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    else:
-                        fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(armor_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",armor_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",armor_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
-    
+            self.excludeCollections(typeParameters)
+        else:
+            self.renderLayers(typeParameters)
+
     def type5000and6000_character_sp1(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 5000/6000 character split bams 1 type logic."""
-        # ----- Deactivates/Activates collections      
+        # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type5000/6000: Executing 'exclude' logic for 5000/6000 character split bams 1 type.")
+            self.excludeCollections(typeParameters)
         else:
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'SC1':'G1', 'WK':'G11', 'SD1':'G12', 'SC2':'G13', 'GH':'G14and15', 'DE':'G15', 'TW':'G16', 
-                'SD2':'G17','SD3':'G18', 'SL1':'G19', 'SL2':'G19',
-                'A1':'A1', 'A2':'A2', 'A3':'A3', 'A4':'A4', 'A5':'A5', 'A6':'A6', 'A7':'A7',
-                'A8':'A8', 'A9':'A9',
-                'SA':'SA', 'SS':'SS', 'SX':'SX',
-                'CA1':'CA','SP1':'CA','CA2':'CA','SP2':'CA','CA3':'CA','SP3':'CA','CA4':'CA',
-                'SP4':'CA',
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # For no armor type
-            if(typeParameters.animationArmorToggles['ARMOR1'] == True):
-                armor       = typeParameters.animationArmorFolderNames['ARMOR1']
-                if (animationKey != typeParameters.animationKey):
-                    fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                else:
-                    fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                # Constructs the base output folder path for the current weapon.
-                armor_folder            = os.path.join(typeParameters.pathSaveAt, armor)
-                armor_animation_folder  = os.path.join(armor_folder, typeParameters.animation)
-                
-                # Creates a subfolder for the specific weapon and camera angle.
-                armor_position_folder = os.path.join(armor_animation_folder, typeParameters.positionKey)                  
-                if not os.path.exists(armor_position_folder):
-                    os.makedirs(armor_position_folder)
-                                           
-                # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-                bpy.context.scene.render.filepath = os.path.join(armor_position_folder, fileName)            
-                # This is the actual rendering process.
-                # `animation=False` renders a single still image.
-                # `write_still=True` saves the rendered image to the specified `filepath`.
-                # The first `False` argument disables undo support for the operation.
-                renderFrame = bpy.ops.render.render
-                renderFrame(  False,
-                              animation     =False,
-                              write_still   =True)
-            
-            # TODO: For any other armor type.
-            # Iterates through all top-level collections in the current view layer to manage their visibility.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding armor key for the collection name.
-                armor = next((key for key,value in typeParameters.animationArmorFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized armor animation and if that armor is enabled for rendering.
-                if ( (armor != None) and (typeParameters.animationArmorToggles[armor] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    armor_folder            = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    armor_animation_folder  = os.path.join(armor_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    armor_position_folder = os.path.join(armor_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(armor_position_folder):
-                        os.makedirs(armor_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    armor = typeParameters.animationArmorFolderNames[armor]
-                    if (animationKey != typeParameters.animationKey):
-                        fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    else:
-                        fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(armor_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",armor_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",armor_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
-            
+            self.renderLayers(typeParameters)
+
     def type5000and6000_character_old(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 5000/6000 character old type logic."""
-        # ----- Deactivates/Activates collections      
+        # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type5000/6000: Executing 'exclude' logic for 5000/6000 character old type.")
+            self.excludeCollections(typeParameters)
         else:
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'SC1':'G1', 'WK':'G1', 'SD1':'G1', 'SC2':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1', 
-                'SD2':'G1','SD3':'G1', 'SL1':'G1', 'SL2':'G1',
-                'A1':'A1', 'A2':'A2', 'A3':'A3', 'A4':'A4', 'A5':'A5', 'A6':'A6', 'A7':'A7',
-                'A8':'A8', 'A9':'A9',
-                'SA':'SA', 'SS':'SS', 'SX':'SX',
-                'CA1':'CA','SP1':'CA','CA2':'CA','SP2':'CA','CA3':'CA','SP3':'CA','CA4':'CA',
-                'SP4':'CA',
-                'WK2':'W2',
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Both lists are used to identify which sprite file is defined for which direction regarding walk2 as specified in iesdp. 
-            positionKeysWK2         = [ 'south_south_west', 'west_south_west', 
-                                        'west_north_west',   'north_north_west', 
-                                        'north_north_east']
-            positionKeysWK2East     = [ 'east_north_east', 'east_south_east', 
-                                        'south_south_east']
-            positionKeysCombinedWK2 = positionKeysWK2East + positionKeysWK2
-            # Prepares for simple if conditions
-            isNotWK2Position        = not any (typeParameters.positionKey == position for position in positionKeysCombinedWK2)
-            
-            # This is for no filename is defined
-            fileName = 0
-            # ----- Debugging
-            # TODO: Delete print
-            print("animationKey:",animationKey)
-            print("typeParameters.positionKey:",typeParameters.positionKey)
-            
-             # ----- For no armor type
-            if(typeParameters.animationArmorToggles['ARMOR1'] == True):
-                armor = typeParameters.animationArmorFolderNames['ARMOR1']             
-                # If statement order is important!
-                # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                if(animationKey == 'W2'):
-                    if any(typeParameters.positionKey == position for position in positionKeysWK2):
-                        fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    elif any(typeParameters.positionKey == position for position in positionKeysWK2East):
-                        fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"                                   
-                elif(animationKey != typeParameters.animationKey and isNotWK2Position):                                                            
-                    if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):         
-                        fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    else:        
-                        fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                elif(animationKey == typeParameters.animationKey and isNotWK2Position):
-                    if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):
-                        fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    else:
-                        fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                # A valid file name is found.
-                if(fileName != 0):
-                    # Constructs the base output folder path for the current weapon.
-                    armor_folder            = os.path.join(typeParameters.pathSaveAt, armor)
-                    armor_animation_folder  = os.path.join(armor_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    armor_position_folder = os.path.join(armor_animation_folder, typeParameters.positionKey)
-                    if not os.path.exists(armor_position_folder):
-                        os.makedirs(armor_position_folder)
-                                               
-                    # Sets the scene's render output file path. This tells Blender where to save the next rendered image.
-                    bpy.context.scene.render.filepath = os.path.join(armor_position_folder, fileName)
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-                else:
-                    print("No file name defined - fileName is ",fileName)
-            
-            # ----- For any other armor type
-            # Iterates through all top-level collections in the current view layer to manage their visibility.
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding armor key for the collection name.
-                armor = next((key for key,value in typeParameters.animationArmorFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized armor animation and if that armor is enabled for rendering.
-                if ( (armor != None) and (typeParameters.animationArmorToggles[armor] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    armor_folder            = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    armor_animation_folder  = os.path.join(armor_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    armor_position_folder = os.path.join(armor_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(armor_position_folder):
-                        os.makedirs(armor_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    armor = typeParameters.animationArmorFolderNames[armor]
-                    if (animationKey != typeParameters.animationKey):
-                        if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):
-                            fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        else:
-                            fileName    = f"{typeParameters.prefixResref}{armor}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"                    
-                    else:
-                        if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):
-                            fileName    = f"{typeParameters.prefixResref}{armor}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        else:
-                            ffileName   = f"{typeParameters.prefixResref}{armor}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"                    
-                        
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(armor_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",armor_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",armor_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
-        
+            self.renderLayers(typeParameters)
+
     def type7000_monster_sp0(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 7000 monster split bams 0 type logic."""
-         # ----- Deactivates/Activates collections      
+         # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type7000: Executing 'exclude' logic for type7000 monster sp0 type.")
+            self.excludeCollections(typeParameters)
         else:
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'SD':'G1', 'SC':'G1', 'SL':'G1', 'WK':'G1', 'GH':'G1', 'GU':'G1', 'DE':'G1', 'TW':'G1', 
-                'A1':'G2', 'A2':'G2', 'A3':'G2', 'A4':'G2', 'A5':'G2', 'SP':'G2', 'CA':'G2',
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)            
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                       
-            # TODO:Delete!
-            print("type7000: Executing 'exclude' logic for type7000 monster sp0 type.")
-            # Stores the initial 'holdout' state of the creature collection before modification.
-            # 'holdout' makes objects within the collection invisible during rendering without excluding them from the view layer. 
-            holdout = bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout
-            
-            # ----- Debugging
-            # TODO: Delete print
-            print("holdout:",holdout)
-                                            
-            # Activates 'holdout' (invisibility for rendering) specifically for the creature collection.
-            # This ensures only weapon sprites are rendered when collections are toggled.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = True
-            
-            # Iterates through all top-level collections in the current view layer to manage their visibility.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding weapon key (e.g., 'A', 'B', 'C') for the collection name.
-                # This key is also used as the <wovl> (weapon overlay) identifier in the filename.
-                wovl = next((key for key,value in typeParameters.animationWeaponFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized weapon animation and if that weapon is enabled for rendering.
-                if ( (wovl != None) and (typeParameters.animationWeaponToggles[wovl] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    weapon_folder = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    weapon_animation_folder = os.path.join(weapon_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    weapon_position_folder = os.path.join(weapon_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(weapon_position_folder):
-                        os.makedirs(weapon_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    # animation key, camera position, and zero-padded frame number. East-facing sprites get an 'E' suffix.
-                    fileName = f"{typeParameters.prefixResref}{animationKey}{wovl}{typeParameters.animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(weapon_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",weapon_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",weapon_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
- 
-                # ----- Debugging
-                # TODO: Delete print
-                print("collectionName:",collectionName)
-                # TODO: Delete print
-                print("wovl:",wovl)
-            
-            # Resets the 'holdout' state of the creature collection to its original value.
-            # This ensures the creature is visible again after weapon rendering is complete, if it was originally visible.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = False
-                
+            self.renderLayers(typeParameters)
+
     def type7000_monster_sp1(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 7000 monster split bams 1 type logic."""
          # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type7000: Executing 'exclude' logic for type7000 monster sp1 type.")
+            self.excludeCollections(typeParameters)
         else:
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'SC':'G1', 'WK':'G11','SD':'G12', 'GH':'G13and14', 'DE':'G14', 'TW':'G14and15', 'GU':'G14', 'SL':'G14',
-                'A1':'G2', 'A2':'G21', 'A3':'G22', 'A4':'G23', 'A5':'G24', 'SP':'G25', 'CA':'G26',
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                       
-            # TODO:Delete!
-            print("type7000: Executing 'exclude' logic for type7000 monster sp1 type.")
-            # Stores the initial 'holdout' state of the creature collection before modification.
-            # 'holdout' makes objects within the collection invisible during rendering without excluding them from the view layer.
-            holdout = bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout
-            
-            # ----- Debugging
-            # TODO: Delete print
-            print("holdout:",holdout)
-                                            
-            # Activates 'holdout' (invisibility for rendering) specifically for the creature collection.
-            # This ensures only weapon sprites are rendered when collections are toggled.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = True
-            
-            # Iterates through all top-level collections in the current view layer to manage their visibility.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding weapon key (e.g., 'A', 'B', 'C') for the collection name.
-                # This key is also used as the <wovl> (weapon overlay) identifier in the filename.
-                wovl = next((key for key,value in typeParameters.animationWeaponFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized weapon animation and if that weapon is enabled for rendering.
-                if ( (wovl != None) and (typeParameters.animationWeaponToggles[wovl] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    weapon_folder = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    weapon_animation_folder = os.path.join(weapon_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    weapon_position_folder = os.path.join(weapon_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(weapon_position_folder):
-                        os.makedirs(weapon_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    # animation key, camera position, and zero-padded frame number. East-facing sprites get an 'E' suffix.
-                    fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}{wovl}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(weapon_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",weapon_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",weapon_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
- 
-                # ----- Debugging
-                # TODO: Delete print
-                print("collectionName:",collectionName)
-                # TODO: Delete print
-                print("wovl:",wovl)
-            
-            # Resets the 'holdout' state of the creature collection to its original value.
-            # This ensures the creature is visible again after weapon rendering is complete, if it was originally visible.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = False
-                
+            self.renderLayers(typeParameters)
+
     def type7000_monster_old(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 7000 monster_old type logic."""
         if (typeParameters.exclude == False):
-             # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1','DE':'G1', 'TW':'G1',
-                'A1':'G2', 'CA':'G2', 'A3':'G2'
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                       
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
+            self.renderLayers(typeParameters)
 
     def type8000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 8000 monster_layered type logic."""
-         # ----- Deactivates/Activates collections      
+         # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("type8000: Executing 'exclude' logic for 8000 type.")
+            self.excludeCollections(typeParameters)
         else:
-            # Used to identify which sprite file is defined for which sequence.
-            sequences = {
-                'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
-                'A1':'G2', 'A2':'G2', 'A3':'G2', 'SP':'G2', 'CA':'G2',
-            }
-            animationKey    = sequences[typeParameters.animationKey]    # Gets e.g. G1.
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                          
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)            
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                       
-            # TODO:Delete!
-            print("type8000: Executing complex logic for 8000 type.")
-            # Stores the initial 'holdout' state of the creature collection before modification.
-            # 'holdout' makes objects within the collection invisible during rendering without excluding them from the view layer. 
-            holdout = bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout
-            
-            # ----- Debugging
-            # TODO: Delete print
-            print("holdout:",holdout)
-                                            
-            # Activates 'holdout' (invisibility for rendering) specifically for the creature collection.
-            # This ensures only weapon sprites are rendered when collections are toggled.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = True
-            
-            # Iterates through all top-level collections in the current view layer to manage their visibility.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding weapon key for the collection name.
-                # "next" is used for a single, fast lookup with built-in error handling.
-                # This key is also used as the <wovl> (weapon overlay) identifier in the filename.
-                wovl = next((key for key,value in typeParameters.animationWeaponFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized weapon animation and if that weapon is enabled for rendering.
-                if ( (wovl != None) and (typeParameters.animationWeaponToggles[wovl] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    weapon_folder = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    weapon_animation_folder = os.path.join(weapon_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    weapon_position_folder = os.path.join(weapon_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(weapon_position_folder):
-                        os.makedirs(weapon_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    # animation key, camera position, and zero-padded frame number. East-facing sprites get an 'E' suffix.
-                    if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                        fileName = f"{typeParameters.prefixResref}{wovl}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    else:
-                        fileName = f"{typeParameters.prefixResref}{wovl}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(weapon_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",weapon_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",weapon_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
- 
-                # ----- Debugging
-                # TODO: Delete print
-                print("collectionName:",collectionName)
-                # TODO: Delete print
-                print("wovl:",wovl)
-            
-            # Resets the 'holdout' state of the creature collection to its original value.
-            # This ensures the creature is visible again after weapon rendering is complete, if it was originally visible.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = False
-    
+            self.renderLayers(typeParameters)
+
     def type9000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling 9000 type logic."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'SD':'G1', 'SC':'G1', 'WK':'G1',
-                'A1':'G2', 'A2':'G2',
-                'A3':'G3', 'GH':'G3', 'DE':'G3', 'TW':'G3'
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                       
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-        
+            self.renderLayers(typeParameters)
+
     def typeA000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling A000 type logic."""
         if (typeParameters.exclude == False):
-             # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'WK':'G1',
-                'SD':'G2', 'SC':'G2', 'GH':'G3', 'DE':'G3', 'TW':'G3',
-                'A1':'G2', 'A2':'G2', 'A3':'G3', 
-            }
-            animationKey = sequences[typeParameters.animationKey] # Gets e.g. G1.
-            
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                       
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                          
+            self.renderLayers(typeParameters)
+
     def typeB000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling B000 type logic."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
-            }
-            animationKey = sequences[typeParameters.animationKey]
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                       
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-        
+            self.renderLayers(typeParameters)
+
     def typeC000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling C000 type logic."""
         if (typeParameters.exclude == False):
-            # Used to identify which sprite file is defined for which sequence
-            sequences = {
-                'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
-            }
-            animationKey = sequences[typeParameters.animationKey]
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}{animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                       
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-        
+            self.renderLayers(typeParameters)
+
     def typeD000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling D000 type logic."""
         if (typeParameters.exclude == False):
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.                  
-            fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"              
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)        
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-        
+            self.renderLayers(typeParameters)
+
     def typeE000(self, typeParameters:IEAS_AnimationTypesParameters):
-        """Method for handling E000 type logic."""     
+        """Method for handling E000 type logic."""
         # ----- Deactivates/Activates collections
         if (typeParameters.exclude == True):
-            # Checks the collection name in the scene collection  
-            if not bpy.context.view_layer.layer_collection.children.get(typeParameters.CreatureCollectionName):
-                # This is needed for the self.report error message in exception handling
-                raise ValueError(f"Collection '{typeParameters.CreatureCollectionName}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
-            
-            # Deactivates every collection found.
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collection.exclude = True            
-            # Activates only creature collection.
-            bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].exclude = False
-            # TODO:Delete!
-            print("typeE000: Executing 'exclude' logic for E000 type.")
+            self.excludeCollections(typeParameters)
         else:
-            # Constructs the filename for the current sprite, including prefix, resref, animation, position, and padded frame number.
-            if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-            else:
-                fileName = f"{typeParameters.prefixResref}{typeParameters.animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                          
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)            
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-                       
-            # TODO:Delete!
-            print("typeE000: Executing complex logic for E000 type.")
-            # Stores the initial 'holdout' state of the creature collection before modification.
-            # 'holdout' makes objects within the collection invisible during rendering without excluding them from the view layer. 
-            holdout = bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout
-            
-            # ----- Debugging
-            # TODO: Delete print
-            print("holdout:",holdout)
-                                            
-            # Activates 'holdout' (invisibility for rendering) specifically for the creature collection.
-            # This ensures only weapon sprites are rendered when collections are toggled.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner(?!).
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = True
-            
-            # Iterates through all top-level collections in the current view layer to manage their visibility.                   
-            for collection in bpy.context.view_layer.layer_collection.children:
-                collectionName  = collection.name
-                # Finds the corresponding weapon key (e.g., 'A', 'B', 'C') for the collection name.
-                # This key is also used as the <wovl> (weapon overlay) identifier in the filename.
-                wovl = next((key for key,value in typeParameters.animationWeaponFolderNames.items() if value == collectionName), None)
-                
-                # Checks if the collection corresponds to a recognized weapon animation and if that weapon is enabled for rendering.
-                if ( (wovl != None) and (typeParameters.animationWeaponToggles[wovl] == True) ):
-                    # Deactivates exclusion for the current weapon collection, making it visible for rendering.
-                    # All other weapon collections remain excluded (invisible) by default.
-                    collection.exclude=False
-                    
-                    # Constructs the base output folder path for the current weapon.
-                    weapon_folder = os.path.join(typeParameters.pathSaveAt, collectionName)
-                    weapon_animation_folder = os.path.join(weapon_folder, typeParameters.animation)
-                    
-                    # Creates a subfolder for the specific weapon and camera angle.
-                    weapon_position_folder = os.path.join(weapon_animation_folder, typeParameters.positionKey)                  
-                    if not os.path.exists(weapon_position_folder):
-                        os.makedirs(weapon_position_folder)
-                    
-                    # Constructs the full filename for the current sprite, incorporating prefix, weapon identifier (wovl),
-                    # animation key, camera position, and zero-padded frame number. East-facing sprites get an 'E' suffix.
-                    if any(typeParameters.positionKey == position for position in typeParameters.cameraEasternPositions):                     
-                        fileName = f"{typeParameters.prefixResref}{wovl}{typeParameters.animationKey}E_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                    else:
-                        fileName = f"{typeParameters.prefixResref}{wovl}{typeParameters.animationKey}_{typeParameters.positionKey}_{str(typeParameters.frame).zfill(5)}.png"
-                        
-                    # Sets Blender's render output filepath for the current image. This is where the next rendered image will be saved.
-                    bpy.context.scene.render.filepath = os.path.join(weapon_position_folder, fileName)                
-                    # This is the actual rendering process.
-                    # `animation=False` renders a single still image.
-                    # `write_still=True` saves the rendered image to the specified `filepath`.
-                    # The first `False` argument disables undo support for the operation.
-                    renderFrame = bpy.ops.render.render
-                    renderFrame(  False,
-                                  animation     =False,
-                                  write_still   =True)
-
-                    # ----- Debugging
-                    # TODO: Delete print
-                    #print("position_folder:",position_folder)
-                    # TODO: Delete print
-                    print("fileName:",fileName)
-                    # TODO: Delete print
-                    print("weapon_folder:",weapon_folder)
-                    # TODO: Delete print
-                    print("weapon_position_folder:",weapon_position_folder)
-                       
-                    # After rendering the current weapon's sprite for this frame/angle, its collection is excluded again.
-                    # This ensures only one weapon collection is active at any given time for subsequent renders.
-                    collection.exclude = True
- 
-                # ----- Debugging
-                # TODO: Delete print
-                print("collectionName:",collectionName)
-                # TODO: Delete print
-                print("wovl:",wovl)
-            
-            # Resets the 'holdout' state of the creature collection to its original value.
-            # This ensures the creature is visible again after weapon rendering is complete, if it was originally visible.
-            if (holdout == False):
-                # WARNING: This change to 'holdout' status will not be visibly reflected in the Blender GUI's Outliner.
-                bpy.context.view_layer.layer_collection.children[typeParameters.CreatureCollectionName].holdout = False                  
-    
+            self.renderLayers(typeParameters)
+
     def typeF000(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling F000 type logic."""
         if (typeParameters.exclude == False):
-            # Constructs the filename for the current sprite, including prefix,resref and padded frame number.
-            fileName = f"{typeParameters.prefixResref}_PST_{typeParameters.animationKey}_{str(typeParameters.frame).zfill(5)}.png"                    
-            # Sets the scene's render output file path. This tells Blender where to save the next rendered image.                       
-            bpy.context.scene.render.filepath = os.path.join(typeParameters.position_folder, fileName)         
-            # This is the actual rendering process.
-            # `animation=False` renders a single still image.
-            # `write_still=True` saves the rendered image to the specified `filepath`.
-            # The first `False` argument disables undo support for the operation.
-            renderFrame = bpy.ops.render.render
-            renderFrame(  False,
-                          animation     =False,
-                          write_still   =True)
-        
+            self.renderLayers(typeParameters)
+
     def typeNone(self, typeParameters:IEAS_AnimationTypesParameters):
         """Method for handling no type logic."""
         print("No animation type found. This shouldn't happen!")
 
+
+# --------
+# Purpose:
+# --------
+# Compiles the scene properties into a render plan(see IEAS_RenderPlan).
+# Every check and every file name is done here, so nothing is rendered when the input is invalid.
+# ----------------------------------------------------------------------------------------------
+class IEAS_RenderPlanCompiler():
+    """Contains methods for compiling the scene properties into a render plan"""
+
+    # Animation types which do not write into the animation and position folders.
+    excludedAnimationTypes = [  '5000/6000 character split bams 0',
+                                '5000/6000 character split bams 1',
+                                '5000/6000 character old']
+    # Dictionary mapping internal keys to rotation angles in degrees.
+    cameraAngles = {
+        'south':        0,      'south_south_west': 337.5,
+        'south_west':   315,    'west_south_west':  292.5,
+        'west':         270,    'west_north_west':  247.5,
+        'north_west':   225,    'north_north_west': 202.5,
+        'north':        180,    'north_north_east': 157.5,
+        'north_east':   135,    'east_north_east':  112.5,
+        'east':         90,     'east_south_east':  67.5,
+        'south_east':   45,     'south_south_east': 22.5
+    }
+    cameraEasternPositions = [  'north_north_east',         'north_east', 'east_north_east',
+                                'east', 'east_south_east',  'south_east', 'south_south_east']
+    # Used to identify which sprite file is defined for which sequence of each animation type.
+    sequences = {
+        '1000 monster quadrant': {
+            'WK':'G1',
+            'SD':'G2', 'SC':'G2', 'GH':'G2', 'DE':'G2', 'TW':'G2',
+            'A1':'G3', 'A2':'G3', 'A3':'G3',
+        },
+        '1000 monster multi split bams 0': {
+            'WK':'G1',
+            'SD':'G2', 'SC':'G2',
+            'A1':'G3', 'A2':'G3', 'A3':'G3',
+            'GH':'G4', 'DE':'G4', 'SL':'G4', 'GU':'G4', 'TW':'G4',
+            'SP':'G5', 'CA':'G5',
+        },
+        '1000 monster multi split bams 1': {
+            'WK':'G1',
+            'SD':'G2', 'SC':'G2',
+            'A1':'G3', 'A2':'G3', 'A3':'G3',
+            'GH':'G4', 'DE':'G4', 'SL':'G4', 'GU':'G4', 'TW':'G4',
+            'SP':'G5', 'CA':'G5',
+        },
+        '1000 multi new split bams 0': {
+            'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+            'A1':'G2', 'A2':'G2', 'A3':'G2', 'A4':'G2', 'A5':'G2', 'SP':'G2', 'CA':'G2',
+        },
+        '1000 multi new split bams 1': {
+            'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+            'A1':'G2', 'A2':'G2', 'A3':'G2', 'A4':'G2', 'A5':'G2', 'SP':'G2', 'CA':'G2',
+        },
+        '2000': {
+            'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+            'A1':'G2', 'A2':'G2', 'A3':'G2', 'SP':'G2', 'CA':'G2',
+        },
+        '3000 mirror 0': {
+            'DE':'G1', 'TW':'G1',       'SD':'G1',
+            'SC':'G2', 'EMERGE':'G2',   'HIDE':'G2',
+            'A1':'G3', 'CA':'G3',
+        },
+        '3000 mirror 1': {
+            'DE':'G1', 'TW':'G1',       'SD':'G1',
+            'SC':'G2', 'EMERGE':'G2',   'HIDE':'G2',
+            'A1':'G3', 'CA':'G3',
+        },
+        '5000/6000 character split bams 0': {
+            'WK':'G1', 'SC1':'G1', 'SD1':'G1', 'SC2':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+            'SD2':'G1','SD3':'G1', 'SL1':'G1', 'SL2':'G1',
+            'A1':'A1', 'A2':'A2', 'A3':'A3', 'A4':'A4', 'A5':'A5', 'A6':'A6', 'A7':'A7',
+            'A8':'A8', 'A9':'A9',
+            'SA':'SA', 'SS':'SS', 'SX':'SX',
+            'CA1':'CA','SP1':'CA','CA2':'CA','SP2':'CA','CA3':'CA','SP3':'CA','CA4':'CA',
+            'SP4':'CA',
+        },
+        '5000/6000 character split bams 1': {
+            'SC1':'G1', 'WK':'G11', 'SD1':'G12', 'SC2':'G13', 'GH':'G14and15', 'DE':'G15', 'TW':'G16',
+            'SD2':'G17','SD3':'G18', 'SL1':'G19', 'SL2':'G19',
+            'A1':'A1', 'A2':'A2', 'A3':'A3', 'A4':'A4', 'A5':'A5', 'A6':'A6', 'A7':'A7',
+            'A8':'A8', 'A9':'A9',
+            'SA':'SA', 'SS':'SS', 'SX':'SX',
+            'CA1':'CA','SP1':'CA','CA2':'CA','SP2':'CA','CA3':'CA','SP3':'CA','CA4':'CA',
+            'SP4':'CA',
+        },
+        '5000/6000 character old': {
+            'SC1':'G1', 'WK':'G1', 'SD1':'G1', 'SC2':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+            'SD2':'G1','SD3':'G1', 'SL1':'G1', 'SL2':'G1',
+            'A1':'A1', 'A2':'A2', 'A3':'A3', 'A4':'A4', 'A5':'A5', 'A6':'A6', 'A7':'A7',
+            'A8':'A8', 'A9':'A9',
+            'SA':'SA', 'SS':'SS', 'SX':'SX',
+            'CA1':'CA','SP1':'CA','CA2':'CA','SP2':'CA','CA3':'CA','SP3':'CA','CA4':'CA',
+            'SP4':'CA',
+            'WK2':'W2',
+        },
+        '7000 monster split bams 0': {
+            'SD':'G1', 'SC':'G1', 'SL':'G1', 'WK':'G1', 'GH':'G1', 'GU':'G1', 'DE':'G1', 'TW':'G1',
+            'A1':'G2', 'A2':'G2', 'A3':'G2', 'A4':'G2', 'A5':'G2', 'SP':'G2', 'CA':'G2',
+        },
+        '7000 monster split bams 1': {
+            'SC':'G1', 'WK':'G11','SD':'G12', 'GH':'G13and14', 'DE':'G14', 'TW':'G14and15', 'GU':'G14', 'SL':'G14',
+            'A1':'G2', 'A2':'G21', 'A3':'G22', 'A4':'G23', 'A5':'G24', 'SP':'G25', 'CA':'G26',
+        },
+        '7000 monster old': {
+            'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1','DE':'G1', 'TW':'G1',
+            'A1':'G2', 'CA':'G2', 'A3':'G2'
+        },
+        '8000': {
+            'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+            'A1':'G2', 'A2':'G2', 'A3':'G2', 'SP':'G2', 'CA':'G2',
+        },
+        '9000': {
+            'SD':'G1', 'SC':'G1', 'WK':'G1',
+            'A1':'G2', 'A2':'G2',
+            'A3':'G3', 'GH':'G3', 'DE':'G3', 'TW':'G3'
+        },
+        'A000': {
+            'WK':'G1',
+            'SD':'G2', 'SC':'G2', 'GH':'G3', 'DE':'G3', 'TW':'G3',
+            'A1':'G2', 'A2':'G2', 'A3':'G3',
+        },
+        'B000': {
+            'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+        },
+        'C000': {
+            'WK':'G1', 'SC':'G1', 'SD':'G1', 'GH':'G1', 'DE':'G1', 'TW':'G1',
+        },
+    }
+    # The direction codes of type 1000 monster multi(split_bams = 1).
+    directions1000 = {
+        'south':        "00", 'south_south_west': "01",
+        'south_west':   "02", 'west_south_west':  "03",
+        'west':         "04", 'west_north_west':  "05",
+        'north_west':   "06", 'north_north_west': "07",
+        'north':        "08",
+    }
+    # Both lists are used to identify which sprite file is defined for which direction regarding walk2 as specified in iesdp.
+    positionKeysWK2         = [ 'south_south_west', 'west_south_west',
+                                'west_north_west',   'north_north_west',
+                                'north_north_east']
+    positionKeysWK2East     = [ 'east_north_east', 'east_south_east',
+                                'south_south_east']
+    # The cycle layout of the BAM files(see IEAS_BamWriter) of the types whose IESDP order is known from the demo BAM
+    # files: the directions of each action, the first direction of the eastern file('E') and the sequence file of the
+    # types without sequences. Each action is a group of cycles, one per direction, e.g. 'SC' is the second group.
+    # Each quadrant of the 1000 types has its own file, e.g. G11 to G14 and G11E to G14E.
+    bamLayouts = {
+        # The effect has one direction(south), the lower part is the second cycle(see bamLayerCycles).
+        '0000':                         (1,     None,   '',     {}),
+        '1000 monster quadrant':        (8,     5,      None,   {'WK':0, 'SC':0, 'SD':1, 'GH':2, 'DE':3, 'TW':4,
+                                                                 'A1':0, 'A2':1, 'A3':2}),
+        '4000':                         (16,    None,   '',     {'SC':0, 'SD':1, 'GH':2, 'DE':3, 'TW':4}),
+        '7000 monster split bams 0':    (9,     None,   None,   {'WK':0, 'SC':1, 'SD':2, 'GH':3, 'DE':4, 'TW':5, 'SL':6, 'GU':7,
+                                                                 'A1':0, 'A2':1, 'A3':2, 'A4':3, 'A5':4, 'SP':5, 'CA':6}),
+        '7000 monster split bams 1':    (9,     None,   None,   {'WK':0, 'SC':1, 'SD':2, 'GH':3, 'DE':4, 'TW':5, 'SL':6, 'GU':7,
+                                                                 'A1':0, 'A2':1, 'A3':2, 'A4':3, 'A5':4, 'SP':5, 'CA':6}),
+        '7000 monster old':             (8,     5,      None,   {'WK':0, 'SC':1, 'SD':2, 'GH':3, 'DE':4, 'TW':5,
+                                                                 'A1':0, 'CA':1, 'A3':2}),
+        # The eastern file of B000 also contains north.
+        'B000':                         (8,     4,      None,   {'SC':0, 'SD':1, 'GH':2, 'DE':3, 'TW':4}),
+        'C000':                         (8,     5,      None,   {'WK':0, 'SC':1, 'SD':2, 'GH':3, 'DE':4, 'TW':5}),
+        'D000':                         (9,     None,   'G1',   {'SD':0, 'WK':1}),
+    }
+    # The types whose cycles are their layers instead of their actions.
+    bamLayerCycles = {
+        '0000':                         {'UPPER':0, 'LOWER':1},
+    }
+
+    @classmethod
+    def bamUnsupported(cls, selectedType):
+        """Returns why no BAM files can be written for the type or None if they can."""
+        if (selectedType not in cls.bamLayouts):
+            return f"the cycle order of the type '{selectedType}' is not known(supported: {', '.join(cls.bamLayouts)})"
+        return None
+
+    def compile(self, context):
+        """Returns the render plan for the current scene properties and raises ValueError for invalid input."""
+        properties = context.scene.IEAS_properties
+        # ---- Camera
+        # Dictionaries mapping internal keys to user-defined subfolder names and toggle states for camera angles.
+        cameraPosFolderNames = {
+            'south':        properties.South,        'south_south_west': properties.South_South_West,
+            'south_west':   properties.South_West,   'west_south_west':  properties.West_South_West,
+            'west':         properties.West,         'west_north_west':  properties.West_North_West,
+            'north_west':   properties.North_West,   'north_north_west': properties.North_North_West,
+            'north':        properties.North,        'north_north_east': properties.North_North_East,
+            'north_east':   properties.North_East,   'east_north_east':  properties.East_North_East,
+            'east':         properties.East,         'east_south_east':  properties.East_South_East,
+            'south_east':   properties.South_East,   'south_south_east': properties.South_South_East
+        }
+        cameraPosToggles = {
+            'south':        properties.Use_SO, 'south_south_west':   properties.Use_SSW,
+            'south_west':   properties.Use_SW, 'west_south_west':    properties.Use_WSW,
+            'west':         properties.Use_WE, 'west_north_west':    properties.Use_WNW,
+            'north_west':   properties.Use_NW, 'north_north_west':   properties.Use_NNW,
+            'north':        properties.Use_NO, 'north_north_east':   properties.Use_NNE,
+            'north_east':   properties.Use_NE, 'east_north_east':    properties.Use_ENE,
+            'east':         properties.Use_ES, 'east_south_east':    properties.Use_ESE,
+            'south_east':   properties.Use_SE, 'south_south_east':   properties.Use_SSE
+        }
+
+        # ----- Animation
+        # Dictionaries mapping internal keys to user-defined animation names and toggle states.
+        animationFolderNames = {
+            'A1':       properties.Attack1,      'A2': properties.Attack2,
+            'A3':       properties.Attack3,      'A4': properties.Attack4,
+            'A5':       properties.Attack5,      'TW': properties.Dead,
+            'CA':       properties.Cast,         'DE': properties.Death,
+            'GH':       properties.Get_Hit,      'GU': properties.Get_Up,
+            'SC':       properties.Ready,        'SD': properties.Idle,
+            'SL':       properties.Sleep,        'SP': properties.Conjure,
+            'WK': properties.Walk,               'EMERGE': properties.Emerge,
+            'HIDE':     properties.Hide,         'Effect':   properties.Effect,
+            # Type 5000/6000 Properties
+            'WK2':      properties.Walk2,
+            'A6':       properties.Attack6,      'A7': properties.Attack7,
+            'A8':       properties.Attack8,      'A9': properties.Attack9,
+            'SA':       properties.Attack10,     'SS': properties.Attack11,
+            'SX':       properties.Attack12,     'CA1': properties.Cast1,
+            'CA2':      properties.Cast2,        'CA3': properties.Cast3,
+            'CA4':      properties.Cast4,        'SP1': properties.Conjure1,
+            'SP2':      properties.Conjure2,     'SP3': properties.Conjure3,
+            'SP4':      properties.Conjure4,     'SC1': properties.Ready1,
+            'SC2':      properties.Ready2,       'SD1': properties.Idle1,
+            'SD2':      properties.Idle2,        'SD3': properties.Idle3,
+            'SL1':      properties.Sleep1,       'SL2': properties.Sleep2,
+            # PST String Properties
+            'AT1':      properties.PST_Attack1,  'AT2': properties.PST_Attack2,
+            'AT3':      properties.PST_Attack3,  'HIT': properties.PST_Get_Hit,
+            'RUN':      properties.PST_Run,      'WLK': properties.PST_Walk,
+            'SP1':      properties.PST_Spell1,   'SP2': properties.PST_Spell2,
+            'SP3':      properties.PST_Spell3,   'GUP': properties.PST_Get_Up,
+            'DFB1':     properties.PST_Death1,   'DFB2': properties.PST_Death2,
+            'DFB3':     properties.PST_Death3,   'TK1': properties.PST_Talk1,
+            'TK2':      properties.PST_Talk2,    'TK3': properties.PST_Talk3,
+            'STD':      properties.PST_Stand,    'STDF1': properties.PST_StandF1,
+            'STDF2':    properties.PST_StandF2,  'STC': properties.PST_Stance,
+            'STCF1':    properties.PST_StanceF1, 'STCF2': properties.PST_StanceF2,
+            'STCtoSTD': properties.PST_Stance_to_Stand,
+            'STDtoSTC': properties.PST_Stand_to_Stance,
+            'MISC1':    properties.PST_Misc1,    'MISC2': properties.PST_Misc2,
+            'MISC3':    properties.PST_Misc3,    'MISC4': properties.PST_Misc4,
+            'MISC5':    properties.PST_Misc5,    'MISC6': properties.PST_Misc6,
+            'MISC7':    properties.PST_Misc7,    'MISC8': properties.PST_Misc8,
+            'MISC9':    properties.PST_Misc9,    'MISC10': properties.PST_Misc10,
+            'MISC11':   properties.PST_Misc11,   'MISC12': properties.PST_Misc12,
+            'MISC13':   properties.PST_Misc13,   'MISC14': properties.PST_Misc14,
+            'MISC15':   properties.PST_Misc15,   'MISC16': properties.PST_Misc16,
+            'MISC17':   properties.PST_Misc17,   'MISC18': properties.PST_Misc18,
+            'MISC19':   properties.PST_Misc19,   'MISC20': properties.PST_Misc20
+        }
+        animationToggles = {
+            'A1':       properties.Use_A1,       'A2': properties.Use_A2,
+            'A3':       properties.Use_A3,       'A4': properties.Use_A4,
+            'A5':       properties.Use_A5,       'TW': properties.Use_TW,
+            'CA':       properties.Use_CA,       'DE': properties.Use_DE,
+            'GH':       properties.Use_GH,       'GU': properties.Use_GU,
+            'SC':       properties.Use_SC,       'SD': properties.Use_SD,
+            'SL':       properties.Use_SL,       'SP': properties.Use_SP,
+            'WK':       properties.Use_WK,       'EMERGE':   properties.Use_Emerge,
+            'Effect':   properties.Use_Effect,   'HIDE':     properties.Use_Hide,
+            # Type 5000/6000 Boolean Properties
+            'WK2':      properties.Use_WK2,
+            'A6':       properties.Use_A6,       'A7': properties.Use_A7,
+            'A8':       properties.Use_A8,       'A9': properties.Use_A9,
+            'SA':       properties.Use_SA,       'SS': properties.Use_SS,
+            'SX':       properties.Use_SX,       'CA1': properties.Use_CA1,
+            'CA2':      properties.Use_CA2,      'CA3': properties.Use_CA3,
+            'CA4':      properties.Use_CA4,      'SP1': properties.Use_SP1,
+            'SP2':      properties.Use_SP2,      'SP3': properties.Use_SP3,
+            'SP4':      properties.Use_SP4,      'SC1': properties.Use_SC1,
+            'SC2':      properties.Use_SC2,      'SD1': properties.Use_SD1,
+            'SD2':      properties.Use_SD2,      'SD3': properties.Use_SD3,
+            'SL1':      properties.Use_SL1,      'SL2': properties.Use_SL2,
+            # PST Boolean Properties
+            'AT1':      properties.Use_AT1,      'AT2': properties.Use_AT2,
+            'AT3':      properties.Use_AT3,      'HIT': properties.Use_HIT,
+            'RUN':      properties.Use_RUN,      'WLK': properties.Use_WLK,
+            'SP1':      properties.Use_SP1,      'SP2': properties.Use_SP2,
+            'SP3':      properties.Use_SP3,      'GUP': properties.Use_GUP,
+            'DFB1':     properties.Use_DFB1,     'DFB2': properties.Use_DFB2,
+            'DFB3':     properties.Use_DFB3,     'TK1': properties.Use_TK1,
+            'TK2':      properties.Use_TK2,      'TK3': properties.Use_TK3,
+            'STD':      properties.Use_STD,      'STDF1': properties.Use_STDF1,
+            'STDF2':    properties.Use_STDF2,    'STC': properties.Use_STC,
+            'STCF1':    properties.Use_STCF1,    'STCF2': properties.Use_STCF2,
+            'STCtoSTD': properties.Use_STCtoSTD, 'STDtoSTC': properties.Use_STDtoSTC,
+            'MISC1':    properties.Use_MISC1,    'MISC2': properties.Use_MISC2,
+            'MISC3':    properties.Use_MISC3,    'MISC4': properties.Use_MISC4,
+            'MISC5':    properties.Use_MISC5,    'MISC6': properties.Use_MISC6,
+            'MISC7':    properties.Use_MISC7,    'MISC8': properties.Use_MISC8,
+            'MISC9':    properties.Use_MISC9,    'MISC10': properties.Use_MISC10,
+            'MISC11':   properties.Use_MISC11,   'MISC12': properties.Use_MISC12,
+            'MISC13':   properties.Use_MISC13,   'MISC14': properties.Use_MISC14,
+            'MISC15':   properties.Use_MISC15,   'MISC16': properties.Use_MISC16,
+            'MISC17':   properties.Use_MISC17,   'MISC18': properties.Use_MISC18,
+            'MISC19':   properties.Use_MISC19,   'MISC20': properties.Use_MISC20
+        }
+        self.animationWeaponFolderNames = {
+            'A': properties.Axe,     'B': properties.Bow,
+            'C': properties.Club,    'D': properties.Dagger,
+            'F': properties.Flail,   'H': properties.Halberd,
+            'M': properties.Mace,    'S': properties.Sword,
+            'W': properties.Warhammer, 'Q': properties.Quarterstaff,
+        }
+        self.animationWeaponToggles = {
+            'A': properties.Use_A,   'B': properties.Use_B,
+            'C': properties.Use_C,   'D': properties.Use_D,
+            'F': properties.Use_F,   'H': properties.Use_H,
+            'M': properties.Use_M,   'S': properties.Use_S,
+            'W': properties.Use_W,   'Q': properties.Use_Q,
+        }
+        self.animationArmorToggles = {
+            'ARMOR1': properties.Use_ARMOR1,   'ARMOR2': properties.Use_ARMOR2,
+            'ARMOR3': properties.Use_ARMOR3,   'ARMOR4': properties.Use_ARMOR4,
+        }
+        self.animationArmorFolderNames = {
+            'ARMOR1': properties.Armor1,   'ARMOR2': properties.Armor2,
+            'ARMOR3': properties.Armor3,   'ARMOR4': properties.Armor4,
+        }
+
+        # ----- Filename and path
+        # Retrieves the base save path from user input.
+        self.pathSaveAt                 = bpy.path.abspath(properties.Save_at)
+        # Combines prefix and resref for use in filename construction.
+        self.prefixResref               = properties.Prefix + properties.Resref
+        self.selectedType               = properties.Type
+        self.CreatureCollectionName     = properties.Creature
+        self.CreatureCollectionNameLP   = properties.Creature_Lower
+        layerCollections                = bpy.context.view_layer.layer_collection.children
+
+        # Checks if 'Object List' is selected with an object(armature/rig)
+        if (properties.Object_List is None):
+            raise ValueError(f"ERROR: Value in 'Object List' in step 1 is '{properties.Object_List}'! Perhaps no object is selected?")
+        objectCurrent = bpy.data.objects.get(properties.Object_List.name)
+        # Checks if any aniamtion exists.
+        if (objectCurrent is None or objectCurrent.animation_data is None):
+            raise ValueError(f"Object '{properties.Object_List.name}' has no animation data.")
+        # Checks if the lower part collection exists for the types which always render it.
+        if (self.selectedType in ['3000 mirror 0', '3000 mirror 1'] and self.CreatureCollectionNameLP not in layerCollections):
+            raise ValueError(f"Collection '{self.CreatureCollectionNameLP}' not found! Check if the name is spelled correctly, exists in the file, or is placed in the correct hierarchy.")
+
+        # The weapon and armor collections in view layer order, so the render order does not change.
+        self.weaponCollections  = []
+        self.armorCollections   = []
+        for collection in layerCollections:
+            # Finds the corresponding weapon or armor key for the collection name.
+            wovl  = next((key for key,value in self.animationWeaponFolderNames.items() if value == collection.name), None)
+            armor = next((key for key,value in self.animationArmorFolderNames.items() if value == collection.name), None)
+            # Checks if the collection corresponds to a recognized weapon/armor and if it is enabled for rendering.
+            if ( (wovl != None) and (self.animationWeaponToggles[wovl] == True) ):
+                self.weaponCollections.append((collection.name, wovl))
+            if ( (armor != None) and (self.animationArmorToggles[armor] == True) ):
+                self.armorCollections.append((collection.name, armor))
+
+        layerMethods = {
+            '0000':                                 self.layers0000,
+            '1000 monster quadrant':                self.layers1000_monster_quadrant,
+            '1000 monster multi split bams 0':      self.layers1000_quadrant,
+            '1000 monster multi split bams 1':      self.layers1000_monster_multi_sp1,
+            '1000 multi new split bams 0':          self.layers1000_quadrant,
+            '1000 multi new split bams 1':          self.layers1000_quadrant,
+            '2000':                                 self.layersWithWeapons,
+            '3000 mirror 0':                        self.layers3000,
+            '3000 mirror 1':                        self.layers3000,
+            '4000':                                 self.layersAnimationKey,
+            '5000/6000 character split bams 0':     self.layers5000and6000,
+            '5000/6000 character split bams 1':     self.layers5000and6000,
+            '5000/6000 character old':              self.layers5000and6000_old,
+            '7000 monster split bams 0':            self.layersWithWeapons,
+            '7000 monster split bams 1':            self.layersWithWeapons,
+            '7000 monster old':                     self.layersSequence,
+            '8000':                                 self.layersWithWeapons,
+            '9000':                                 self.layersSequence,
+            'A000':                                 self.layersSequence,
+            'B000':                                 self.layersSequence,
+            'C000':                                 self.layersSequence,
+            'D000':                                 self.layersAnimationKey,
+            'E000':                                 self.layersWithWeapons,
+            'F000':                                 self.layersF000,
+        }
+        layerMethod = layerMethods.get(self.selectedType)
+        if (layerMethod is None):
+            raise ValueError(f"ERROR: Animation type '{self.selectedType}' is not supported!")
+
+        folders = []
+        jobs    = []
+        # ----- Main/Outer loop
+        # Iterates through each defined animation which is enabled by the user.
+        for animationKey, animation in animationFolderNames.items():
+            if (animationToggles[animationKey] == False):
+                continue
+            # Checks if the action(animation) was found in this blender file.
+            action = bpy.data.actions.get(animation)
+            if (action is None):
+                raise ValueError(f"The action '{animation}' could not be found in the Blender file.")
+            # Checks if the animation is defined for the selected type.
+            sequences = self.sequences.get(self.selectedType)
+            if (sequences != None and animationKey not in sequences):
+                raise ValueError(f"ERROR: Animation '{animationKey}' is not defined for the type '{self.selectedType}'!")
+            positionKeys = [positionKey for positionKey, toggle in cameraPosToggles.items() if toggle == True]
+            if (len(positionKeys) == 0):
+                continue
+
+            # Constructs the base folder path for the current animation.
+            animation_folder    = os.path.join(self.pathSaveAt, "00-"+animation)
+            frames              = self.frames(context, action)
+
+            #  ----- Nested/Middle loop
+            # Iterates through each defined camera position/direction selected by the user.
+            for positionKey in positionKeys:
+                # Creates a subfolder for the specific angle/direction.
+                position_folder = os.path.join(animation_folder, cameraPosFolderNames[positionKey])
+                if(self.selectedType not in self.excludedAnimationTypes):
+                    folders += [animation_folder, position_folder]
+
+                #  ----- Nested/Inner loop
+                for frame in frames:
+                    for layer, layerKind, outputPaths in layerMethod(animationKey, animation, positionKey, position_folder, frame):
+                        jobs.append(IEAS_RenderJob(
+                            animationKey    = animationKey,
+                            animation       = animation,
+                            positionKey     = positionKey,
+                            angle           = self.cameraAngles[positionKey],
+                            frame           = frame,
+                            layer           = layer,
+                            layerKind       = layerKind,
+                            folder          = position_folder,
+                            outputPaths     = tuple(outputPaths),
+                        ))
+
+        jobs = self.deduplicate(jobs)
+        # The eastern sprites are still in the plan's BAM files, if they are mirrored instead of rendered.
+        bamFrames = self.bamFrames(jobs)
+        if (context.scene.IEAS_properties.Mirror_East == True):
+            jobs = self.mirrorEastern(jobs)
+        # Every output folder has to exist as well(e.g. weapon, armor and quadrant folders).
+        for job in jobs:
+            folders += [os.path.dirname(outputPath) for outputPath in job.filePaths()]
+
+        return IEAS_RenderPlan(
+            selectedType                = self.selectedType,
+            objectName                  = objectCurrent.name,
+            pathSaveAt                  = self.pathSaveAt,
+            CreatureCollectionName      = self.CreatureCollectionName,
+            CreatureCollectionNameLP    = self.CreatureCollectionNameLP,
+            folders                     = list(dict.fromkeys(folders)),
+            jobs                        = jobs,
+            bamFrames                   = bamFrames,
+        )
+
+    def frames(self, context, action):
+        """Returns the frame numbers of the action which will be rendered."""
+        # ----- Variables used in nested inner loop
+        frameStart      = bpy.context.scene.frame_start
+        # The end frame is converted to an integer to prevent rendering empty frames beyond the action's actual length.
+        frameEnd        = int(action.frame_range[1])
+        Every_X_Frame   = context.scene.IEAS_properties.Every_X_Frame
+
+        # Checks if every x frame is not too high.
+        if(Every_X_Frame > frameEnd):
+            raise ValueError(f"ERROR: Every x frame is with value '{Every_X_Frame}' too high. Fram end is '{frameEnd}'.")
+        # Negative frame start might be allowed in blender, but not in IE AutoSpriter.
+        if(frameStart <= 0):
+            raise ValueError(f"ERROR: Frame start is set as '{frameStart}'. IE AutoSpriter does not support zero or negative frame numbers.")
+
+        # ----- Calculates neccessary frame numbers.
+        numberOfFrames  = math.floor(frameEnd/Every_X_Frame)
+        AllFrames       = []
+        for frame in range(1,numberOfFrames+1):
+            calculatedFrame = (frame*Every_X_Frame) + (frameStart-1)
+            # This is necessary, otherwise the sprite names will be incorrect.
+            if calculatedFrame > frameEnd:
+                break
+            # This list contains frames which will be rendered.
+            AllFrames.append(calculatedFrame)
+        return AllFrames
+
+    def bamFrames(self, jobs):
+        """Returns the BAM files, cycles and frames of every creature sprite by its file path(see bamLayouts)."""
+        layout = self.bamLayouts.get(self.selectedType)
+        if (layout is None):
+            return {}
+        directions, easternDirection, sequence, actions = layout
+        layerCycles = self.bamLayerCycles.get(self.selectedType)
+        # The directions are counted clockwise from south, in steps of 22.5 degrees for the types with 9 or 16 directions.
+        step        = 22.5 if (directions > 8) else 45.0
+        bamFrames   = {}
+        for job in jobs:
+            if (layerCycles != None):
+                if (job.layerKind not in layerCycles):
+                    continue
+                slot = layerCycles[job.layerKind]
+            elif (job.layer != self.CreatureCollectionName or job.layerKind not in ('MAIN', 'QUADRANT') or job.animationKey not in actions):
+                continue
+            else:
+                slot = actions[job.animationKey]
+            angle = (360.0 - job.angle) % 360.0
+            # Directions between the ones of the type(e.g. south south west of an 8 direction type) are not in the file.
+            if (angle % step != 0.0 or round(angle / step) >= directions):
+                continue
+            direction = round(angle / step)
+            # A sprite can be part of two files, e.g. 'G13and14' of 7000 monster(split_bams = 1) is in G13 and G14.
+            parts   = (sequence if (sequence != None) else self.sequences[self.selectedType][job.animationKey]).split("and")
+            names   = [parts[0]] + [parts[0][:len(parts[0]) - len(part)] + part for part in parts[1:]]
+            suffix  = "E" if (easternDirection != None and direction >= easternDirection) else ""
+            cycle   = slot * directions + direction
+            # The quadrant sprites are numbered from 1 after the sequence.
+            for number, outputPath in enumerate(job.outputPaths):
+                quadrant = str(number + 1) if (job.layerKind == 'QUADRANT') else ""
+                bamFrames[outputPath] = [[f"{self.prefixResref}{name}{quadrant}{suffix}.BAM", cycle, job.frame] for name in names]
+        return bamFrames
+
+    def deduplicate(self, jobs):
+        """Removes jobs whose output files are all written again by a later job."""
+        # The last job wins, because it would have overwritten the files of the earlier one.
+        lastWriter = {}
+        for index, job in enumerate(jobs):
+            for outputPath in job.outputPaths:
+                lastWriter[outputPath] = index
+        return [job for index, job in enumerate(jobs) if any(lastWriter[outputPath] == index for outputPath in job.outputPaths)]
+
+    def mirrorEastern(self, jobs):
+        """Replaces the eastern jobs by mirroring the render of the western job with the same frame and layer."""
+        # The western direction is the eastern one mirrored at the south-north axis, e.g. east(90) and west(270).
+        positionKeys    = {angle: positionKey for positionKey, angle in self.cameraAngles.items()}
+        jobKey          = lambda job, positionKey: (job.animationKey, job.animation, positionKey, job.frame, job.layer, job.layerKind)
+        westernJobs     = {jobKey(job, job.positionKey): job for job in jobs if job.positionKey not in self.cameraEasternPositions}
+        mirrorPaths     = {}
+        remainingJobs   = []
+        for job in jobs:
+            if (job.positionKey in self.cameraEasternPositions):
+                westernKey  = jobKey(job, positionKeys[(360 - job.angle) % 360])
+                westernJob  = westernJobs.get(westernKey)
+                # An eastern job is only rendered if its western direction is not part of the plan.
+                if (westernJob != None and len(westernJob.outputPaths) == len(job.outputPaths)):
+                    mirrorPaths[westernKey] = job.outputPaths
+                    continue
+            remainingJobs.append(job)
+        return [replace(job, mirrorPaths=mirrorPaths.get(jobKey(job, job.positionKey), ())) for job in remainingJobs]
+
+    def fileName(self, name, positionKey, frame, eastern=False):
+        """Constructs the filename for the current sprite, including prefix, resref, position and padded frame number."""
+        if (eastern == True and positionKey in self.cameraEasternPositions):
+            name += "E"
+        return f"{self.prefixResref}{name}_{positionKey}_{str(frame).zfill(5)}.png"
+
+    def layersWeapons(self, name, animation, positionKey, frame, eastern=False):
+        """Returns the weapon layers where the name contains '{wovl}' as placeholder for the weapon identifier."""
+        layers = []
+        for collectionName, wovl in self.weaponCollections:
+            # Constructs the output folder path for the current weapon and camera angle.
+            weapon_position_folder = os.path.join(self.pathSaveAt, collectionName, animation, positionKey)
+            fileName = self.fileName(name.format(wovl=wovl), positionKey, frame, eastern)
+            layers.append((collectionName, 'WEAPON', [os.path.join(weapon_position_folder, fileName)]))
+        return layers
+
+    def layers0000(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the upper and lower part layers of type 0000."""
+        layers = [(self.CreatureCollectionName, 'UPPER', [os.path.join(position_folder, f"{self.prefixResref}_MAIN_{str(frame).zfill(5)}.png")])]
+        # ----- Setup for SECOND RENDER PASS: Lower Collection Part -----
+        if (self.CreatureCollectionNameLP in bpy.context.view_layer.layer_collection.children):
+            lowerpart_position_folder = os.path.join(self.pathSaveAt, self.CreatureCollectionNameLP, positionKey)
+            fileName = f"{self.prefixResref}_LOWER_{str(frame).zfill(5)}.png"
+            layers.append((self.CreatureCollectionNameLP, 'LOWER', [os.path.join(lowerpart_position_folder, fileName)]))
+        return layers
+
+    def layersQuadrants(self, name, divisor, positionKey, position_folder, frame, eastern=False):
+        """Returns the quadrant layer where the name contains '{number}' as placeholder for the quadrant number."""
+        outputPaths = []
+        for number in range(1, divisor*divisor+1):
+            fileName = self.fileName(name.format(number=number), positionKey, frame, eastern)
+            outputPaths.append(os.path.join(position_folder, f"Q{number}", fileName))
+        return [(self.CreatureCollectionName, 'QUADRANT', outputPaths)]
+
+    def layers1000_monster_quadrant(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the quadrant layer of type 1000 monster quadrant."""
+        sequence = self.sequences[self.selectedType][animationKey]  # Gets e.g. G1.
+        return self.layersQuadrants(f"{animationKey}{sequence}{{number}}", 2, positionKey, position_folder, frame, eastern=True)
+
+    def layers1000_quadrant(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the quadrant layer of type 1000 monster multi(split_bams = 0) and multi new."""
+        sequence = self.sequences[self.selectedType][animationKey]  # Gets e.g. G1.
+        return self.layersQuadrants(f"{animationKey}{sequence}{{number}}", 2, positionKey, position_folder, frame)
+
+    def layers1000_monster_multi_sp1(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the quadrant layer of type 1000 monster multi(split_bams = 1)."""
+        sequence = self.sequences[self.selectedType][animationKey]  # Gets e.g. G1.
+        if (positionKey not in self.directions1000):
+            raise ValueError(f"ERROR: Direction '{positionKey}' is not supported by the type '{self.selectedType}'!")
+        direction = self.directions1000[positionKey]
+        return self.layersQuadrants(f"{animationKey}{sequence}{{number}}{direction}", 3, positionKey, position_folder, frame)
+
+    def layersWithWeapons(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the creature and weapon layers of the types 2000, 7000(split_bams = 0/1), 8000 and E000."""
+        sequence = self.sequences.get(self.selectedType, {}).get(animationKey, "")  # Gets e.g. G1.
+        # The weapon identifier(wovl) is placed differently by each type.
+        names = {
+            '2000':                         (f"{animationKey}{sequence}",   f"{{wovl}}{animationKey}{sequence}",    True),
+            '7000 monster split bams 0':    (f"{animationKey}{sequence}",   f"{sequence}{{wovl}}{animationKey}",    False),
+            '7000 monster split bams 1':    (f"{animationKey}{sequence}",   f"{animationKey}{sequence}{{wovl}}",    False),
+            '8000':                         (f"{animationKey}{sequence}",   f"{{wovl}}{animationKey}{sequence}",    True),
+            'E000':                         (f"{animationKey}",             f"{{wovl}}{animationKey}",              True),
+        }
+        name, weaponName, eastern = names[self.selectedType]
+        layers = [(self.CreatureCollectionName, 'MAIN', [os.path.join(position_folder, self.fileName(name, positionKey, frame, eastern))])]
+        return layers + self.layersWeapons(weaponName, animation, positionKey, frame, eastern)
+
+    def layers3000(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the upper and lower part layers of type 3000."""
+        sequence = self.sequences[self.selectedType][animationKey]  # Gets e.g. G1.
+        eastern  = (self.selectedType == '3000 mirror 0')
+        lowerpart_position_folder = os.path.join(self.pathSaveAt, self.CreatureCollectionNameLP, animation, positionKey)
+        return [
+            (self.CreatureCollectionName,   'UPPER', [os.path.join(position_folder, self.fileName(f"{animationKey}{sequence}", positionKey, frame, eastern))]),
+            (self.CreatureCollectionNameLP, 'LOWER', [os.path.join(lowerpart_position_folder, self.fileName(f"D{animationKey}{sequence}", positionKey, frame, eastern))]),
+        ]
+
+    def layersAnimationKey(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the creature layer of the types 4000 and D000."""
+        return [(self.CreatureCollectionName, 'MAIN', [os.path.join(position_folder, self.fileName(animationKey, positionKey, frame))])]
+
+    def layersSequence(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the creature layer of the types 7000 monster old, 9000, A000, B000 and C000."""
+        sequence = self.sequences[self.selectedType][animationKey]  # Gets e.g. G1.
+        return [(self.CreatureCollectionName, 'MAIN', [os.path.join(position_folder, self.fileName(f"{animationKey}{sequence}", positionKey, frame, eastern=True))])]
+
+    def layersF000(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the creature layer of type F000."""
+        fileName = f"{self.prefixResref}_PST_{animationKey}_{str(frame).zfill(5)}.png"
+        return [(self.CreatureCollectionName, 'MAIN', [os.path.join(position_folder, fileName)])]
+
+    def layers5000and6000(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the armor layers of type 5000/6000 character(split_bams = 0/1)."""
+        sequence = self.sequences[self.selectedType][animationKey]  # Gets e.g. G1.
+        layers   = []
+        # ----- For no armor type(only the creature collection is rendered)
+        if(self.animationArmorToggles['ARMOR1'] == True):
+            armor = self.animationArmorFolderNames['ARMOR1']
+            name  = f"{armor}{animationKey}{sequence}" if (sequence != animationKey) else f"{armor}{sequence}"
+            armor_position_folder = os.path.join(self.pathSaveAt, armor, animation, positionKey)
+            layers.append((self.CreatureCollectionName, 'MAIN', [os.path.join(armor_position_folder, self.fileName(name, positionKey, frame))]))
+        # ----- For any other armor type
+        for collectionName, armor in self.armorCollections:
+            armor = self.animationArmorFolderNames[armor]
+            name  = f"{armor}{animationKey}{sequence}" if (sequence != animationKey) else f"{armor}{sequence}"
+            armor_position_folder = os.path.join(self.pathSaveAt, collectionName, animation, positionKey)
+            layers.append((collectionName, 'ARMOR', [os.path.join(armor_position_folder, self.fileName(name, positionKey, frame))]))
+        return layers
+
+    def layers5000and6000_old(self, animationKey, animation, positionKey, position_folder, frame):
+        """Returns the armor layers of type 5000/6000 character old."""
+        sequence = self.sequences[self.selectedType][animationKey]  # Gets e.g. G1.
+        # Prepares for simple if conditions
+        isNotWK2Position = positionKey not in (self.positionKeysWK2East + self.positionKeysWK2)
+        layers = []
+        # ----- For no armor type(only the creature collection is rendered)
+        if(self.animationArmorToggles['ARMOR1'] == True):
+            armor = self.animationArmorFolderNames['ARMOR1']
+            name  = None
+            # If statement order is important!
+            if(sequence == 'W2'):
+                if (positionKey in self.positionKeysWK2):
+                    name = f"{armor}{sequence}"
+                elif (positionKey in self.positionKeysWK2East):
+                    name = f"{armor}{sequence}E"
+            elif(sequence != animationKey and isNotWK2Position):
+                name = self.eastern(f"{armor}{animationKey}{sequence}", positionKey)
+            elif(sequence == animationKey and isNotWK2Position):
+                name = self.eastern(f"{armor}{sequence}", positionKey)
+            # A valid file name is found.
+            if (name != None):
+                armor_position_folder = os.path.join(self.pathSaveAt, armor, animation, positionKey)
+                layers.append((self.CreatureCollectionName, 'MAIN', [os.path.join(armor_position_folder, self.fileName(name, positionKey, frame))]))
+        # ----- For any other armor type
+        for collectionName, armor in self.armorCollections:
+            armor = self.animationArmorFolderNames[armor]
+            name  = f"{armor}{animationKey}{sequence}" if (sequence != animationKey) else f"{armor}{sequence}"
+            armor_position_folder = os.path.join(self.pathSaveAt, collectionName, animation, positionKey)
+            layers.append((collectionName, 'ARMOR', [os.path.join(armor_position_folder, self.fileName(name, positionKey, frame, eastern=True))]))
+        return layers
+
+    def eastern(self, name, positionKey):
+        """Appends the eastern suffix 'E' to the name if the position is an eastern one."""
+        return name + "E" if (positionKey in self.cameraEasternPositions) else name
+
+
+# --------
+# Purpose:
+# --------
+# Contains the finished render jobs of an output folder, so an interrupted render can be resumed.
+# Each line of the manifest(JSON Lines) describes one written file and the inputs which produced it.
+# Lines are only appended, so several render processes can share the manifest.
+# -------------------------------------------------------------------------------------------------
+class IEAS_RenderManifest():
+    """Contains methods for recording and verifying finished render jobs"""
+    fileName = "ieas_manifest.jsonl"
+
+    def __init__(self, pathSaveAt):
+        self.filePath   = os.path.join(pathSaveAt, self.fileName)
+        self.entries    = {}
+
+    def load(self):
+        """Reads the manifest. A later entry of the same output path replaces the earlier one."""
+        self.entries = {}
+        if os.path.exists(self.filePath):
+            with open(self.filePath, 'r', encoding='utf-8') as manifestFile:
+                for line in manifestFile:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # An interrupted render can leave an incomplete last line.
+                        continue
+                    self.entries[entry['outputPath']] = entry
+        return self
+
+    def inputs(self, job:IEAS_RenderJob):
+        """Returns the inputs which produce the files of the job."""
+        inputs = {'animation': job.animation, 'positionKey': job.positionKey, 'frame': job.frame, 'layer': job.layer}
+        # Only mirrored jobs get the key, so entries of rendered jobs stay the same as before.
+        if (len(job.mirrorPaths) > 0):
+            inputs['mirrored'] = True
+        return inputs
+
+    def checksum(self, filePath):
+        """Returns the SHA-256 checksum of the file."""
+        with open(filePath, 'rb') as checkedFile:
+            return hashlib.sha256(checkedFile.read()).hexdigest()
+
+    def isDone(self, job:IEAS_RenderJob):
+        """Returns True if every file of the job exists and matches its manifest entry."""
+        for outputPath in job.filePaths():
+            entry = self.entries.get(outputPath)
+            if (entry is None or entry['inputs'] != self.inputs(job)):
+                return False
+            if (not os.path.exists(outputPath) or os.path.getsize(outputPath) != entry['size']):
+                return False
+            if (self.checksum(outputPath) != entry['sha256']):
+                return False
+        return True
+
+    def isRecorded(self, job:IEAS_RenderJob):
+        """Returns True if every file of the job exists and has a manifest entry, without comparing the checksums."""
+        return all(outputPath in self.entries and os.path.exists(outputPath) for outputPath in job.filePaths())
+
+    def record(self, jobs):
+        """Appends an entry for every written file of the jobs."""
+        lines = []
+        for job in jobs:
+            for outputPath in job.filePaths():
+                # A missing file is not recorded, so the job is rendered again when resuming.
+                if not os.path.exists(outputPath):
+                    continue
+                entry = {
+                    'outputPath':   outputPath,
+                    'size':         os.path.getsize(outputPath),
+                    'sha256':       self.checksum(outputPath),
+                    'inputs':       self.inputs(job),
+                }
+                lines.append(json.dumps(entry) + "\n")
+        # One write per frame keeps the lines of parallel processes apart.
+        with open(self.filePath, 'a', encoding='utf-8') as manifestFile:
+            manifestFile.write("".join(lines))
+
+
+# --------
+# Purpose:
+# --------
+# Contains the content hashes of the last finished render, so only changed sprites are rendered again.
+# Each action and layer(collection) combination gets a hash of the action's F-curves, the render settings
+# and the objects of the layer and creature collections. The hashes are saved next to the sprites.
+# -------------------------------------------------------------------------------------------------------
+class IEAS_RenderHashes():
+    """Contains methods for detecting which action and layer combinations changed since the last render"""
+    fileName = "ieas_hashes.json"
+
+    def __init__(self, pathSaveAt):
+        self.filePath   = os.path.join(pathSaveAt, self.fileName)
+        self.stored     = {}
+
+    def load(self):
+        """Reads the hashes of the last finished render."""
+        self.stored = {}
+        if os.path.exists(self.filePath):
+            try:
+                with open(self.filePath, 'r', encoding='utf-8') as hashFile:
+                    self.stored = json.load(hashFile)
+            except ValueError:
+                # A damaged file is treated like a missing one, so everything is rendered again.
+                self.stored = {}
+        return self
+
+    def save(self, hashes):
+        """Adds the hashes of a finished render to the stored ones and writes them."""
+        for animation, layers in hashes.items():
+            self.stored.setdefault(animation, {}).update(layers)
+        # Writes into a temporary file first, so an interrupted write does not damage the old hashes.
+        tempPath = self.filePath + ".tmp"
+        with open(tempPath, 'w', encoding='utf-8') as hashFile:
+            json.dump(self.stored, hashFile, indent=1)
+        os.replace(tempPath, self.filePath)
+
+    def digest(self, *values):
+        """Returns the SHA-256 hash of the given values."""
+        return hashlib.sha256(repr(values).encode('utf-8')).hexdigest()
+
+    def actionHash(self, action):
+        """Returns the hash of the action's frame range and F-curves."""
+        digest = hashlib.sha256(repr(tuple(action.frame_range)).encode('utf-8'))
+        for fcurve in action.fcurves:
+            digest.update(f"{fcurve.data_path}[{fcurve.array_index}]{fcurve.extrapolation}{fcurve.mute}".encode('utf-8'))
+            points = fcurve.keyframe_points
+            # Two values(frame, value) per keyframe for each attribute.
+            values = np.empty(len(points)*2, dtype=np.float32)
+            for attribute in ('co', 'handle_left', 'handle_right'):
+                points.foreach_get(attribute, values)
+                digest.update(values.tobytes())
+            digest.update("".join(f"{point.interpolation}{point.easing}" for point in points).encode('utf-8'))
+            digest.update("".join(f"{modifier.type}{modifier.mute}" for modifier in fcurve.modifiers).encode('utf-8'))
+        return digest.hexdigest()
+
+    def settingsHash(self):
+        """Returns the hash of every scene setting which changes the rendered image."""
+        scene       = bpy.context.scene
+        render      = scene.render
+        settings    = [
+            render.engine, render.resolution_x, render.resolution_y, render.resolution_percentage,
+            render.film_transparent, render.dither_intensity,
+            render.image_settings.file_format, render.image_settings.color_mode,
+            render.image_settings.color_depth, render.image_settings.compression,
+            scene.view_settings.view_transform, scene.view_settings.look,
+            scene.view_settings.exposure, scene.view_settings.gamma,
+            # Samples of both engines, because the settings of a disabled render engine might not exist.
+            getattr(getattr(scene, 'eevee', None), 'taa_render_samples', None),
+            getattr(getattr(scene, 'cycles', None), 'samples', None),
+        ]
+        camera = scene.camera
+        if (camera != None):
+            settings += [
+                camera.name, [list(row) for row in camera.matrix_world],
+                camera.data.type, camera.data.lens, camera.data.ortho_scale,
+                camera.data.clip_start, camera.data.clip_end, camera.data.shift_x, camera.data.shift_y,
+            ]
+        return self.digest(*settings)
+
+    def collectionHash(self, collectionName):
+        """Returns the hash of the objects in the collection."""
+        layerCollection = bpy.context.view_layer.layer_collection.children.get(collectionName)
+        if (layerCollection is None):
+            return None
+        return self.digest(sorted((obj.name, obj.type) for obj in layerCollection.collection.all_objects))
+
+    def compute(self, plan:IEAS_RenderPlan):
+        """Returns the current hashes of every action and layer combination of the plan."""
+        settings        = self.settingsHash()
+        # Mirrored eastern sprites differ slightly from rendered ones(e.g. lighting), so changing the mode renders again.
+        mirrored        = ('mirrored',) if any(len(job.mirrorPaths) > 0 for job in plan.jobs) else ()
+        creature        = self.collectionHash(plan.CreatureCollectionName)
+        actionHashes    = {}
+        layerHashes     = {}
+        hashes          = {}
+        for job in plan.jobs:
+            if (job.animation not in actionHashes):
+                actionHashes[job.animation] = self.actionHash(bpy.data.actions[job.animation])
+            if (job.layer not in layerHashes):
+                layerHashes[job.layer] = self.collectionHash(job.layer)
+            hashes.setdefault(job.animation, {})[job.layer] = self.digest(
+                plan.selectedType, settings, *mirrored, creature, actionHashes[job.animation], layerHashes[job.layer])
+        return hashes
+
+    def isUnchanged(self, job:IEAS_RenderJob, hashes):
+        """Returns True if the job's action and layer did not change and all its files exist."""
+        storedHash = self.stored.get(job.animation, {}).get(job.layer)
+        if (storedHash is None or storedHash != hashes[job.animation][job.layer]):
+            return False
+        return all(os.path.exists(outputPath) for outputPath in job.filePaths())
+
+
+# --------
+# Purpose:
+# --------
+# Executes a compiled render plan(see IEAS_RenderPlan) job by job.
+# The scene is only changed when the action, direction or frame of the next job differs from the current one.
+# ---------------------------------------------------------------------------------------------------------
+class IEAS_RenderPlanExecutor():
+    """Contains methods for executing a compiled render plan"""
+
+    # Animation types which prepare the collections before the first render.
+    excludeTypes = [    '0000', '2000', '3000 mirror 0', '3000 mirror 1',
+                        '5000/6000 character split bams 0', '5000/6000 character split bams 1',
+                        '5000/6000 character old',
+                        '7000 monster split bams 0', '7000 monster split bams 1', '8000', 'E000']
+    # Animation types which only render the creature, so the frames of a direction can be one animation render.
+    animationRenderTypes = ['4000', '7000 monster old', '9000', 'A000', 'B000', 'C000', 'D000', 'F000']
+    # The index '2' corresponds to the Z-axis in Blender's rotation_euler tuple.
+    axis_Z = 2
+
+    def __init__(self, plan:IEAS_RenderPlan, resume=False, incremental=False, saveHashes=True, order='AUTO', weaponPass=False,
+                 armorLayers=False, hideRender=False, directionGrid=False, frameGrid=False, cameraOrbit=False,
+                 animationRender=False, vertexCache=False, staticFrames=False, staticTolerance=0.0001,
+                 tileExtent=False, fastPng=False, recompressPng=False, postThreads=0, bamOutput='NONE', pvrzSize=1024,
+                 pvrzBase=1000):
+        self.plan           = plan
+        # The options which cannot be used with this scene, they are reported by the operator(see IEAS_OT_Final).
+        self.warnings       = []
+        self.manifest       = IEAS_RenderManifest(plan.pathSaveAt).load()
+        self.hashes         = IEAS_RenderHashes(plan.pathSaveAt).load()
+        self.currentHashes  = self.hashes.compute(plan)
+        # Parallel render processes do not save the hashes, because each one renders only a part of the plan.
+        self.saveHashes     = saveHashes
+        # Resuming skips every job whose files are already written and unchanged.
+        # Incremental rendering skips every job whose action and layer did not change since the last finished render.
+        self.jobs           = [job for job in plan.jobs if not ( (resume and self.manifest.isDone(job)) or
+                                                                 (incremental and self.hashes.isUnchanged(job, self.currentHashes)) )]
+        self.jobsSkipped    = len(plan.jobs) - len(self.jobs)
+        animationTypes      = IEAS_AnimationTypes()
+        self.animationTypes = animationTypes
+        animationTypes.visibility = IEAS_VisibilityState(hideRender)
+        animationTypes.tileExtent = tileExtent
+        # Layer collections which are shown and hidden for single layer renders(see IEAS_VisibilityState).
+        self.layerNames     = list(dict.fromkeys(job.layer for job in self.jobs if job.layerKind in ('LOWER', 'WEAPON', 'ARMOR')))
+        # Layer-major order renders every layer on its own, so the layers of a frame cannot be combined.
+        combineLayers       = (order != 'LAYER')
+        # All weapon layers of a frame are rendered at once, if the plan has weapon layers.
+        weaponLayers        = list(dict.fromkeys(job.layer for job in self.jobs if job.layerKind == 'WEAPON'))
+        if (weaponPass == True and combineLayers == True and len(weaponLayers) > 1):
+            animationTypes.weaponPass = IEAS_WeaponPass(weaponLayers, plan.pathSaveAt, animationTypes.pixelBridge)
+        # The armor layers are composited over the creature layer, if the plan has armor layers.
+        if (armorLayers == True and combineLayers == True and any(job.layerKind == 'ARMOR' for job in self.jobs)):
+            animationTypes.armorLayers = IEAS_ArmorLayers(animationTypes.pixelBridge, animationTypes.imagePool)
+        # The sprites are written with a low compression while rendering(see IEAS_PngEncoder and begin).
+        self.fastPng        = fastPng
+        if (fastPng == True):
+            unsupported = IEAS_PngEncoder.unsupported(bpy.context.scene)
+            if (unsupported != None):
+                self.warnings.append(f"WARNING: The sprites are saved by Blender with a low compression, because {unsupported}!")
+            else:
+                animationTypes.pngEncoder = IEAS_PngEncoder(animationTypes.pixelBridge)
+                if (animationTypes.armorLayers != None):
+                    animationTypes.armorLayers.saveRender = animationTypes.saveRender
+        # The encoder writes the sprites in worker threads while the next frame is rendered(see IEAS_PostProcessor).
+        if (postThreads > 0):
+            if (animationTypes.pngEncoder is None):
+                self.warnings.append("WARNING: The sprites are saved in the render step, because only the fast PNG files can be written by threads!")
+            else:
+                animationTypes.postProcessor = IEAS_PostProcessor(postThreads)
+        # Jobs whose files are still written by the worker threads, with the number of tasks which write them(see recordJobs).
+        self.pendingJobs    = []
+        # The files of every rendered and copied job are made smaller after the render(see IEAS_PngRecompressor and end).
+        self.recompressPng  = recompressPng
+        self.recompressor   = None
+        self.writtenJobs    = []
+        # The creature sprites are written as BAM files after a finished render(see IEAS_BamWriter, IEAS_BamV2Writer and end).
+        self.bamOutput      = bamOutput
+        if (bamOutput != 'NONE' and IEAS_RenderPlanCompiler.bamUnsupported(plan.selectedType) != None):
+            raise ValueError(f"ERROR: No BAM files can be written, because {IEAS_RenderPlanCompiler.bamUnsupported(plan.selectedType)}!")
+        self.pvrzSize       = pvrzSize
+        self.pvrzBase       = pvrzBase
+        # The writer of the finished render, its timing is part of the executor's(see timing).
+        self.bamWriter      = None
+        self.bamWarnings    = []
+        # Several creature sprites are rendered at once(see IEAS_TileGrid). The frame grid also renders different
+        # directions, so it is used if both are set.
+        directions  = len(set(job.positionKey for job in self.jobs if job.layerKind == 'MAIN'))
+        sprites     = max([sum(1 for job in self.jobs if job.layerKind == 'MAIN' and job.animation == animation)
+                           for animation in set(job.animation for job in self.jobs)] + [0])
+        if ( (frameGrid == True and sprites > 1) or (directionGrid == True and directions > 1) ):
+            unsupported = IEAS_TileGrid.unsupported(bpy.context.scene)
+            if (unsupported is None and frameGrid == True and sprites > 1):
+                unsupported = IEAS_FrameGrid.unsupported(plan.CreatureCollectionName, plan.objectName)
+            if (unsupported != None):
+                self.warnings.append(f"WARNING: Every sprite is rendered on its own, because {unsupported}!")
+            elif (frameGrid == True and sprites > 1):
+                # The number of tiles depends on the resolution and the largest image of the render engine.
+                tiles = min(sprites, IEAS_TileGrid.maxTiles(bpy.context.scene))
+                animationTypes.grid = IEAS_FrameGrid(plan.CreatureCollectionName, plan.objectName, tiles, animationTypes.pixelBridge)
+            else:
+                animationTypes.grid = IEAS_DirectionGrid(plan.CreatureCollectionName, plan.objectName, directions,
+                                                         animationTypes.pixelBridge)
+        # The directions are changed by switching cameras instead of rotating the object(see IEAS_CameraOrbit).
+        # The grids place rotated copies of the creature in front of the scene camera, so they rotate the object.
+        self.cameraOrbit = None
+        angles = sorted(set(job.angle for job in self.jobs))
+        if (cameraOrbit == True and len(angles) > 1):
+            if (animationTypes.grid != None):
+                unsupported = "the sprites are rendered as grids"
+            else:
+                unsupported = IEAS_CameraOrbit.unsupported(bpy.context.scene, plan.objectName)
+            if (unsupported != None):
+                self.warnings.append(f"WARNING: The object is rotated for every direction, because {unsupported}!")
+            else:
+                self.cameraOrbit = IEAS_CameraOrbit(plan.objectName, angles)
+        handlers = {
+            '0000':                                 animationTypes.type0000,
+            '1000 monster quadrant':                animationTypes.type1000_monster_quadrant,
+            '1000 monster multi split bams 0':      animationTypes.type1000_monster_multi_sp0,
+            '1000 monster multi split bams 1':      animationTypes.type1000_monster_multi_sp1,
+            '1000 multi new split bams 0':          animationTypes.type1000_multi_new_sp0,
+            '1000 multi new split bams 1':          animationTypes.type1000_multi_new_sp1,
+            '2000':                                 animationTypes.type2000,
+            '3000 mirror 0':                        animationTypes.type3000_mirror0,
+            '3000 mirror 1':                        animationTypes.type3000_mirror1,
+            '4000':                                 animationTypes.type4000,
+            '5000/6000 character split bams 0':     animationTypes.type5000and6000_character_sp0,
+            '5000/6000 character split bams 1':     animationTypes.type5000and6000_character_sp1,
+            '5000/6000 character old':              animationTypes.type5000and6000_character_old,
+            '7000 monster split bams 0':            animationTypes.type7000_monster_sp0,
+            '7000 monster split bams 1':            animationTypes.type7000_monster_sp1,
+            '7000 monster old':                     animationTypes.type7000_monster_old,
+            '8000':                                 animationTypes.type8000,
+            '9000':                                 animationTypes.type9000,
+            'A000':                                 animationTypes.typeA000,
+            'B000':                                 animationTypes.typeB000,
+            'C000':                                 animationTypes.typeC000,
+            'D000':                                 animationTypes.typeD000,
+            'E000':                                 animationTypes.typeE000,
+            'F000':                                 animationTypes.typeF000,
+        }
+        # Get the method from the dictionary, defaulting to a general handler if not found
+        self.handler        = handlers.get(plan.selectedType, animationTypes.typeNone)
+        self.typeParameters = IEAS_AnimationTypesParameters(
+            exclude                     = True,
+            CreatureCollectionName      = plan.CreatureCollectionName,
+            CreatureCollectionNameLP    = plan.CreatureCollectionNameLP,
+            jobs                        = [],
+        )
+        # The mesh deformation of every action is baked before rendering(see IEAS_VertexCache). The copies of the frame
+        # grid play the action with a time offset, which the cache files of the scene frame do not have.
+        self.vertexCache = None
+        if (vertexCache == True):
+            if isinstance(animationTypes.grid, IEAS_FrameGrid):
+                self.warnings.append("WARNING: The mesh deformation is not baked, because the frames are rendered as grids!")
+            else:
+                frames = {}
+                for job in self.jobs:
+                    frames.setdefault(job.animation, set()).add(job.frame)
+                self.vertexCache = IEAS_VertexCache(plan.objectName, plan.pathSaveAt,
+                                                    {animation: sorted(frames[animation]) for animation in frames})
+        # The frames of a direction are rendered as one animation(see IEAS_AnimationTypes.renderAnimation).
+        # The grids already render several frames at once, so they are used if both are set.
+        self.animationRender = (animationRender == True and plan.selectedType in self.animationRenderTypes
+                                and animationTypes.grid is None)
+        self.animationFolder = os.path.join(plan.pathSaveAt, f"temp{os.getpid()}")
+        # Frames with the same pose as the previous rendered frame are copied(see IEAS_StaticFrames and begin).
+        self.staticFrames   = IEAS_StaticFrames(plan.objectName, staticTolerance) if (staticFrames == True) else None
+        # The copied jobs of each rendered job by the id of the rendered job.
+        self.staticCopies   = {}
+        self.jobsCopied     = 0
+        # The frames of a direction are next to each other only in direction-major order.
+        if (self.animationRender == True and order == 'AUTO'):
+            order = 'DIRECTION'
+        self.requestedOrder = order
+        self.groupJobs()
+        self.groupsDone = 0
+        self.jobsDone   = 0
+        # The parts of the scene which begin has changed so far, so end restores only these after a failed begin.
+        self.begun      = set()
+        # Render time in seconds of every group and of the groups rendered right after a direction change(see timing).
+        self.frameTimes     = []
+        self.directionTimes = []
+        # Number of frame and direction changes of the scene(see step).
+        self.frameChanges   = 0
+        self.angleChanges   = 0
+        # Number of renders with several sprites(see IEAS_TileGrid) and of animation renders.
+        self.gridRenders        = 0
+        self.animationRenders   = 0
+        # Quadrant sprites, armor layers and grids use the rendered pixels, which are read from a compositor Viewer node.
+        self.useViewer  = (any(job.layerKind == 'QUADRANT' or len(job.mirrorPaths) > 0 for job in self.jobs)
+                           or (animationTypes.armorLayers != None) or (animationTypes.grid != None)
+                           or (animationTypes.pngEncoder != None))
+
+    @classmethod
+    def fromProperties(cls, plan:IEAS_RenderPlan, properties, **options):
+        """Creates an executor with the render options of the IE AutoSpriter properties(see IEAS_PGT_Inputs)."""
+        options.setdefault('resume',        properties.Resume)
+        options.setdefault('incremental',   properties.Incremental)
+        options.setdefault('order',         properties.Order)
+        options.setdefault('weaponPass',    properties.Weapon_Pass)
+        options.setdefault('armorLayers',   properties.Armor_Layers)
+        options.setdefault('hideRender',    properties.Hide_Render)
+        options.setdefault('directionGrid', properties.Direction_Grid)
+        options.setdefault('frameGrid',     properties.Frame_Grid)
+        options.setdefault('cameraOrbit',   properties.Camera_Orbit)
+        options.setdefault('animationRender', properties.Animation_Render)
+        options.setdefault('vertexCache',   properties.Vertex_Cache)
+        options.setdefault('staticFrames',  properties.Static_Frames)
+        options.setdefault('staticTolerance', properties.Static_Tolerance)
+        options.setdefault('tileExtent',    properties.Tile_Extent)
+        options.setdefault('fastPng',       properties.Fast_Png)
+        options.setdefault('recompressPng', properties.Recompress_Png)
+        options.setdefault('postThreads',   properties.Post_Threads)
+        options.setdefault('bamOutput',     properties.Bam_Output)
+        options.setdefault('pvrzSize',      int(properties.Pvrz_Size))
+        options.setdefault('pvrzBase',      properties.Pvrz_Base)
+        return cls(plan, **options)
+
+    def groupJobs(self):
+        """Groups the jobs of the same animation, direction and frame, which are rendered by one handler call, and sorts them."""
+        self.groups = []
+        for job in self.jobs:
+            if (len(self.groups) > 0 and self.groupKey(self.groups[-1][0]) == self.groupKey(job)):
+                self.groups[-1].append(job)
+            else:
+                self.groups.append([job])
+        self.order = self.sortGroups(self.requestedOrder)
+
+    def groupKey(self, job:IEAS_RenderJob):
+        """Returns the scene state(animation, direction and frame) which is needed by the job."""
+        return (job.animation, job.positionKey, job.frame)
+
+    def sortGroups(self, order):
+        """Sorts the groups into the given order('AUTO', 'FRAME', 'DIRECTION' or 'LAYER') and returns the used order."""
+        # The plan renders every frame of an animation for one direction before the next direction(direction-major).
+        # Frame-major renders all directions of a frame before the next frame, so each pose is evaluated only once.
+        if (order == 'AUTO'):
+            directions = {}
+            for group in self.groups:
+                directions.setdefault((group[0].animation, group[0].frame), set()).add(group[0].positionKey)
+            # Frame-major only helps if a frame is rendered in more than one direction.
+            order = 'FRAME' if any(len(positionKeys) > 1 for positionKeys in directions.values()) else 'DIRECTION'
+        if (order == 'FRAME'):
+            # Keeps the animation order of the plan. The sort is stable, so the directions of a frame keep the plan order.
+            animations = {}
+            for group in self.groups:
+                animations.setdefault(group[0].animation, len(animations))
+            self.groups.sort(key=lambda group: (animations[group[0].animation], group[0].frame))
+        if (order == 'LAYER'):
+            # Renders one layer(creature, weapon A, weapon B, ...) for every frame and direction of an animation
+            # before the next layer, so each layer collection is shown and hidden only once per animation.
+            animations  = {}
+            layers      = {}
+            for group in self.groups:
+                animations.setdefault(group[0].animation, len(animations))
+                for job in group:
+                    layers.setdefault(job.layer, len(layers))
+            self.groups = [[job] for group in self.groups for job in group]
+            self.groups.sort(key=lambda group: (animations[group[0].animation], layers[group[0].layer]))
+        return order
+
+    def gridGroups(self):
+        """Returns the next groups which only render the creature and can be tiles of the same grid render."""
+        # The direction grid needs frame-major order, otherwise the directions of a frame are not next to each other.
+        # The frame grid renders every frame and direction of the same animation.
+        grid    = self.animationTypes.grid
+        first   = self.groups[self.groupsDone][0]
+        groups  = []
+        for group in self.groups[self.groupsDone : self.groupsDone + grid.tiles]:
+            job = group[0]
+            if (len(group) != 1 or job.layerKind != 'MAIN' or job.animation != first.animation):
+                break
+            if (isinstance(grid, IEAS_DirectionGrid) and job.frame != first.frame):
+                break
+            groups.append(group)
+        return groups
+
+    def animationGroups(self):
+        """Returns the next groups which only render the creature in evenly spaced frames of the same action and direction."""
+        first   = self.groups[self.groupsDone][0]
+        groups  = []
+        for group in self.groups[self.groupsDone:]:
+            job = group[0]
+            # Mirrored sprites need the pixels of every frame, which an animation render does not provide.
+            if (len(group) != 1 or job.layerKind != 'MAIN' or len(job.mirrorPaths) > 0
+                or job.animation != first.animation or job.angle != first.angle):
+                break
+            # Skipped frames(e.g. by resuming) end the range, because Blender renders every frame_step frame.
+            if (len(groups) > 1 and job.frame - groups[-1][0].frame != groups[1][0].frame - first.frame):
+                break
+            if (len(groups) == 1 and job.frame <= first.frame):
+                break
+            groups.append(group)
+        return groups
+
+    def endGrid(self):
+        """Stops rendering with grids, so every further sprite is rendered on its own."""
+        self.animationTypes.grid.end()
+        self.animationTypes.grid = None
+
+    def legacyVisibilityChanges(self):
+        """Returns the number of visibility changes if every frame shows and hides its layers again."""
+        # Each layer render changed the collections before and after it, weapons also the creature's 'holdout' per frame.
+        changes         = sum({'UPPER': 2, 'LOWER': 3, 'WEAPON': 2, 'ARMOR': 2}.get(job.layerKind, 0) for job in self.jobs)
+        weaponFrames    = set(self.groupKey(job) for job in self.jobs if job.layerKind == 'WEAPON')
+        return changes + 2 * len(weaponFrames)
+
+    def begin(self):
+        """Prepares collections and folders and stores the object and collection state which is restored by end."""
+        self.object = bpy.data.objects[self.plan.objectName]
+        # Stores the object's initial Z-axis rotation and action to be restored at the end.
+        self.originalRotation   = self.object.rotation_euler[self.axis_Z]
+        self.originalAction     = self.object.animation_data.action
+        # Stores the initial visibility of every top-level collection to be restored at the end.
+        self.originalCollections = {
+            collection.name: (collection.exclude, collection.holdout, collection.collection.hide_render)
+            for collection in bpy.context.view_layer.layer_collection.children
+        }
+        self.begun.add('object')
+        self.currentAnimation   = None
+        self.currentAngle       = None
+        self.currentFrame       = None
+        # The files which Blender still writes(e.g. weapon pass and animation renders) also get the low compression.
+        imageSettings = bpy.context.scene.render.image_settings
+        self.originalCompression = imageSettings.compression
+        self.begun.add('compression')
+        if (self.fastPng == True):
+            imageSettings.compression = min(imageSettings.compression, IEAS_PngEncoder.fastCompression)
+        # The encoder gets the output settings as plain values, so its worker threads never use the Blender API.
+        if (self.animationTypes.pngEncoder != None):
+            self.animationTypes.pngEncoder.colorMode    = imageSettings.color_mode
+            self.animationTypes.pngEncoder.colorDepth   = imageSettings.color_depth
+        # Compares the poses before any collection is excluded, so the animated data of every layer is found.
+        if (self.staticFrames != None):
+            copies = self.staticFrames.analyze(self.jobs)
+            for job, source in copies:
+                self.staticCopies.setdefault(id(source), []).append(job)
+            copiedJobs  = set(id(job) for job, source in copies)
+            self.jobs   = [job for job in self.jobs if id(job) not in copiedJobs]
+            self.groupJobs()
+        # Bakes before any collection is excluded, so the meshes of every layer are evaluated.
+        # Each part is marked before its begin, because its end also restores what a failed begin has changed.
+        if (self.vertexCache != None):
+            self.begun.add('vertexCache')
+            self.vertexCache.begin()
+
+        if (self.plan.selectedType in self.excludeTypes):
+            self.typeParameters.exclude = True
+            self.handler(self.typeParameters)
+        self.typeParameters.exclude = False
+        self.animationTypes.visibility.begin(self.layerNames)
+
+        # Creates every needed folder once instead of checking it before each render.
+        for folder in [self.plan.pathSaveAt] + self.plan.folders:
+            os.makedirs(folder, exist_ok=True)
+
+        if (self.useViewer == True):
+            self.begun.add('viewer')
+            self.animationTypes.beginViewer()
+        if (self.animationTypes.weaponPass != None):
+            self.begun.add('weaponPass')
+            self.animationTypes.weaponPass.begin()
+        if (self.animationTypes.grid != None):
+            self.begun.add('grid')
+            self.animationTypes.grid.begin()
+        if (self.cameraOrbit != None):
+            self.begun.add('cameraOrbit')
+            self.cameraOrbit.begin()
+        if (self.animationTypes.postProcessor != None):
+            self.begun.add('postProcessor')
+            self.animationTypes.postProcessor.begin(imageSettings.color_mode, imageSettings.color_depth)
+        self.begun.add('render')
+
+    def step(self):
+        """Renders the next group of jobs and returns False when the plan is finished."""
+        if (self.groupsDone >= len(self.groups)):
+            return False
+        jobs = self.groups[self.groupsDone]
+        # The creature jobs of the next directions or frames are rendered together(see IEAS_TileGrid).
+        gridGroups = self.gridGroups() if (self.animationTypes.grid != None) else []
+        if (len(gridGroups) > 1):
+            jobs = [group[0] for group in gridGroups]
+        # The creature jobs of the next frames of the same direction are rendered as one animation.
+        animationGroups = self.animationGroups() if (self.animationRender == True) else []
+        if (len(animationGroups) > 1):
+            jobs = [group[0] for group in animationGroups]
+        job  = jobs[0]
+        if (job.animation != self.currentAnimation):
+            # Assigns the current animation action to the object's animation data.
+            self.object.animation_data.action = bpy.data.actions.get(job.animation)
+            # Sets the scene's end frame to match the animation's end frame, converted to an integer
+            # to prevent rendering empty frames beyond the action's actual length.
+            bpy.context.scene.frame_end = int(self.object.animation_data.action.frame_range[1])
+            if (self.vertexCache != None):
+                self.vertexCache.select(job.animation)
+            self.currentAnimation   = job.animation
+            self.currentFrame       = None
+        angleChanged = (job.angle != self.currentAngle)
+        if (angleChanged == True):
+            if (self.cameraOrbit != None):
+                # Switches to the camera of the direction, so the object and its evaluated pose stay untouched.
+                self.cameraOrbit.select(job.angle)
+            else:
+                # Rotates the object (the character/model) around its Z-axis to face the current direction.
+                # The script rotates the subject, relying on a static camera to capture it, rather than rotating the camera itself.
+                self.object.rotation_euler[self.axis_Z] = math.radians(job.angle)
+            self.currentAngle = job.angle
+            self.angleChanges += 1
+        if (job.frame != self.currentFrame):
+            # Sets the current frame of the scene, updating the object's animation pose.
+            bpy.context.scene.frame_current = job.frame
+            self.currentFrame = job.frame
+            self.frameChanges += 1
+
+        self.typeParameters.jobs = jobs
+        startTimer = time.perf_counter()
+        if (len(gridGroups) > 1):
+            if (self.animationTypes.renderGrid(self.typeParameters) == False):
+                # The same groups are rendered one by one with the next steps.
+                self.endGrid()
+                return True
+            self.gridRenders += 1
+        elif (len(animationGroups) > 1):
+            self.animationTypes.renderAnimation(self.typeParameters, self.animationFolder)
+            # The animation render leaves the scene at another frame.
+            self.currentFrame = None
+            self.animationRenders += 1
+        else:
+            # The handler is basically the found function(e.g. def typeE000) and can be called as such.
+            self.handler(self.typeParameters)
+        self.frameTimes.append(time.perf_counter() - startTimer)
+        # The render after a direction change also evaluates the rotated object or the switched camera.
+        if (angleChanged == True):
+            self.directionTimes.append(self.frameTimes[-1])
+        # The sprites of the following static frames are copies of the rendered ones.
+        copies = [(job, copiedJob) for job in jobs for copiedJob in self.staticCopies.get(id(job), [])]
+        if (len(copies) > 0 and self.animationTypes.postProcessor != None):
+            # The rendered files must be written by the worker threads before they are copied.
+            self.animationTypes.postProcessor.wait()
+        for job, copiedJob in copies:
+            self.staticFrames.copy(job, copiedJob)
+            self.manifest.record([copiedJob])
+            self.writtenJobs.append(copiedJob)
+            self.jobsDone   += 1
+            self.jobsCopied += 1
+        self.recordJobs(jobs)
+        self.writtenJobs += jobs
+        self.groupsDone += max(len(gridGroups), len(animationGroups), 1)
+        self.jobsDone   += len(jobs)
+        return True
+
+    def recordJobs(self, jobs):
+        """Records the jobs in the manifest as soon as the worker threads have written their files."""
+        postProcessor = self.animationTypes.postProcessor
+        if (postProcessor is None):
+            self.manifest.record(jobs)
+            return
+        # The files of the jobs are written by the tasks which were submitted until now.
+        if (len(jobs) > 0):
+            self.pendingJobs.append((postProcessor.submitted, jobs))
+        writtenJobs = []
+        while (len(self.pendingJobs) > 0 and self.pendingJobs[0][0] <= postProcessor.finished):
+            writtenJobs += self.pendingJobs.pop(0)[1]
+        if (len(writtenJobs) > 0):
+            self.manifest.record(writtenJobs)
+
+    def end(self):
+        """Restores the object's Z-axis rotation, action and the collection visibility to their original state."""
+        # The worker threads write the last sprites before they are recorded and recompressed. A failed task is raised
+        # after everything is restored.
+        postProcessor   = self.animationTypes.postProcessor
+        error           = None
+        if (postProcessor != None and 'postProcessor' in self.begun):
+            try:
+                postProcessor.end()
+            except ValueError as e:
+                error = e
+            self.recordJobs([])
+        # The camera orbit never rotates the object, it only restores the camera and lights.
+        if ('vertexCache' in self.begun):
+            self.vertexCache.end()
+        if ('cameraOrbit' in self.begun):
+            self.cameraOrbit.end()
+        elif ('object' in self.begun):
+            self.object.rotation_euler[self.axis_Z] = self.originalRotation
+        if ('object' in self.begun):
+            self.object.animation_data.action   = self.originalAction
+            for collection in bpy.context.view_layer.layer_collection.children:
+                if (collection.name in self.originalCollections):
+                    exclude, holdout, hide_render = self.originalCollections[collection.name]
+                    collection.exclude                  = exclude
+                    collection.holdout                  = holdout
+                    collection.collection.hide_render   = hide_render
+        # The grid is already ended if the render fell back to single renders(see endGrid).
+        if ('grid' in self.begun and self.animationTypes.grid != None):
+            self.endGrid()
+        if ('viewer' in self.begun):
+            self.animationTypes.endViewer()
+        if ('weaponPass' in self.begun):
+            self.animationTypes.weaponPass.end()
+        if (self.animationRender == True):
+            shutil.rmtree(self.animationFolder, ignore_errors=True)
+        # Frees the image data blocks which were used for processing the rendered pixels.
+        self.animationTypes.imagePool.clear()
+        if ('compression' in self.begun):
+            bpy.context.scene.render.image_settings.compression = self.originalCompression
+        # Only a render which was started completely can be finished.
+        if ('render' not in self.begun):
+            self.begun = set()
+            return
+        self.begun = set()
+        # The files are recompressed in the background, so Blender can be used again right away.
+        if (self.recompressPng == True and len(self.writtenJobs) > 0):
+            self.recompressor = IEAS_PngRecompressor(self.writtenJobs, self.manifest)
+            self.recompressor.start()
+        # Only a finished render is the base for the next incremental render.
+        if (self.saveHashes == True and self.groupsDone == len(self.groups) and error is None):
+            self.hashes.save(self.currentHashes)
+        # The BAM files need every sprite of the plan, so a cancelled render does not write them.
+        if (self.bamOutput == 'V2' and self.groupsDone == len(self.groups) and error is None):
+            self.bamWriter      = IEAS_BamV2Writer(self.animationTypes.pixelBridge, self.pvrzSize, self.pvrzBase)
+            self.bamWarnings    = self.bamWriter.writePlan(self.plan)
+        elif (self.bamOutput != 'NONE' and self.groupsDone == len(self.groups) and error is None):
+            self.bamWriter      = IEAS_BamWriter(self.animationTypes.pixelBridge, self.bamOutput == 'BAMC')
+            self.bamWarnings    = self.bamWriter.writePlan(self.plan)
+        if (error != None):
+            raise error
+
+    def timing(self):
+        """Returns the number of rendered groups and their mean, minimum and maximum render time in milliseconds."""
+        if (len(self.frameTimes) == 0):
+            # E.g. a resumed render, whose BAM files are still written.
+            return "Per frame: no frame rendered" + (f", {self.bamWriter.timing()}" if (self.bamWriter != None) else "")
+        frameTimes = np.array(self.frameTimes) * 1000.0
+        return (f"Per frame: {len(frameTimes)} frames, mean {frameTimes.mean():.1f}ms, "
+                f"min {frameTimes.min():.1f}ms, max {frameTimes.max():.1f}ms, "
+                f"{self.order.lower()}-major order with {self.frameChanges} frame and {self.angleChanges} direction changes, "
+                f"{self.animationTypes.visibility.changes} visibility changes(toggling per frame: {self.legacyVisibilityChanges()})"
+                + (f", {self.gridRenders} grid renders" if (self.gridRenders > 0) else "")
+                + (f", {self.animationRenders} animation renders" if (self.animationRenders > 0) else "")
+                + (f", {self.vertexCache.timing()}" if (self.vertexCache != None) else "")
+                + (f", {self.staticFrames.timing()} with {self.jobsCopied} renders copied" if (self.staticFrames != None) else "")
+                + (f", {self.animationTypes.postProcessor.timing(sum(self.frameTimes))}" if (self.animationTypes.postProcessor != None) else "")
+                + "".join(f", {reason}" for reason in self.animationTypes.fallbacks)
+                + (f", {self.bamWriter.timing()}" if (self.bamWriter != None) else "")
+                + self.directionTiming())
+
+    def directionTiming(self):
+        """Returns the mean render time in milliseconds after a direction change compared with the other renders."""
+        if (len(self.directionTimes) == 0 or len(self.directionTimes) == len(self.frameTimes)):
+            return ""
+        otherTime = (sum(self.frameTimes) - sum(self.directionTimes)) / (len(self.frameTimes) - len(self.directionTimes))
+        return (f", mean {np.mean(self.directionTimes) * 1000.0:.1f}ms after and {otherTime * 1000.0:.1f}ms without a "
+                f"direction change({'camera orbit' if (self.cameraOrbit != None) else 'object rotation'})")
+
+    def run(self):
+        """Renders the whole plan."""
+        try:
+            # A failed begin is also undone by end.
+            self.begin()
+            while self.step():
+                pass
+        finally:
+            self.end()
+        # Without UI the render is only finished with the recompressed files.
+        if (self.recompressor != None):
+            self.recompressor.join()
+
 # --------
 # Purpose:
 # --------
@@ -2426,7 +4769,120 @@ class IEAS_PGT_Inputs(PropertyGroup):
     Use_MISC19:     bpy.props.BoolProperty(name="Use MISC19",   default=False, description="This determines whether sprites for the Miscellanous19 animation are rendered and saved in the corresponding folder")
     Use_MISC20:     bpy.props.BoolProperty(name="Use MISC20",   default=False, description="This determines whether sprites for the Miscellanous20 animation are rendered and saved in the corresponding folder")
     # --- Step 5: Render
-    # Reserved/None
+    # Boolean property to continue an interrupted render.
+    Resume:         bpy.props.BoolProperty( name        = "Resume",
+                                            default     = False,
+                                            description = "Skips every sprite which was already rendered by an earlier render with the same settings(see ieas_manifest.jsonl in the save folder)")
+    # Boolean property to render only changed actions and layers again.
+    Incremental:    bpy.props.BoolProperty( name        = "Incremental",
+                                            default     = False,
+                                            description = "Renders only the animations and layers whose action, render settings or collection objects changed since the last finished render(see ieas_hashes.json in the save folder)")
+    # Enum property for the order in which frames and directions are rendered.
+    Order:          bpy.props.EnumProperty(
+                                        items=[
+                                            ('AUTO','Auto','Frame major if more than one direction is rendered, otherwise direction major','',0),
+                                            ('FRAME','Frame major','Sets each frame once and renders all directions of it, so the pose is evaluated only once per frame','',1),
+                                            ('DIRECTION','Direction major','Renders all frames of a direction before the next direction','',2),
+                                            ('LAYER','Layer major','Renders each layer(creature, weapon, armor) for all frames and directions of an animation before the next layer, so collections are toggled only once per animation','',3),
+                                        ],
+                                        name            = "Order",
+                                        description     = "Order in which frames and directions are rendered",
+                                        default         = 'AUTO',
+                                    )
+    # Boolean property to render all weapons of a frame at once.
+    Weapon_Pass:    bpy.props.BoolProperty( name        = "Weapons in one render",
+                                            default     = False,
+                                            description = "Renders all weapon collections of a frame at once and splits them with Cryptomatte in the compositor. Frames whose weapons overlap are rendered weapon by weapon")
+    # Boolean property to composite the armor layers instead of rendering the creature with every armor.
+    Armor_Layers:   bpy.props.BoolProperty( name        = "Layered armor",
+                                            default     = False,
+                                            description = "Renders each armor collection with the creature as holdout and composites it over the creature render of the frame(5000/6000). The armor does not cast shadows onto the creature")
+    # Boolean property to hide layer collections without rebuilding the view layer.
+    Hide_Render:    bpy.props.BoolProperty( name        = "Hide layers from render",
+                                            default     = False,
+                                            description = "Hides the lower part, weapon and armor collections with 'Disable in Renders' instead of excluding them from the view layer. This avoids rebuilding the view layer, but hidden objects are still evaluated")
+    # Boolean property to mirror the eastern directions instead of rendering them.
+    Mirror_East:    bpy.props.BoolProperty( name        = "Mirror eastern directions",
+                                            default     = False,
+                                            description = "Renders only the directions from south to north and saves the eastern directions as their horizontally mirrored western counterparts. Asymmetric creatures, lighting or shadows will look mirrored")
+    # Boolean property to render all directions of a frame at once.
+    Direction_Grid: bpy.props.BoolProperty( name        = "Directions in one render",
+                                            default     = False,
+                                            description = "Renders the creature in all directions of a frame with one render of rotated collection instances next to each other. Needs an orthographic camera. Objects of other collections appear only in the first direction")
+    # Boolean property to render several frames of an animation at once.
+    Frame_Grid:     bpy.props.BoolProperty( name        = "Frames in one render",
+                                            default     = False,
+                                            description = "Renders several frames and directions of an animation with one render of time-shifted creature copies next to each other. The number of copies depends on the resolution. Needs an orthographic camera. Falls back to single renders if the copies bleed into each other")
+    # Boolean property to switch between cameras around the object instead of rotating it.
+    Camera_Orbit:   bpy.props.BoolProperty( name        = "Orbit cameras",
+                                            default     = False,
+                                            description = "Changes the direction by switching between copies of the camera and lights around the object instead of rotating the object, so its pose is not evaluated again. The world and objects which are not children of the object are not rotated. Not used with grids")
+    # Boolean property to render the frames of a direction as one animation.
+    Animation_Render: bpy.props.BoolProperty( name      = "Render as animation",
+                                            default     = False,
+                                            description = "Renders the frames of each action and direction as one animation, so the render session is kept between frames(4000, 7000 monster old, 9000, A000-D000, F000). Renders the directions one after another. Not used with grids")
+    # Boolean property to bake the mesh deformation before rendering.
+    Vertex_Cache:   bpy.props.BoolProperty( name        = "Bake deformation",
+                                            default     = False,
+                                            description = "Bakes the armature deformation of the rig's child meshes for every action into point cache files(ieas_cache in the save folder) and renders them with a Mesh Cache modifier. The files are reused while the action and mesh do not change. Not used with the frame grid")
+    # Boolean property to copy the sprites of frames with the same pose as the previous rendered frame.
+    Static_Frames:  bpy.props.BoolProperty( name        = "Copy static frames",
+                                            default     = False,
+                                            description = "Compares the pose of the rig and the animated values(e.g. shape keys, materials) of every frame with the previous rendered frame and copies its sprites instead of rendering them if nothing moved")
+    # Float property for the largest difference which counts as the same pose.
+    Static_Tolerance: bpy.props.FloatProperty( name     = "Static tolerance",
+                                            default     = 0.0001,
+                                            min         = 0.0,
+                                            precision   = 5,
+                                            description = "The largest difference of a bone matrix or animated value which counts as the same pose for 'Copy static frames'")
+    # Boolean property to write the sprites with a fast compression.
+    Fast_Png:       bpy.props.BoolProperty( name        = "Fast PNG",
+                                            default     = False,
+                                            description = "Writes the PNG sprites with a low compression while rendering, without image data blocks. Needs the 'Standard' view transform without look, exposure, gamma and curves, otherwise Blender writes them with a low compression. The sprites have no dither noise")
+    # Boolean property to recompress the sprites after the render.
+    Recompress_Png: bpy.props.BoolProperty( name        = "Recompress PNG",
+                                            default     = False,
+                                            description = "Makes the PNG sprites of the render as small as possible without changing their pixels(e.g. with a palette for up to 256 colors). Runs in the background after the render")
+    # Integer property for the number of threads which write the sprites while rendering.
+    Post_Threads:   bpy.props.IntProperty(  name        = "Post-processing threads",
+                                            default     = 0,
+                                            min         = 0,
+                                            max         = 32,
+                                            description = "Number of threads which split, mirror, encode and write the sprites of 'Fast PNG' while the next frame is rendered. 0 processes them between the renders")
+    # Boolean property to save the quadrants of the split types in their own size.
+    Tile_Extent:    bpy.props.BoolProperty( name        = "Quadrants in own size",
+                                            default     = False,
+                                            description = "Saves each quadrant of the 1000 types in the size of the quadrant instead of the full render size. The quadrant of column c and row r(from top left) starts at c*width/columns and r*height/rows of the render")
+    # Enum property for writing the creature sprites as BAM files after the render.
+    Bam_Output:     bpy.props.EnumProperty(
+                                        items=[
+                                            ('NONE','None','Writes only the PNG sprites','',0),
+                                            ('BAM','BAM V1','Writes the creature sprites of each sequence file as BAM V1 file with a palette of 256 colors into the folder bam of the save folder','',1),
+                                            ('BAMC','BAMC','Writes the BAM V1 files compressed with zlib','',2),
+                                            ('V2','BAM V2 + PVRZ','Packs the creature sprites of all sequence files into DXT5 compressed PVRZ pages and writes BAM V2 files which refer to them(Enhanced Editions)','',3),
+                                        ],
+                                        name            = "BAM output",
+                                        description     = "Writes the creature sprites as BAM files after a finished render(0000, 1000 monster quadrant, 4000, 7000, B000, C000, D000). In BAM V1 files index 0 is transparent and index 1 is the shadow",
+                                        default         = 'NONE',
+                                    )
+    # Enum property for the width and height of the PVRZ pages of the BAM V2 files.
+    Pvrz_Size:      bpy.props.EnumProperty(
+                                        items=[
+                                            ('256','256','Pages of 256x256 pixels','',0),
+                                            ('512','512','Pages of 512x512 pixels','',1),
+                                            ('1024','1024','Pages of 1024x1024 pixels','',2),
+                                            ('2048','2048','Pages of 2048x2048 pixels','',3),
+                                        ],
+                                        name            = "PVRZ page size",
+                                        description     = "Width and height of the PVRZ pages. The last page of a creature is reduced to the smallest power of two which holds its frames",
+                                        default         = '1024',
+                                    )
+    # Integer property for the index of the first PVRZ page.
+    Pvrz_Base:      bpy.props.IntProperty(  name        = "First PVRZ page",
+                                            default     = 1000,
+                                            min         = 0,
+                                            max         = 99999,
+                                            description = "Index of the first PVRZ page(MOSxxxx.PVRZ). The pages of a creature get the following indices, so choose a range which no other creature or mod uses")
 
 
 # --------
@@ -2501,225 +4957,75 @@ class IEAS_OT_ShadingNodes(Operator):
         return {'FINISHED'}
 
 
+# --------
+# Purpose:
+# --------
+# Contains the progress of the running render which is shown in the "IEAS_PT_Final" panel.
+# ----------------------------------------------------------------------------------------
+@dataclass
+class IEAS_RenderStatus:
+    """Contains the progress of the running render which is shown in the "IEAS_PT_Final" panel"""
+    running:        bool    = False # A modal render is running.
+    paused:         bool    = False # The modal render waits until it is resumed.
+    cancel:         bool    = False # The modal render stops with the next timer event.
+    jobsDone:       int     = 0     # The number of finished render jobs.
+    jobsTotal:      int     = 0     # The number of all render jobs of the plan.
+    startTime:      float   = 0.0   # The time when the render started.
+    pausedTime:     float   = 0.0   # The time in seconds the render was paused so far.
+    pauseStart:     float   = 0.0   # The time when the current pause started.
+    recompressor:   object  = None  # The recompression of the last render's sprites, which runs in the background(see IEAS_PngRecompressor).
+
+    def recompressing(self):
+        """Returns True while the sprites of the last render are recompressed."""
+        return (self.recompressor != None and self.recompressor.isRunning())
+
+    def elapsed(self):
+        """Returns the render time in seconds without the paused time."""
+        pausedTime = self.pausedTime + ((time.time() - self.pauseStart) if self.paused else 0.0)
+        return time.time() - self.startTime - pausedTime
+
+    def eta(self):
+        """Returns the estimated remaining render time in seconds or None if no job is finished yet."""
+        if (self.jobsDone == 0):
+            return None
+        return self.elapsed() / self.jobsDone * (self.jobsTotal - self.jobsDone)
+
+# Only one modal render can run at a time, so its status is shared by the operators and the panel. A new render waits
+# until the sprites of the last one are recompressed, otherwise the recompression could replace a new sprite by the old one.
+renderStatus = IEAS_RenderStatus()
+
+
 # --------
 # Purpose:
 # --------
 # Operator to initiate the full sprite rendering process for selected objects, animations, and directions.
+# The button starts a modal render which renders one frame per timer event, so Blender stays responsive.
+# Calling the operator from a script(execute) still renders everything at once.
 # --------------------------------------------------------------------------------------------------------
 class IEAS_OT_Final(Operator):
     """This class offers a function which starts the rendering which is used in "IEAS_PT_Final" class"""
     bl_idname = "ieas.final" # Unique identifier for the operator. Naming convention(??): <lower_case>.<lower_case>[_<lower_case>]
     bl_label = "RENDER" # Text displayed on the button in the UI.
-    
-    # Blender specific function which is executed in this case when RENDER button is pressed
-    def execute(self, context):
-        # ---- Start timer
-        startTimer = time.time()
-        
-        # ----- Global
-        animationTypeHandlers = {
-            '0000':                                 IEAS_AnimationTypes().type0000,
-            '1000 monster quadrant':                IEAS_AnimationTypes().type1000_monster_quadrant,
-            '1000 monster multi split bams 0':      IEAS_AnimationTypes().type1000_monster_multi_sp0,
-            '1000 monster multi split bams 1':      IEAS_AnimationTypes().type1000_monster_multi_sp1,
-            '1000 multi new split bams 0':          IEAS_AnimationTypes().type1000_multi_new_sp0,
-            '1000 multi new split bams 1':          IEAS_AnimationTypes().type1000_multi_new_sp1,
-            '2000':                                 IEAS_AnimationTypes().type2000,
-            '3000 mirror 0':                        IEAS_AnimationTypes().type3000_mirror0,
-            '3000 mirror 1':                        IEAS_AnimationTypes().type3000_mirror1,
-            '4000':                                 IEAS_AnimationTypes().type4000,
-            '5000/6000 character split bams 0':     IEAS_AnimationTypes().type5000and6000_character_sp0,
-            '5000/6000 character split bams 1':     IEAS_AnimationTypes().type5000and6000_character_sp1,
-            '5000/6000 character old':              IEAS_AnimationTypes().type5000and6000_character_old,
-            '7000 monster split bams 0':            IEAS_AnimationTypes().type7000_monster_sp0,
-            '7000 monster split bams 1':            IEAS_AnimationTypes().type7000_monster_sp1,
-            '7000 monster old':                     IEAS_AnimationTypes().type7000_monster_old,
-            '8000':                                 IEAS_AnimationTypes().type8000,
-            '9000':                                 IEAS_AnimationTypes().type9000,
-            'A000':                                 IEAS_AnimationTypes().typeA000,
-            'B000':                                 IEAS_AnimationTypes().typeB000,
-            'C000':                                 IEAS_AnimationTypes().typeC000,
-            'D000':                                 IEAS_AnimationTypes().typeD000,
-            'E000':                                 IEAS_AnimationTypes().typeE000,
-            'F000':                                 IEAS_AnimationTypes().typeF000,
-            'unique identifier':                    False, # TODO: delete 'unique identifier'
-        }
-        excludedAnimationTypes = [  '5000/6000 character split bams 0', 
-                                    '5000/6000 character split bams 1', 
-                                    '5000/6000 character old']           
-        # ---- Camera
-        # Dictionaries mapping internal keys to user-defined subfolder names and toggle states for camera angles.
-        cameraPosFolderNames = {
-            'south':        context.scene.IEAS_properties.South,        'south_south_west': context.scene.IEAS_properties.South_South_West,
-            'south_west':   context.scene.IEAS_properties.South_West,   'west_south_west':  context.scene.IEAS_properties.West_South_West,
-            'west':         context.scene.IEAS_properties.West,         'west_north_west':  context.scene.IEAS_properties.West_North_West,
-            'north_west':   context.scene.IEAS_properties.North_West,   'north_north_west': context.scene.IEAS_properties.North_North_West,
-            'north':        context.scene.IEAS_properties.North,        'north_north_east': context.scene.IEAS_properties.North_North_East,
-            'north_east':   context.scene.IEAS_properties.North_East,   'east_north_east':  context.scene.IEAS_properties.East_North_East,
-            'east':         context.scene.IEAS_properties.East,         'east_south_east':  context.scene.IEAS_properties.East_South_East,
-            'south_east':   context.scene.IEAS_properties.South_East,   'south_south_east': context.scene.IEAS_properties.South_South_East
-        }
-        cameraPosToggles = {
-            'south':        context.scene.IEAS_properties.Use_SO, 'south_south_west':   context.scene.IEAS_properties.Use_SSW,
-            'south_west':   context.scene.IEAS_properties.Use_SW, 'west_south_west':    context.scene.IEAS_properties.Use_WSW,
-            'west':         context.scene.IEAS_properties.Use_WE, 'west_north_west':    context.scene.IEAS_properties.Use_WNW,
-            'north_west':   context.scene.IEAS_properties.Use_NW, 'north_north_west':   context.scene.IEAS_properties.Use_NNW,
-            'north':        context.scene.IEAS_properties.Use_NO, 'north_north_east':   context.scene.IEAS_properties.Use_NNE,
-            'north_east':   context.scene.IEAS_properties.Use_NE, 'east_north_east':    context.scene.IEAS_properties.Use_ENE,
-            'east':         context.scene.IEAS_properties.Use_ES, 'east_south_east':    context.scene.IEAS_properties.Use_ESE,
-            'south_east':   context.scene.IEAS_properties.Use_SE, 'south_south_east':   context.scene.IEAS_properties.Use_SSE
-        }
-        # Dictionary mapping internal keys to rotation angles in degrees.
-        cameraAngles = {
-            'south':        0,      'south_south_west': 337.5,
-            'south_west':   315,    'west_south_west':  292.5,
-            'west':         270,    'west_north_west':  247.5,
-            'north_west':   225,    'north_north_west': 202.5,
-            'north':        180,    'north_north_east': 157.5,
-            'north_east':   135,    'east_north_east':  112.5,
-            'east':         90,     'east_south_east':  67.5,
-            'south_east':   45,     'south_south_east': 22.5
-        }
-        cameraEasternPositions = [  'north_north_east',         'north_east', 'east_north_east', 
-                                    'east', 'east_south_east',  'south_east', 'south_south_east']
-        
-        # ----- Animation
-        # Dictionaries mapping internal keys to user-defined animation names and toggle states.
-        animationFolderNames = {
-            'A1':       context.scene.IEAS_properties.Attack1,      'A2': context.scene.IEAS_properties.Attack2,
-            'A3':       context.scene.IEAS_properties.Attack3,      'A4': context.scene.IEAS_properties.Attack4,
-            'A5':       context.scene.IEAS_properties.Attack5,      'TW': context.scene.IEAS_properties.Dead,
-            'CA':       context.scene.IEAS_properties.Cast,         'DE': context.scene.IEAS_properties.Death,
-            'GH':       context.scene.IEAS_properties.Get_Hit,      'GU': context.scene.IEAS_properties.Get_Up,
-            'SC':       context.scene.IEAS_properties.Ready,        'SD': context.scene.IEAS_properties.Idle,
-            'SL':       context.scene.IEAS_properties.Sleep,        'SP': context.scene.IEAS_properties.Conjure,
-            'WK': context.scene.IEAS_properties.Walk,               'EMERGE': context.scene.IEAS_properties.Emerge,
-            'HIDE':     context.scene.IEAS_properties.Hide,         'Effect':   context.scene.IEAS_properties.Effect,
-            # Type 5000/6000 Properties
-            'WK2':      context.scene.IEAS_properties.Walk2,
-            'A6':       context.scene.IEAS_properties.Attack6,      'A7': context.scene.IEAS_properties.Attack7,
-            'A8':       context.scene.IEAS_properties.Attack8,      'A9': context.scene.IEAS_properties.Attack9,
-            'SA':       context.scene.IEAS_properties.Attack10,     'SS': context.scene.IEAS_properties.Attack11,
-            'SX':       context.scene.IEAS_properties.Attack12,     'CA1': context.scene.IEAS_properties.Cast1,
-            'CA2':      context.scene.IEAS_properties.Cast2,        'CA3': context.scene.IEAS_properties.Cast3,
-            'CA4':      context.scene.IEAS_properties.Cast4,        'SP1': context.scene.IEAS_properties.Conjure1,
-            'SP2':      context.scene.IEAS_properties.Conjure2,     'SP3': context.scene.IEAS_properties.Conjure3,
-            'SP4':      context.scene.IEAS_properties.Conjure4,     'SC1': context.scene.IEAS_properties.Ready1,
-            'SC2':      context.scene.IEAS_properties.Ready2,       'SD1': context.scene.IEAS_properties.Idle1,
-            'SD2':      context.scene.IEAS_properties.Idle2,        'SD3': context.scene.IEAS_properties.Idle3,
-            'SL1':      context.scene.IEAS_properties.Sleep1,       'SL2': context.scene.IEAS_properties.Sleep2,
-            # PST String Properties
-            'AT1':      context.scene.IEAS_properties.PST_Attack1,  'AT2': context.scene.IEAS_properties.PST_Attack2,
-            'AT3':      context.scene.IEAS_properties.PST_Attack3,  'HIT': context.scene.IEAS_properties.PST_Get_Hit,
-            'RUN':      context.scene.IEAS_properties.PST_Run,      'WLK': context.scene.IEAS_properties.PST_Walk,
-            'SP1':      context.scene.IEAS_properties.PST_Spell1,   'SP2': context.scene.IEAS_properties.PST_Spell2,
-            'SP3':      context.scene.IEAS_properties.PST_Spell3,   'GUP': context.scene.IEAS_properties.PST_Get_Up,
-            'DFB1':     context.scene.IEAS_properties.PST_Death1,   'DFB2': context.scene.IEAS_properties.PST_Death2,
-            'DFB3':     context.scene.IEAS_properties.PST_Death3,   'TK1': context.scene.IEAS_properties.PST_Talk1,
-            'TK2':      context.scene.IEAS_properties.PST_Talk2,    'TK3': context.scene.IEAS_properties.PST_Talk3,
-            'STD':      context.scene.IEAS_properties.PST_Stand,    'STDF1': context.scene.IEAS_properties.PST_StandF1,
-            'STDF2':    context.scene.IEAS_properties.PST_StandF2,  'STC': context.scene.IEAS_properties.PST_Stance,
-            'STCF1':    context.scene.IEAS_properties.PST_StanceF1, 'STCF2': context.scene.IEAS_properties.PST_StanceF2,
-            'STCtoSTD': context.scene.IEAS_properties.PST_Stance_to_Stand, 
-            'STDtoSTC': context.scene.IEAS_properties.PST_Stand_to_Stance,
-            'MISC1':    context.scene.IEAS_properties.PST_Misc1,    'MISC2': context.scene.IEAS_properties.PST_Misc2,
-            'MISC3':    context.scene.IEAS_properties.PST_Misc3,    'MISC4': context.scene.IEAS_properties.PST_Misc4,
-            'MISC5':    context.scene.IEAS_properties.PST_Misc5,    'MISC6': context.scene.IEAS_properties.PST_Misc6,
-            'MISC7':    context.scene.IEAS_properties.PST_Misc7,    'MISC8': context.scene.IEAS_properties.PST_Misc8,
-            'MISC9':    context.scene.IEAS_properties.PST_Misc9,    'MISC10': context.scene.IEAS_properties.PST_Misc10,
-            'MISC11':   context.scene.IEAS_properties.PST_Misc11,   'MISC12': context.scene.IEAS_properties.PST_Misc12,
-            'MISC13':   context.scene.IEAS_properties.PST_Misc13,   'MISC14': context.scene.IEAS_properties.PST_Misc14,
-            'MISC15':   context.scene.IEAS_properties.PST_Misc15,   'MISC16': context.scene.IEAS_properties.PST_Misc16,
-            'MISC17':   context.scene.IEAS_properties.PST_Misc17,   'MISC18': context.scene.IEAS_properties.PST_Misc18,
-            'MISC19':   context.scene.IEAS_properties.PST_Misc19,   'MISC20': context.scene.IEAS_properties.PST_Misc20
-        }
-        animationToggles = {
-            'A1':       context.scene.IEAS_properties.Use_A1,       'A2': context.scene.IEAS_properties.Use_A2,
-            'A3':       context.scene.IEAS_properties.Use_A3,       'A4': context.scene.IEAS_properties.Use_A4,
-            'A5':       context.scene.IEAS_properties.Use_A5,       'TW': context.scene.IEAS_properties.Use_TW,
-            'CA':       context.scene.IEAS_properties.Use_CA,       'DE': context.scene.IEAS_properties.Use_DE,
-            'GH':       context.scene.IEAS_properties.Use_GH,       'GU': context.scene.IEAS_properties.Use_GU,
-            'SC':       context.scene.IEAS_properties.Use_SC,       'SD': context.scene.IEAS_properties.Use_SD,
-            'SL':       context.scene.IEAS_properties.Use_SL,       'SP': context.scene.IEAS_properties.Use_SP,
-            'WK':       context.scene.IEAS_properties.Use_WK,       'EMERGE':   context.scene.IEAS_properties.Use_Emerge,
-            'Effect':   context.scene.IEAS_properties.Use_Effect,   'HIDE':     context.scene.IEAS_properties.Use_Hide,                      
-            # Type 5000/6000 Boolean Properties
-            'WK2':      context.scene.IEAS_properties.Use_WK2,
-            'A6':       context.scene.IEAS_properties.Use_A6,       'A7': context.scene.IEAS_properties.Use_A7,
-            'A8':       context.scene.IEAS_properties.Use_A8,       'A9': context.scene.IEAS_properties.Use_A9,
-            'SA':       context.scene.IEAS_properties.Use_SA,       'SS': context.scene.IEAS_properties.Use_SS,
-            'SX':       context.scene.IEAS_properties.Use_SX,       'CA1': context.scene.IEAS_properties.Use_CA1,
-            'CA2':      context.scene.IEAS_properties.Use_CA2,      'CA3': context.scene.IEAS_properties.Use_CA3,
-            'CA4':      context.scene.IEAS_properties.Use_CA4,      'SP1': context.scene.IEAS_properties.Use_SP1,
-            'SP2':      context.scene.IEAS_properties.Use_SP2,      'SP3': context.scene.IEAS_properties.Use_SP3,
-            'SP4':      context.scene.IEAS_properties.Use_SP4,      'SC1': context.scene.IEAS_properties.Use_SC1,
-            'SC2':      context.scene.IEAS_properties.Use_SC2,      'SD1': context.scene.IEAS_properties.Use_SD1,
-            'SD2':      context.scene.IEAS_properties.Use_SD2,      'SD3': context.scene.IEAS_properties.Use_SD3,
-            'SL1':      context.scene.IEAS_properties.Use_SL1,      'SL2': context.scene.IEAS_properties.Use_SL2,
-            # PST Boolean Properties
-            'AT1':      context.scene.IEAS_properties.Use_AT1,      'AT2': context.scene.IEAS_properties.Use_AT2,
-            'AT3':      context.scene.IEAS_properties.Use_AT3,      'HIT': context.scene.IEAS_properties.Use_HIT,
-            'RUN':      context.scene.IEAS_properties.Use_RUN,      'WLK': context.scene.IEAS_properties.Use_WLK,
-            'SP1':      context.scene.IEAS_properties.Use_SP1,      'SP2': context.scene.IEAS_properties.Use_SP2,
-            'SP3':      context.scene.IEAS_properties.Use_SP3,      'GUP': context.scene.IEAS_properties.Use_GUP,
-            'DFB1':     context.scene.IEAS_properties.Use_DFB1,     'DFB2': context.scene.IEAS_properties.Use_DFB2,
-            'DFB3':     context.scene.IEAS_properties.Use_DFB3,     'TK1': context.scene.IEAS_properties.Use_TK1,
-            'TK2':      context.scene.IEAS_properties.Use_TK2,      'TK3': context.scene.IEAS_properties.Use_TK3,
-            'STD':      context.scene.IEAS_properties.Use_STD,      'STDF1': context.scene.IEAS_properties.Use_STDF1,
-            'STDF2':    context.scene.IEAS_properties.Use_STDF2,    'STC': context.scene.IEAS_properties.Use_STC,
-            'STCF1':    context.scene.IEAS_properties.Use_STCF1,    'STCF2': context.scene.IEAS_properties.Use_STCF2,
-            'STCtoSTD': context.scene.IEAS_properties.Use_STCtoSTD, 'STDtoSTC': context.scene.IEAS_properties.Use_STDtoSTC,
-            'MISC1':    context.scene.IEAS_properties.Use_MISC1,    'MISC2': context.scene.IEAS_properties.Use_MISC2,
-            'MISC3':    context.scene.IEAS_properties.Use_MISC3,    'MISC4': context.scene.IEAS_properties.Use_MISC4,
-            'MISC5':    context.scene.IEAS_properties.Use_MISC5,    'MISC6': context.scene.IEAS_properties.Use_MISC6,
-            'MISC7':    context.scene.IEAS_properties.Use_MISC7,    'MISC8': context.scene.IEAS_properties.Use_MISC8,
-            'MISC9':    context.scene.IEAS_properties.Use_MISC9,    'MISC10': context.scene.IEAS_properties.Use_MISC10,
-            'MISC11':   context.scene.IEAS_properties.Use_MISC11,   'MISC12': context.scene.IEAS_properties.Use_MISC12,
-            'MISC13':   context.scene.IEAS_properties.Use_MISC13,   'MISC14': context.scene.IEAS_properties.Use_MISC14,
-            'MISC15':   context.scene.IEAS_properties.Use_MISC15,   'MISC16': context.scene.IEAS_properties.Use_MISC16,
-            'MISC17':   context.scene.IEAS_properties.Use_MISC17,   'MISC18': context.scene.IEAS_properties.Use_MISC18,
-            'MISC19':   context.scene.IEAS_properties.Use_MISC19,   'MISC20': context.scene.IEAS_properties.Use_MISC20
-        }
-        animationWeaponFolderNames = {
-            'A': context.scene.IEAS_properties.Axe,     'B': context.scene.IEAS_properties.Bow,
-            'C': context.scene.IEAS_properties.Club,    'D': context.scene.IEAS_properties.Dagger,
-            'F': context.scene.IEAS_properties.Flail,   'H': context.scene.IEAS_properties.Halberd,
-            'M': context.scene.IEAS_properties.Mace,    'S': context.scene.IEAS_properties.Sword,
-            'W': context.scene.IEAS_properties.Warhammer, 'Q': context.scene.IEAS_properties.Quarterstaff,          
-        }
-        animationWeaponToggles = {
-            'A': context.scene.IEAS_properties.Use_A,   'B': context.scene.IEAS_properties.Use_B,
-            'C': context.scene.IEAS_properties.Use_C,   'D': context.scene.IEAS_properties.Use_D,
-            'F': context.scene.IEAS_properties.Use_F,   'H': context.scene.IEAS_properties.Use_H,
-            'M': context.scene.IEAS_properties.Use_M,   'S': context.scene.IEAS_properties.Use_S,
-            'W': context.scene.IEAS_properties.Use_W,   'Q': context.scene.IEAS_properties.Use_Q,          
-        }
-        animationArmorToggles = {
-            'ARMOR1': context.scene.IEAS_properties.Use_ARMOR1,   'ARMOR2': context.scene.IEAS_properties.Use_ARMOR2,
-            'ARMOR3': context.scene.IEAS_properties.Use_ARMOR3,   'ARMOR4': context.scene.IEAS_properties.Use_ARMOR4,        
-        }
-        animationArmorFolderNames = {
-            'ARMOR1': context.scene.IEAS_properties.Armor1,   'ARMOR2': context.scene.IEAS_properties.Armor2,
-            'ARMOR3': context.scene.IEAS_properties.Armor3,   'ARMOR4': context.scene.IEAS_properties.Armor4,        
-        }
-        
+
+    # Checks the inputs, selects the object and compiles the render plan. Returns None if rendering is not possible.
+    def prepare(self, context):
         # ----- Resolution balancing in Blender and IE AutoSpriter, with Blender taking priority here.
         if (context.scene.IEAS_properties.Resolution_X != bpy.context.scene.render.resolution_x):
             context.scene.IEAS_properties.Resolution_X = bpy.context.scene.render.resolution_x
-                       
+
         if (context.scene.IEAS_properties.Resolution_Y != bpy.context.scene.render.resolution_y):
             context.scene.IEAS_properties.Resolution_Y = bpy.context.scene.render.resolution_y
-        
+
         # Checks if 'Object List' is selected with an object(armature/rig)
         if (context.scene.IEAS_properties.Object_List is None):
             self.report({'ERROR'}, f"ERROR: Value in 'Object List' in step 1 is '{context.scene.IEAS_properties.Object_List}'! Perhaps no object is selected?")
-            return {'CANCELLED'}
-        
+            return None
+
         # ----- Filename and path
-        # Retrieves the base save path from user input.            
+        # Retrieves the base save path from user input.
         pathSaveAt      = bpy.path.abspath(context.scene.IEAS_properties.Save_at)
-        # Combines prefix and resref for use in filename construction.      
-        prefixResref    = context.scene.IEAS_properties.Prefix + context.scene.IEAS_properties.Resref        
+        # Combines prefix and resref for use in filename construction.
+        prefixResref    = context.scene.IEAS_properties.Prefix + context.scene.IEAS_properties.Resref
         # ----- Init varibales(order is relevant)
         # Retrieves the animation type name of the type list from the UI settings.
         selectedType    = context.scene.IEAS_properties.Type
@@ -2727,237 +5033,272 @@ class IEAS_OT_Final(Operator):
         objectName      = context.scene.IEAS_properties.Object_List.name
         # Stores the current object in the scene with the specific user given name.
         objectCurrent   = context.scene.objects.get(objectName)
-        
+
         # Checks if the object exist.
         if (objectCurrent is None):
             self.report({'ERROR'}, f"ERROR: Object '{objectCurrent}' does not exist!")
-            return {'CANCELLED'}
+            return None
         # Checks if the collection is excluded from view layer(e.g. through unchecked tick).
         if not objectCurrent.visible_get():
             self.report({'ERROR'}, f"ERROR: Object '{objectName}' is excluded from View Layer! Perhaps the collection or object is disabled?")
-            return {'CANCELLED'}
+            return None
         # Checks if the object's renderer is deactivated.
         if (objectCurrent.hide_render):
             self.report({'ERROR'}, f"ERROR: Object '{objectName}' is excluded from renders (Camera icon is OFF)!")
-            return {'CANCELLED'}
+            return None
         # Checks if 'Object List' is selected with an object(armature/rig)
         if (prefixResref == ''):
             self.report({'WARNING'}, f"WARNING: Prefix AND Resref are empty in step 1!")
-        
-        # Selects the specific object by setting its selection state to True.
-        bpy.context.scene.objects[objectName].select_set(True)
-        # Sets the selected object as the active object, crucial for operations relying on `bpy.context.active_object`.
-        bpy.context.view_layer.objects.active = bpy.data.objects[objectName]
-        # The index '2' corresponds to the Z-axis in Blender's rotation_euler tuple.
-        axis_Z                  = 2
-        # Stores the object's initial Z-axis rotation to be restored at the end of the method.
-        originalLocation        = bpy.context.active_object.rotation_euler[axis_Z]
-        # Initilaizes all the parameters.
-        typeParameters          = IEAS_AnimationTypesParameters(
-            exclude                     = True,
-            # Retrieves the name of the creature collection from the UI settings.
-            CreatureCollectionName      = context.scene.IEAS_properties.Creature,
-            CreatureCollectionNameLP    = context.scene.IEAS_properties.Creature_Lower,
-            animationWeaponFolderNames  = animationWeaponFolderNames,
-            animationWeaponToggles      = animationWeaponToggles,
-            animationArmorToggles       = animationArmorToggles,
-            animationArmorFolderNames   = animationArmorFolderNames,
-            cameraEasternPositions      = cameraEasternPositions,
-            pathSaveAt                  = pathSaveAt,
-            animation                   = "",
-            positionKey                 = "",
-            animationKey                = "",
-            frame                       = 0,
-            prefixResref                = prefixResref,
-            position_folder             = ""
-        )
-        if (selectedType == '0000'                              or
-            selectedType == '2000'                              or
-            selectedType == '3000 mirror 0'                     or
-            selectedType == '3000 mirror 1'                     or
-            selectedType == '5000/6000 character split bams 0'  or
-            selectedType == '5000/6000 character split bams 1'  or
-            selectedType == '5000/6000 character old'           or
-            selectedType == '7000 monster split bams 0'         or
-            selectedType == '7000 monster split bams 1'         or
-            selectedType == '8000'                              or
-            selectedType == 'E000'):
-            try:
-                # Get the method from the dictionary, defaulting to a general handler if not found
-                handler_method  = animationTypeHandlers.get(selectedType, IEAS_AnimationTypes().typeNone)
-                handler_method(typeParameters)
-            except ValueError as e:
-                self.report({'ERROR'}, str(e))
-                return {'CANCELLED'}
-                        
+
+        # ----- Compiles every job before anything is changed or rendered.
+        try:
+            plan = IEAS_RenderPlanCompiler().compile(context)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return None
+        # The BAM files are written after the render, so an unsupported type is refused before anything is rendered.
+        if (context.scene.IEAS_properties.Bam_Output != 'NONE' and IEAS_RenderPlanCompiler.bamUnsupported(selectedType) != None):
+            self.report({'ERROR'}, f"ERROR: No BAM files can be written, because {IEAS_RenderPlanCompiler.bamUnsupported(selectedType)}!")
+            return None
+
         # ----- Deselecting and selecting
         # Checks if the user is not in "Object Mode"
         if bpy.context.mode != 'OBJECT':
             # Displays a red error message in the UI
             self.report({'ERROR'}, "ERROR: Please switch to 'Object Mode' before starting rendering!")
-            return {'CANCELLED'}
-        
+            return None
+
         # Deselects all objects in the scene to ensure only the target object is affected.
         bpy.ops.object.select_all(action='DESELECT')
-        
-        objectCurrent   = context.scene.objects.get(objectName)
-        # Checks if the object exist.
-        if (objectCurrent is None):
-            self.report({'ERROR'}, f"ERROR: Object '{objectName}' does not exist!")
-            return {'CANCELLED'}
-        # Checks if the collection is excluded from vie layer(e.g. through unchecked tick).
-        if not objectCurrent.visible_get():
-            self.report({'ERROR'}, f"ERROR: Object '{objectName}' is excluded from View Layer! This error can be caused by an incorrect object in step 1(see `Object List`)")
-            return {'CANCELLED'}
-        
         # Selects the specific object by setting its section state to True.
         bpy.context.scene.objects[objectName].select_set(True)
         # Sets the selected object as the active object, crucial for operations relying on `bpy.context.active_object`.
         bpy.context.view_layer.objects.active = bpy.data.objects[objectName]
-        
+
         # ----- Debugging
         # TODO: Delete print
         print("--------IEAS_OT_Final----------")
         # TODO: Delete print
-        #print("CreatureCollectionName:",CreatureCollectionName)
-        # TODO: Delete print
         print("pathSaveAt:",pathSaveAt)
         # TODO: Delete print
         print("prefixResref:",prefixResref)
         # TODO: Delete print
-        print("Object List:",context.scene.IEAS_properties.Object_List.name) 
-        # TODO: Delete print      
         print("selectedType:",selectedType)
+        return plan
 
-        # ----- Main/Outer loop 
-        # Iterates through each defined animation.  
-        for animationKey, animation in animationFolderNames.items():
-            # Checks if any aniamtion exists.
-            if (bpy.context.active_object.animation_data is None):
-                self.report({'ERROR'}, f"Object '{bpy.context.active_object.name}' has no animation data.")
-                return {'CANCELLED'}
-            # Checks if the action(animation) was found in this blender file.
-            if (bpy.data.actions.get(animation) is None and (animationToggles[animationKey] == True)):
-                self.report({'ERROR'}, f"The action '{animation}' could not be found in the Blender file.")
-                return {'CANCELLED'}
-            
-            # TODO: Delete the reset mode
-            # Resets/deletes all bone transofrmations(basically overwrites matrix_basis with the identity matrix?!)
-            # The information is possibly retrieved from "edit mode".
-            # Maybe matrix multiplication like: <Current Pose> = <Pose in edit mode> x <identity> (?!)
-            # for bone in objectCurrent.pose.bones:
-                # bone.matrix_basis.identity()
-            
-            # Attempts to get the animation action data block.
-            bpy.context.active_object.animation_data.action = bpy.data.actions.get(animation)
-            currentAction = bpy.context.active_object.animation_data.action
-            
-            # Proceeds only if the animation is enabled by the user and the action exists in Blender. 
-            if(animationToggles[animationKey] == True and currentAction != None):               
-                # Assigns the current animation action to the active object's animation data.
-                bpy.context.active_object.animation_data.action = bpy.data.actions.get(animation)               
-                # Sets the scene's end frame to match the animation's end frame, converted to an integer
-                # to prevent rendering empty frames beyond the action's actual length.
-                bpy.context.scene.frame_end = int(bpy.context.active_object.animation_data.action.frame_range[1])
-                                
-                # Constructs the base folder path for the current animation.
-                animation_folder = os.path.join(pathSaveAt, "00-"+animation)
-                if(selectedType not in excludedAnimationTypes):
-                    # Creates the animation-specific subfolder if it doesn't already exist.
-                    if not os.path.exists(animation_folder):
-                        os.makedirs(animation_folder)
-                                     
-                # ----- Debugging
-                # TODO: Delete print
-                print("animation:",animation)
-                # TODO: Delete print
-                print("action:",bpy.context.active_object.animation_data.action)
-                # TODO: Delte print
-                print("Frame End:",bpy.context.scene.frame_end)
-                                    
-                #  ----- Nested/Middle loop
-                # Iterates through each defined camera position/direction.
-                for positionKey, position in cameraPosFolderNames.items():
-                    # Uses only the camera positions that are selected by the user.
-                    if(cameraPosToggles[positionKey] == True):
-                        # Creates a subfolder for the specific angle/direction.
-                        position_folder = os.path.join(animation_folder, position)
-                        if(selectedType not in excludedAnimationTypes):                  
-                            if not os.path.exists(position_folder):
-                                os.makedirs(position_folder)
-                        
-                        # Rotates the active object (the character/model) around its Z-axis to face the current direction.
-                        # The script rotates the subject, relying on a static camera to capture it, rather than rotating the camera itself.
-                        bpy.context.active_object.rotation_euler[axis_Z] = math.radians(cameraAngles[positionKey])
-                        
-                        # ----- Debugging
-                        # TODO: Delete print
-                         #print("\nbpy.context.active_object.rotation_euler:",bpy.context.active_object.rotation_euler)
-                        # TODO: Delete print
-                        #print("\nbpy.context.active_object.rotation_euler[2]:",bpy.context.active_object.rotation_euler[2])
-                
-                        # ----- Variables used in nested inner loop
-                        frameStart      = bpy.context.scene.frame_start
-                        frameEnd        = bpy.context.scene.frame_end
-                        Every_X_Frame   = context.scene.IEAS_properties.Every_X_Frame
-                        
-                        # Checks if every x frame is not too high. 
-                        if(Every_X_Frame > frameEnd):
-                            self.report({'ERROR'}, f"ERROR: Every x frame is with value '{Every_X_Frame}' too high. Fram end is '{frameEnd}'.")
-                            return {'CANCELLED'}
-                        # Negative frame start might be allowed in blender, but not in IE AutoSpriter.
-                        if(frameStart <= 0):
-                            self.report({'ERROR'}, f"ERROR: Frame start is set as '{frameStart}'. IE AutoSpriter does not support zero or negative frame numbers.")
-                            return {'CANCELLED'}
-
-                        # ----- Calculates neccessary frame numbers.
-                        numberOfFrames  = math.floor(frameEnd/Every_X_Frame)
-                        AllFrames       = []
-                        for frame in range(1,numberOfFrames+1):      
-                            calculatedFrame = (frame*Every_X_Frame) + (frameStart-1)         
-                            # This is necessary, otherwise the sprite names will be incorrect.
-                            if calculatedFrame > frameEnd:
-                                break
-                            # This list contains frames which will be rendered.                          
-                            AllFrames.append(calculatedFrame)
-                                                    
-                        #  ----- Nested/Inner loop 
-                        # Loops through frames within the animation's range, stepping by 'Every_X_Frame'.
-                        for frame in AllFrames:
-                            # Sets the current frame of the scene, updating the object's animation pose.
-                            bpy.context.scene.frame_current = frame
-                                                       
-                            # ----- Debugging
-                            # TODO: Delete print
-                            print("position_folder:",position_folder)
-                            # TODO: Delete print
-                            print("action:",bpy.context.active_object.animation_data.action)
-
-                            
-                            # TODO: need comment
-                            typeParametersUpdated = replace(
-                                typeParameters,
-                                exclude                     = False,
-                                animation                   = animation,
-                                positionKey                 = positionKey,
-                                animationKey                = animationKey, 
-                                frame                       = frame,
-                                position_folder             = position_folder,
-                            )
-                            
-                            # Get the method from the dictionary, defaulting to a general handler if not found
-                            handler_method  = animationTypeHandlers.get(selectedType, IEAS_AnimationTypes().typeNone)
-                            # The handler is basically the found function(e.g. def typeE000) and can be called as such.
-                            handler_method(typeParametersUpdated)                        
-                
-        # Restore the object's Z-axis rotation to its original state
-        bpy.context.active_object.rotation_euler[axis_Z] = originalLocation 
-        
-        # ----- Debugging
-        # TODO: Delete print
-        # Calculates and prints the total time taken for the rendering process.
-        print("Elapsed:",time.time() - startTimer)
-        
+    # Blender specific function which is executed when the operator is called from a script.
+    # It renders the whole plan at once and blocks Blender until it is finished.
+    def execute(self, context):
+        plan = self.prepare(context)
+        if (plan is None):
+            return {'CANCELLED'}
+        # The sprites of the last modal render are recompressed before any of them is rendered again.
+        if (renderStatus.recompressor != None):
+            renderStatus.recompressor.join()
+
+        # ----- Renders every job of the plan.
+        try:
+            executor = IEAS_RenderPlanExecutor.fromProperties(plan, context.scene.IEAS_properties)
+            for warning in executor.warnings:
+                self.report({'WARNING'}, warning)
+            if (executor.jobsSkipped > 0):
+                self.report({'INFO'}, f"{executor.jobsSkipped} already rendered or unchanged jobs are skipped.")
+            executor.run()
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        except Exception as e:
+            # E.g. a RuntimeError of Blender, the scene is already restored by IEAS_RenderPlanExecutor.run.
+            self.report({'ERROR'}, f"ERROR: Render stopped, {type(e).__name__}: {e}")
+            return {'CANCELLED'}
+        # E.g. a sprite which could not be read into its BAM file.
+        for warning in executor.bamWarnings:
+            self.report({'WARNING'}, warning)
+        # Without UI the recompression is finished with the render(see IEAS_RenderPlanExecutor.run).
+        if (executor.recompressor != None):
+            self.report({'WARNING'} if (len(executor.recompressor.errors) > 0) else {'INFO'}, executor.recompressor.timing())
+        self.report({'INFO'}, executor.timing())
+
+        return {'FINISHED'}
+
+    # Blender specific function which is executed in this case when RENDER button is pressed.
+    # It starts the modal render which is continued by the method modal.
+    def invoke(self, context, event):
+        if (renderStatus.running == True):
+            self.report({'ERROR'}, "ERROR: A render is already running!")
+            return {'CANCELLED'}
+        if (renderStatus.recompressing() == True):
+            self.report({'ERROR'}, f"ERROR: The sprites of the last render are still recompressed({renderStatus.recompressor.done}/{renderStatus.recompressor.total} files)!")
+            return {'CANCELLED'}
+
+        plan = self.prepare(context)
+        if (plan is None):
+            return {'CANCELLED'}
+
+        try:
+            self.executor = IEAS_RenderPlanExecutor.fromProperties(plan, context.scene.IEAS_properties)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        except Exception as e:
+            self.report({'ERROR'}, f"ERROR: Render not started, {type(e).__name__}: {e}")
+            return {'CANCELLED'}
+        for warning in self.executor.warnings:
+            self.report({'WARNING'}, warning)
+        if (self.executor.jobsSkipped > 0):
+            self.report({'INFO'}, f"{self.executor.jobsSkipped} already rendered or unchanged jobs are skipped.")
+        try:
+            self.executor.begin()
+        except Exception as e:
+            # Restores everything which begin has changed before it failed.
+            self.executor.end()
+            self.report({'ERROR'}, str(e) if isinstance(e, ValueError) else f"ERROR: Render not started, {type(e).__name__}: {e}")
+            return {'CANCELLED'}
+
+        # Resets the status shown in the panel.
+        renderStatus.running    = True
+        renderStatus.paused     = False
+        renderStatus.cancel     = False
+        renderStatus.jobsDone   = 0
+        renderStatus.jobsTotal  = len(self.executor.jobs)
+        renderStatus.startTime  = time.time()
+        renderStatus.pausedTime = 0.0
+
+        # Each timer event renders the jobs of one frame, while Blender handles the UI in between.
+        self.timer = context.window_manager.event_timer_add(0.001, window=context.window)
+        context.window_manager.progress_begin(0, max(renderStatus.jobsTotal, 1))
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    # Blender specific function which is executed for every event while the modal render is running.
+    def modal(self, context, event):
+        if ( (event.type == 'ESC' and event.value == 'PRESS') or (renderStatus.cancel == True) ):
+            self.report({'WARNING'}, f"WARNING: Render cancelled after {renderStatus.jobsDone} of {renderStatus.jobsTotal} jobs!")
+            return self.finish(context, {'CANCELLED'})
+
+        if (event.type == 'TIMER' and renderStatus.paused == False):
+            try:
+                rendering = self.executor.step()
+            except ValueError as e:
+                self.report({'ERROR'}, str(e))
+                return self.finish(context, {'CANCELLED'})
+            except Exception as e:
+                # E.g. a failed render(RuntimeError) or a full disk(OSError). The render is stopped and everything is
+                # restored, otherwise the next render would be refused.
+                self.report({'ERROR'}, f"ERROR: Render stopped after {self.executor.jobsDone} of {renderStatus.jobsTotal} jobs, {type(e).__name__}: {e}")
+                return self.finish(context, {'CANCELLED'})
+
+            renderStatus.jobsDone = self.executor.jobsDone
+            context.window_manager.progress_update(renderStatus.jobsDone)
+            # Redraws the panel, so the progress is visible.
+            for area in context.screen.areas:
+                if (area.type == 'VIEW_3D'):
+                    area.tag_redraw()
+
+            if (rendering == False):
+                result = self.finish(context, {'FINISHED'})
+                self.report({'INFO'}, self.executor.timing())
+                return result
+
+        # Lets Blender handle every other event, e.g. navigating in the viewport or pressing the pause button.
+        return {'PASS_THROUGH'}
+
+    # Stops the modal render and restores the object and collections.
+    def finish(self, context, result):
+        context.window_manager.event_timer_remove(self.timer)
+        context.window_manager.progress_end()
+        try:
+            self.executor.end()
+        except ValueError as e:
+            # E.g. a sprite which could not be written by a post-processing thread.
+            self.report({'ERROR'}, str(e))
+            result = {'CANCELLED'}
+        except Exception as e:
+            # The status is reset anyway, so the next render can start.
+            self.report({'ERROR'}, f"ERROR: Render not finished, {type(e).__name__}: {e}")
+            result = {'CANCELLED'}
+        for warning in self.executor.bamWarnings:
+            self.report({'WARNING'}, warning)
+        if (self.executor.recompressor != None):
+            renderStatus.recompressor = self.executor.recompressor
+        renderStatus.running    = False
+        renderStatus.paused     = False
+        renderStatus.cancel     = False
+        for area in context.screen.areas:
+            if (area.type == 'VIEW_3D'):
+                area.tag_redraw()
+        return result
+
+
+# --------
+# Purpose:
+# --------
+# Operator to pause and resume the running modal render.
+# ------------------------------------------------------
+class IEAS_OT_Pause(Operator):
+    """This class offers a function which pauses or resumes the rendering which is used in "IEAS_PT_Final" class"""
+    bl_idname = "ieas.pause"
+    bl_label = "PAUSE/RESUME"
+
+    # Blender specific function which is executed in this case when PAUSE/RESUME button is pressed
+    def execute(self, context):
+        if (renderStatus.running == False):
+            return {'CANCELLED'}
+
+        if (renderStatus.paused == True):
+            renderStatus.pausedTime += time.time() - renderStatus.pauseStart
+            renderStatus.paused     = False
+        else:
+            renderStatus.pauseStart = time.time()
+            renderStatus.paused     = True
+        return {'FINISHED'}
+
+
+# --------
+# Purpose:
+# --------
+# Operator to cancel the running modal render(same as pressing ESC).
+# ------------------------------------------------------------------
+class IEAS_OT_Cancel(Operator):
+    """This class offers a function which cancels the rendering which is used in "IEAS_PT_Final" class"""
+    bl_idname = "ieas.cancel"
+    bl_label = "CANCEL"
+
+    # Blender specific function which is executed in this case when CANCEL button is pressed
+    def execute(self, context):
+        if (renderStatus.running == False):
+            return {'CANCELLED'}
+
+        renderStatus.cancel = True
+        return {'FINISHED'}
+
+
+# --------
+# Purpose:
+# --------
+# Operator to compile the render plan without rendering and save it as JSON next to the sprites.
+# ----------------------------------------------------------------------------------------------
+class IEAS_OT_Plan(Operator):
+    """This class offers a function which saves the render plan which is used in "IEAS_PT_Final" class"""
+    bl_idname = "ieas.plan"
+    bl_label = "PLAN"
+
+    # Blender specific function which is executed in this case when PLAN button is pressed
+    def execute(self, context):
+        try:
+            plan = IEAS_RenderPlanCompiler().compile(context)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+
+        # The plan is saved into the same folder as the sprites.
+        pathSaveAt = bpy.path.abspath(context.scene.IEAS_properties.Save_at)
+        if not os.path.exists(pathSaveAt):
+            os.makedirs(pathSaveAt)
+        planPath = os.path.join(pathSaveAt, "ieas_render_plan.json")
+        plan.save(planPath)
+
+        self.report({'INFO'}, f"Render plan with {len(plan.jobs)} renders and {plan.outputCount()} files saved at '{planPath}'.")
         return {'FINISHED'}
 
 
@@ -3972,7 +6313,51 @@ class IEAS_PT_Final(Panel):
     # This method draws the UI elements for the final step, including the render button.
     def draw(self, context):
         col = self.layout.column(align=True)
-        col.operator("ieas.final") # selfdefined button functionality
+        # Shows the progress and the controls of the running modal render instead of the render button.
+        if (renderStatus.running == True):
+            eta = renderStatus.eta()
+            col.label(text=f"Rendered: {renderStatus.jobsDone}/{renderStatus.jobsTotal} jobs")
+            col.label(text=f"Elapsed: {time.strftime('%H:%M:%S', time.gmtime(renderStatus.elapsed()))}")
+            col.label(text=f"ETA: {time.strftime('%H:%M:%S', time.gmtime(eta)) if eta != None else '--:--:--'}")
+            if (renderStatus.paused == True):
+                col.label(text="Paused")
+            row = col.row(align=True)
+            row.operator("ieas.pause", text="RESUME" if renderStatus.paused else "PAUSE")
+            row.operator("ieas.cancel") # Same as pressing ESC
+        else:
+            if (renderStatus.recompressing() == True):
+                col.label(text=f"Recompressing: {renderStatus.recompressor.done}/{renderStatus.recompressor.total} files")
+            elif (renderStatus.recompressor != None):
+                # The result of the last recompression, the files which could not be read or replaced keep their content.
+                col.label(text=f"Recompressed: {renderStatus.recompressor.files} files, {renderStatus.recompressor.saved():.1f}% smaller")
+                if (len(renderStatus.recompressor.errors) > 0):
+                    col.label(text=f"Not recompressed: {len(renderStatus.recompressor.errors)} files", icon='ERROR')
+            col.prop(context.scene.IEAS_properties, "Resume")
+            col.prop(context.scene.IEAS_properties, "Incremental")
+            col.prop(context.scene.IEAS_properties, "Order")
+            col.prop(context.scene.IEAS_properties, "Weapon_Pass")
+            col.prop(context.scene.IEAS_properties, "Armor_Layers")
+            col.prop(context.scene.IEAS_properties, "Hide_Render")
+            col.prop(context.scene.IEAS_properties, "Mirror_East")
+            col.prop(context.scene.IEAS_properties, "Direction_Grid")
+            col.prop(context.scene.IEAS_properties, "Frame_Grid")
+            col.prop(context.scene.IEAS_properties, "Camera_Orbit")
+            col.prop(context.scene.IEAS_properties, "Animation_Render")
+            col.prop(context.scene.IEAS_properties, "Vertex_Cache")
+            col.prop(context.scene.IEAS_properties, "Static_Frames")
+            if (context.scene.IEAS_properties.Static_Frames == True):
+                col.prop(context.scene.IEAS_properties, "Static_Tolerance")
+            col.prop(context.scene.IEAS_properties, "Tile_Extent")
+            col.prop(context.scene.IEAS_properties, "Fast_Png")
+            if (context.scene.IEAS_properties.Fast_Png == True):
+                col.prop(context.scene.IEAS_properties, "Post_Threads")
+            col.prop(context.scene.IEAS_properties, "Recompress_Png")
+            col.prop(context.scene.IEAS_properties, "Bam_Output")
+            if (context.scene.IEAS_properties.Bam_Output == 'V2'):
+                col.prop(context.scene.IEAS_properties, "Pvrz_Size")
+                col.prop(context.scene.IEAS_properties, "Pvrz_Base")
+            col.operator("ieas.final") # selfdefined button functionality
+            col.operator("ieas.plan") # Saves the render plan without rendering
  
                
 # --------
@@ -3987,6 +6372,9 @@ def register():
     bpy.utils.register_class(IEAS_OT_Rotation)
     bpy.utils.register_class(IEAS_OT_ShadingNodes)
     bpy.utils.register_class(IEAS_OT_Final)
+    bpy.utils.register_class(IEAS_OT_Plan)
+    bpy.utils.register_class(IEAS_OT_Pause)
+    bpy.utils.register_class(IEAS_OT_Cancel)
     bpy.utils.register_class(IEAS_PGT_Inputs)
     bpy.utils.register_class(IEAS_PT_Core)
     bpy.utils.register_class(IEAS_PT_GlobalParameters)
@@ -4011,6 +6399,9 @@ def unregister():
     bpy.utils.unregister_class(IEAS_OT_Rotation)
     bpy.utils.unregister_class(IEAS_OT_ShadingNodes)
     bpy.utils.unregister_class(IEAS_OT_Final)
+    bpy.utils.unregister_class(IEAS_OT_Plan)
+    bpy.utils.unregister_class(IEAS_OT_Pause)
+    bpy.utils.unregister_class(IEAS_OT_Cancel)
     bpy.utils.unregister_class(IEAS_PGT_Inputs)
     bpy.utils.unregister_class(IEAS_PT_Core)
     bpy.utils.unregister_class(IEAS_PT_GlobalParameters)
@@ -4024,10 +6415,704 @@ def unregister():
     del bpy.types.Scene.IEAS_properties
     
 
+# --------
+# Purpose:
+# --------
+# Benchmarks which are started without UI, e.g.:
+#   blender -b -P ie_autospriter.py -- --benchmark pixels
+# Each benchmark prints its results and returns the exit code.
+# ---------------------------------------------------------------------------------------------------------------
+def benchmarkTime(function, repeats):
+    """Returns the fastest of several runs of the function in milliseconds."""
+    times = []
+    for repeat in range(repeats):
+        startTimer = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - startTimer)
+    return min(times) * 1000.0
+
+def benchmarkPixels(sizes=(256, 512, 1024), repeats=5):
+    """Compares reading and writing image pixels via Python sequences with IEAS_PixelBridge."""
+    pixelBridge = IEAS_PixelBridge()
+    print(f"{'Size':>9} | {'np.array read':>13} | {'bridge read':>11} | {'pixels= write':>13} | {'bridge write':>12}")
+    for size in sizes:
+        image   = bpy.data.images.new(name="IEAS Benchmark", width=size, height=size, alpha=True, float_buffer=True)
+        pixels  = pixelBridge.read(image).copy()
+        # The old path of the quadrant handlers: float64 array from the pixel sequence and assignment of it.
+        oldRead     = benchmarkTime(lambda: np.array(image.pixels), repeats)
+        oldWrite    = benchmarkTime(lambda: setattr(image, 'pixels', pixels.reshape(-1).astype(np.float64)), repeats)
+        newRead     = benchmarkTime(lambda: pixelBridge.read(image), repeats)
+        newWrite    = benchmarkTime(lambda: pixelBridge.write(image, pixels), repeats)
+        print(f"{f'{size}x{size}':>9} | {oldRead:>11.1f}ms | {newRead:>9.1f}ms | {oldWrite:>11.1f}ms | {newWrite:>10.1f}ms")
+        bpy.data.images.remove(image)
+    return 0
+
+def benchmarkImages(frames=10000, size=64, blockSize=1000):
+    """Compares the time per frame of new image data blocks with IEAS_ImagePool over many frames."""
+    pixelBridge = IEAS_PixelBridge()
+    pixels      = np.zeros((size, size, 4), dtype=np.float32)
+    filePath    = os.path.join(bpy.app.tempdir or os.getcwd(), "ieas_benchmark.png")
+    imagePool   = IEAS_ImagePool()
+    newImages   = []
+
+    def pooled():
+        image = imagePool.get("IEAS Benchmark", size, size, floatBuffer=True)
+        pixelBridge.write(image, pixels)
+        image.save_render(filePath, scene=bpy.context.scene)
+
+    def created():
+        # The old path of the quadrant handlers: a new data block for every frame which is never removed.
+        image = bpy.data.images.new(name="IEAS Benchmark", width=size, height=size, alpha=True, float_buffer=True)
+        newImages.append(image)
+        pixelBridge.write(image, pixels)
+        image.save_render(filePath, scene=bpy.context.scene)
+
+    print(f"{'Frames':>13} | {'new data blocks':>15} | {'image pool':>10}")
+    for first in range(0, frames, blockSize):
+        oldTime = sum(benchmarkTime(created, 1) for frame in range(blockSize)) / blockSize
+        newTime = sum(benchmarkTime(pooled, 1) for frame in range(blockSize)) / blockSize
+        print(f"{f'{first+1}-{first+blockSize}':>13} | {oldTime:>13.2f}ms | {newTime:>8.2f}ms")
+
+    for image in newImages:
+        bpy.data.images.remove(image)
+    imagePool.clear()
+    if os.path.exists(filePath):
+        os.remove(filePath)
+    return 0
+
+def benchmarkSplit(sizes=(512, 1024), divisors=(2, 3), repeats=3):
+    """Compares splitting and saving the quadrants of a render with the old full canvas and IEAS_GridSplitter."""
+    pixelBridge = IEAS_PixelBridge()
+    imagePool   = IEAS_ImagePool()
+    filePath    = os.path.join(bpy.app.tempdir or os.getcwd(), "ieas_benchmark.png")
+
+    def save(quadrants):
+        for quadrantPixels in quadrants:
+            height, width = quadrantPixels.shape[:2]
+            image = imagePool.get("IEAS Benchmark", width, height, floatBuffer=True)
+            pixelBridge.write(image, quadrantPixels)
+            image.save_render(filePath, scene=bpy.context.scene)
+
+    def peakMemory(function):
+        # Memory allocated while splitting one render, without the reused buffers which already exist.
+        tracemalloc.start()
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / (1024 * 1024)
+
+    print(f"{'Size':>9} | {'Grid':>4} | {'Mode':<17} | {'split':>9} | {'split+save':>10} | {'memory':>9}")
+    for size in sizes:
+        pixels = np.random.default_rng(0).random((size, size, 4), dtype=np.float32)
+        for divisor in divisors:
+            splitter = IEAS_GridSplitter(divisor, divisor, pixelBridge)
+
+            def oldQuadrants():
+                # The old path of the quadrant handlers: the full canvas is cleared and filled for every quadrant.
+                canvas = pixelBridge.buffer(size, size, "oldQuadrant")
+                for quadrant in splitter.slices(size, size):
+                    canvas.fill(0.0)
+                    canvas[quadrant] = pixels[quadrant]
+                    yield canvas
+
+            modes = [("full canvas (old)",  oldQuadrants),
+                     ("full canvas",        lambda: splitter.canvases(pixels)),
+                     ("tile extent",        lambda: splitter.tileExtents(pixels))]
+            for mode, quadrants in modes:
+                split       = benchmarkTime(lambda: [None for quadrantPixels in quadrants()], repeats)
+                splitSave   = benchmarkTime(lambda: save(quadrants()), repeats)
+                memory      = peakMemory(lambda: save(quadrants()))
+                print(f"{f'{size}x{size}':>9} | {f'{divisor}x{divisor}':>4} | {mode:<17} | {split:>7.1f}ms | {splitSave:>8.1f}ms | {memory:>7.1f}MB")
+
+    imagePool.clear()
+    if os.path.exists(filePath):
+        os.remove(filePath)
+    return 0
+
+def benchmarkModes(name, modes, frames, order='FRAME'):
+    """Renders the first frames of the blend file's plan with the executor options of each mode and prints their times."""
+    # Needs a blend file with IE AutoSpriter properties, e.g. blender -b demo.blend -P ie_autospriter.py -- --benchmark grids
+    properties      = bpy.context.scene.IEAS_properties
+    benchmarkFolder = os.path.join(bpy.app.tempdir or os.getcwd(), f"ieas_benchmark_{name}")
+    originalSaveAt  = properties.Save_at
+    properties.Save_at = benchmarkFolder + os.sep
+    try:
+        plan = IEAS_RenderPlanCompiler().compile(bpy.context)
+    except ValueError as e:
+        print(e)
+        return 1
+    finally:
+        properties.Save_at = originalSaveAt
+    # Only the first frames of the first animation, with all their directions.
+    animation   = plan.jobs[0].animation if (len(plan.jobs) > 0) else None
+    firstFrames = sorted(set(job.frame for job in plan.jobs if job.animation == animation))[:frames]
+    plan        = replace(plan, jobs=[job for job in plan.jobs if job.animation == animation and job.frame in firstFrames])
+
+    print(f"{'Mode':>16} | {'Frames':>6} | {'Steps':>5} | {'Grids':>5} | {'per frame':>9} | {'render':>9} | {'turn':>9} | {'sprites':>9}")
+    for mode, options in modes:
+        # The sprites of the previous mode are removed, the cache files are kept for the next one(see benchmarkCache).
+        for entry in (os.listdir(benchmarkFolder) if os.path.isdir(benchmarkFolder) else []):
+            entryPath = os.path.join(benchmarkFolder, entry)
+            if os.path.isdir(entryPath) and entry != IEAS_VertexCache.folderName:
+                shutil.rmtree(entryPath, ignore_errors=True)
+            elif os.path.isfile(entryPath):
+                os.remove(entryPath)
+        executor    = IEAS_RenderPlanExecutor(plan, saveHashes=False, order=order, **options)
+        startTimer  = time.perf_counter()
+        executor.run()
+        elapsed     = (time.perf_counter() - startTimer) * 1000.0
+        # The mean time of the renders without preparing(e.g. baking) and of the renders right after a direction change.
+        render      = f"{np.mean(executor.frameTimes) * 1000.0:>7.1f}ms" if (len(executor.frameTimes) > 0) else f"{'-':>9}"
+        turn        = f"{np.mean(executor.directionTimes) * 1000.0:>7.1f}ms" if (len(executor.directionTimes) > 0) else f"{'-':>9}"
+        # The size of the sprite files, after the recompression if the mode has it.
+        sprites     = sum(os.path.getsize(filePath) for job in plan.jobs for filePath in job.filePaths() if os.path.exists(filePath))
+        print(f"{mode:>16} | {len(firstFrames):>6} | {len(executor.frameTimes):>5} | {executor.gridRenders:>5} | "
+              f"{elapsed / max(len(firstFrames), 1):>7.1f}ms | {render} | {turn} | {sprites / 1024.0:>7.0f}KB")
+        # E.g. the grids of the mode cannot be used with the scene.
+        for warning in executor.warnings:
+            print(f"{'':>16} | {warning}")
+        if (executor.vertexCache != None):
+            print(f"{'':>16} | {executor.vertexCache.timing()}")
+        if (executor.recompressor != None):
+            print(f"{'':>16} | {executor.recompressor.timing()}")
+        if (executor.animationTypes.postProcessor != None):
+            print(f"{'':>16} | {executor.animationTypes.postProcessor.timing(sum(executor.frameTimes))}")
+    shutil.rmtree(benchmarkFolder, ignore_errors=True)
+    return 0
+
+def benchmarkGrids(frames=8):
+    """Compares one render per sprite with IEAS_DirectionGrid and IEAS_FrameGrid on the first frames of the blend file's plan."""
+    unsupported = IEAS_TileGrid.unsupported(bpy.context.scene)
+    if (unsupported != None):
+        print(f"Grids are not supported, because {unsupported}!")
+        return 1
+    # The time of the frame grid contains the single renders of its first grid(see IEAS_AnimationTypes.renderGrid).
+    return benchmarkModes("grids", (('single', {}), ('direction grid', {'directionGrid': True}), ('frame grid', {'frameGrid': True})), frames)
+
+def benchmarkOrbit(frames=8):
+    """Compares rotating the object with IEAS_CameraOrbit on the first frames of the blend file's plan."""
+    # Frame-major order changes the direction before every render, which shows the difference the most.
+    return benchmarkModes("orbit", (('object rotation', {}), ('camera orbit', {'cameraOrbit': True})), frames)
+
+def benchmarkAnimation(frames=8):
+    """Compares still renders with animation renders on the first frames of the blend file's plan with EEVEE and Cycles."""
+    render          = bpy.context.scene.render
+    originalEngine  = render.engine
+    engineNames     = [item.identifier for item in render.bl_rna.properties['engine'].enum_items]
+    # EEVEE is called 'BLENDER_EEVEE_NEXT' in Blender 4.2 to 4.5.
+    eevee           = 'BLENDER_EEVEE_NEXT' if ('BLENDER_EEVEE_NEXT' in engineNames) else 'BLENDER_EEVEE'
+    try:
+        for label, engine in (('EEVEE', eevee), ('Cycles', 'CYCLES')):
+            try:
+                render.engine = engine
+            except TypeError:
+                print(f"{label} is not available!")
+                continue
+            # Direction-major order, so the frames of a direction are next to each other in both modes.
+            result = benchmarkModes("animation", ((f"{label} stills", {}), (f"{label} animation", {'animationRender': True})),
+                                    frames, order='DIRECTION')
+            if (result != 0):
+                return result
+    finally:
+        render.engine = originalEngine
+    return 0
+
+def benchmarkCache(frames=8):
+    """Compares evaluated meshes with IEAS_VertexCache on the first frames of the blend file's plan."""
+    # The second vertex cache run reuses the files of the first one.
+    return benchmarkModes("cache", (('evaluated', {}), ('vertex cache', {'vertexCache': True}),
+                                    ('reused cache', {'vertexCache': True})), frames)
+
+def benchmarkPng(frames=8):
+    """Compares Blender's PNG files with IEAS_PngEncoder and IEAS_PngRecompressor on the first frames of the blend file's plan."""
+    # The time per frame of the last mode contains the recompression, which runs in the background with UI.
+    unsupported = IEAS_PngEncoder.unsupported(bpy.context.scene)
+    if (unsupported != None):
+        print(f"WARNING: Blender writes the fast PNG files, because {unsupported}!")
+    return benchmarkModes("png", (('blender png', {}), ('fast png', {'fastPng': True}),
+                                  ('recompressed', {'fastPng': True, 'recompressPng': True})), frames)
+
+def benchmarkPost(frames=8):
+    """Compares writing the fast PNG files between the renders with IEAS_PostProcessor on the first frames of the blend file's plan."""
+    unsupported = IEAS_PngEncoder.unsupported(bpy.context.scene)
+    if (unsupported != None):
+        print(f"The fast PNG files cannot be written by threads, because {unsupported}!")
+        return 1
+    return benchmarkModes("post", (('render step', {'fastPng': True}), ('1 thread', {'fastPng': True, 'postThreads': 1}),
+                                   ('2 threads', {'fastPng': True, 'postThreads': 2}),
+                                   ('4 threads', {'fastPng': True, 'postThreads': 4})), frames)
+
+def benchmarkBam(folder=None):
+    """Writes the frames of the demo BAM files again with IEAS_BamWriter and compares their pixels, sizes and times."""
+    # The demo BAM files are next to the add-on folder in the repository.
+    if (folder is None):
+        folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "demos", "test bams")
+    filePaths = sorted(os.path.join(root, name) for root, folders, names in os.walk(folder) for name in names if name.lower().endswith(".bam"))
+    if (len(filePaths) == 0):
+        print(f"No BAM files found in '{folder}'!")
+        return 1
+
+    def canvas(palette, frame, size):
+        """Returns the RGBA pixels of a BAM frame on a canvas with the frame's center in the middle."""
+        indices, centerX, centerY = frame
+        # Index 0 is transparent, index 1 the translucent shadow and every other index an opaque color.
+        colors          = np.zeros((256, 4), dtype=np.uint8)
+        colors[2:, :3]  = palette[2:]
+        colors[2:, 3]   = 255
+        colors[1, 3]    = 64
+        pixels          = np.zeros((2*size, 2*size, 4), dtype=np.uint8)
+        pixels[size-centerY : size-centerY+indices.shape[0], size-centerX : size-centerX+indices.shape[1]] = colors[indices]
+        return pixels
+
+    print(f"{'File':>36} | {'Cycles':>6} | {'Frames':>11} | {'original':>9} | {'BAM':>9} | {'BAMC':>9} | {'time':>9} | pixels")
+    different = 0
+    for filePath in filePaths:
+        with open(filePath, 'rb') as bamFile:
+            data = bamFile.read()
+        palette, cycles = IEAS_BamWriter.read(data)
+        colors          = np.zeros((256, 4), dtype=np.uint8)
+        colors[2:, :3]  = palette[2:]
+        colors[2:, 3]   = 255
+        colors[1, 3]    = 64
+        frames          = [[(colors[indices], centerX, centerY) for indices, centerX, centerY in cycle] for cycle in cycles]
+        startTimer      = time.perf_counter()
+        bam             = IEAS_BamWriter(IEAS_PixelBridge()).encode(frames)
+        elapsed         = (time.perf_counter() - startTimer) * 1000.0
+        bamc            = IEAS_BamWriter(IEAS_PixelBridge(), compress=True).encode(frames)
+        # The written frames are cropped, so every frame is compared with the original one on a canvas around its center.
+        writtenPalette, writtenCycles = IEAS_BamWriter.read(bamc)
+        equal = [len(cycle) for cycle in cycles] == [len(cycle) for cycle in writtenCycles]
+        for cycle, writtenCycle in zip(cycles, writtenCycles):
+            for frame, writtenFrame in zip(cycle, writtenCycle):
+                size    = max(abs(value) for item in (frame, writtenFrame) for value in item[0].shape + item[1:]) * 2
+                equal   = equal and np.array_equal(canvas(palette, frame, size), canvas(writtenPalette, writtenFrame, size))
+        different      += (equal == False)
+        frameCount      = struct.unpack('<H', zlib.decompress(bamc[12:])[8:10])[0]
+        print(f"{os.path.basename(filePath)[-36:]:>36} | {len(cycles):>6} | {sum(len(cycle) for cycle in cycles):>5}->{frameCount:<5} | "
+              f"{len(data) / 1024.0:>7.0f}KB | {len(bam) / 1024.0:>7.0f}KB | {len(bamc) / 1024.0:>7.0f}KB | {elapsed:>7.1f}ms | "
+              f"{'equal' if equal else 'DIFFERENT'}")
+    return 0 if (different == 0) else 1
+
+def benchmarkPvrz(folder=None):
+    """Packs the frames of the demo BAM files of each creature into BAM V2 files and PVRZ pages with IEAS_BamV2Writer and compares their pixels."""
+    # The demo BAM files are next to the add-on folder in the repository, each creature in its own folder.
+    if (folder is None):
+        folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "demos", "test bams")
+    creatures = {}
+    for root, folders, names in os.walk(folder):
+        for name in sorted(names):
+            if (name.lower().endswith(".bam")):
+                creatures.setdefault(root, []).append(os.path.join(root, name))
+    if (len(creatures) == 0):
+        print(f"No BAM files found in '{folder}'!")
+        return 1
+
+    def canvases(*frames):
+        """Returns the RGBA pixels of the frames on canvases which hold all of them at the same center."""
+        left    = max(centerX for pixels, centerX, centerY in frames)
+        top     = max(centerY for pixels, centerX, centerY in frames)
+        width   = left + max(pixels.shape[1] - centerX for pixels, centerX, centerY in frames)
+        height  = top + max(pixels.shape[0] - centerY for pixels, centerX, centerY in frames)
+        results = np.zeros((len(frames), height, width, 4), dtype=np.int32)
+        for result, (pixels, centerX, centerY) in zip(results, frames):
+            result[top-centerY : top-centerY+pixels.shape[0], left-centerX : left-centerX+pixels.shape[1]] = pixels
+        return results
+
+    print(f"{'Creature':>36} | {'Files':>5} | {'Frames':>6} | {'Pages':>5} | {'used':>5} | {'original':>9} | {'BAM V2':>9} | {'time':>9} | pixels")
+    different = 0
+    for root, filePaths in sorted(creatures.items()):
+        bamFiles    = {}
+        original    = 0
+        for filePath in filePaths:
+            with open(filePath, 'rb') as bamFile:
+                data = bamFile.read()
+            original       += len(data)
+            palette, cycles = IEAS_BamWriter.read(data)
+            # Index 0 is transparent, index 1 the translucent shadow and every other index an opaque color.
+            colors          = np.zeros((256, 4), dtype=np.uint8)
+            colors[2:, :3]  = palette[2:]
+            colors[2:, 3]   = 255
+            colors[1, 3]    = 64
+            bamFiles[os.path.basename(filePath)] = [[(colors[indices], centerX, centerY) for indices, centerX, centerY in cycle] for cycle in cycles]
+        writer      = IEAS_BamV2Writer(IEAS_PixelBridge())
+        startTimer  = time.perf_counter()
+        bams, pages = writer.encode(bamFiles)
+        pvrzPages   = [writer.encodePage(pixels) for pixels in pages]
+        elapsed     = (time.perf_counter() - startTimer) * 1000.0
+        # DXT5 changes the colors and translucent alpha values, but transparent and opaque pixels stay exact.
+        pages       = {writer.pageBase + page: IEAS_BamV2Writer.readPage(data) for page, data in enumerate(pvrzPages)}
+        equal       = True
+        error       = []
+        for bamName, cycles in bamFiles.items():
+            writtenCycles   = IEAS_BamV2Writer.read(bams[bamName], pages)
+            equal           = equal and [len(cycle) for cycle in cycles] == [len(cycle) for cycle in writtenCycles]
+            for cycle, writtenCycle in zip(cycles, writtenCycles):
+                for frame, writtenFrame in zip(cycle, writtenCycle):
+                    pixels, written = canvases(frame, writtenFrame)
+                    exact       = (pixels[..., 3] == 0) | (pixels[..., 3] == 255)
+                    equal       = equal and np.array_equal(pixels[exact, 3], written[exact, 3])
+                    opaque      = pixels[..., 3] == 255
+                    error.append(np.abs(pixels[opaque, :3] - written[opaque, :3]).reshape(-1))
+        different  += (equal == False)
+        size        = sum(len(data) for data in bams.values()) + sum(len(data) for data in pvrzPages)
+        print(f"{os.path.relpath(root, folder)[-36:]:>36} | {len(bamFiles):>5} | {sum(len(cycle) for cycles in bamFiles.values() for cycle in cycles):>6} | "
+              f"{len(pages):>5} | {writer.frameArea / max(writer.pageArea, 1):>5.0%} | {original / 1024.0:>7.0f}KB | {size / 1024.0:>7.0f}KB | "
+              f"{elapsed:>7.0f}ms | {'alpha equal' if equal else 'DIFFERENT'}, mean color error {np.concatenate(error + [np.zeros(1)]).mean():.1f}")
+    return 0 if (different == 0) else 1
+
+# Benchmarks by the name which is given to --benchmark.
+benchmarks = {
+    'pixels':       benchmarkPixels,
+    'images':       benchmarkImages,
+    'split':        benchmarkSplit,
+    'grids':        benchmarkGrids,
+    'orbit':        benchmarkOrbit,
+    'animation':    benchmarkAnimation,
+    'cache':        benchmarkCache,
+    'png':          benchmarkPng,
+    'post':         benchmarkPost,
+    'bam':          benchmarkBam,
+    'pvrz':         benchmarkPvrz,
+}
+
+
+# --------
+# Purpose:
+# --------
+# Loads the properties of a job file. The keys are the property names of IEAS_PGT_Inputs(e.g. "Type", "Use_SO").
+# ---------------------------------------------------------------------------------------------------------------
+def loadJob(filePath):
+    # TOML is read by the standard library of the Python version shipped with Blender 4.5.
+    if filePath.lower().endswith(".toml"):
+        import tomllib
+        with open(filePath, 'rb') as jobFile:
+            return tomllib.load(jobFile)
+    with open(filePath, 'r', encoding='utf-8') as jobFile:
+        return json.load(jobFile)
+
+
+# --------
+# Purpose:
+# --------
+# Renders the sprites without UI, e.g.:
+#   blender -b creature.blend --python-exit-code 1 -P ie_autospriter.py -- --job job.json
+# Without --job the properties saved in the blend file are used.
+# Returns the exit code: 0 = finished, 1 = render cancelled/failed, 2 = invalid job file.
+# Blender ends with exit code 0 after a script error unless --python-exit-code is given before -P.
+# -----------------------------------------------------------------------------------------
+def runHeadless(argv):
+    parser = argparse.ArgumentParser(prog="ie_autospriter", description="Renders IE AutoSpriter sprites without UI.",
+                                     epilog="Start Blender with --python-exit-code 1 before -P, so a script error does not end with exit code 0, e.g. "
+                                            "blender -b creature.blend --python-exit-code 1 -P ie_autospriter.py -- --job job.json")
+    parser.add_argument("--job",    help="JSON or TOML file with the IE AutoSpriter properties to apply before rendering.")
+    parser.add_argument("--plan",   help="Saves the render plan into this JSON file instead of rendering.")
+    parser.add_argument("--workers",type=int, default=1, help="Number of background Blender processes which render the plan in parallel.")
+    parser.add_argument("--shard",  help="Renders only the part 'index/count' of the plan(used by the worker processes).")
+    parser.add_argument("--threads",type=int, default=0, help="Number of render threads(0 = Blender decides).")
+    parser.add_argument("--resume", action="store_true", help="Skips every sprite which was already rendered(see IEAS_RenderManifest).")
+    parser.add_argument("--incremental", action="store_true", help="Renders only changed actions and layers(see IEAS_RenderHashes).")
+    parser.add_argument("--order",  choices=['AUTO', 'FRAME', 'DIRECTION', 'LAYER'], help="Order in which frames and directions are rendered(see Order property).")
+    parser.add_argument("--weapon-pass", action="store_true", help="Renders all weapons of a frame at once(see IEAS_WeaponPass).")
+    parser.add_argument("--armor-layers", action="store_true", help="Composites the armor layers over the creature(see IEAS_ArmorLayers).")
+    parser.add_argument("--hide-render", action="store_true", help="Hides layer collections with hide_render instead of exclude(see IEAS_VisibilityState).")
+    parser.add_argument("--mirror-east", action="store_true", help="Mirrors the western renders instead of rendering the eastern directions(see Mirror_East property).")
+    parser.add_argument("--direction-grid", action="store_true", help="Renders all directions of a frame at once(see IEAS_DirectionGrid).")
+    parser.add_argument("--frame-grid", action="store_true", help="Renders several frames of an animation at once(see IEAS_FrameGrid).")
+    parser.add_argument("--camera-orbit", action="store_true", help="Switches between cameras around the object instead of rotating it(see IEAS_CameraOrbit).")
+    parser.add_argument("--animation-render", action="store_true", help="Renders the frames of a direction as one animation(see Animation_Render property).")
+    parser.add_argument("--vertex-cache", action="store_true", help="Bakes the mesh deformation before rendering(see IEAS_VertexCache).")
+    parser.add_argument("--static-frames", action="store_true", help="Copies the sprites of frames without movement(see IEAS_StaticFrames).")
+    parser.add_argument("--static-tolerance", type=float, help="Largest difference which counts as the same pose(see Static_Tolerance property).")
+    parser.add_argument("--tile-extent", action="store_true", help="Saves the quadrants in their own size(see IEAS_GridSplitter).")
+    parser.add_argument("--fast-png", action="store_true", help="Writes the sprites with a low compression(see IEAS_PngEncoder).")
+    parser.add_argument("--recompress-png", action="store_true", help="Makes the sprites smaller after the render(see IEAS_PngRecompressor).")
+    parser.add_argument("--post-threads", type=int, help="Number of threads which write the fast PNG files(see IEAS_PostProcessor).")
+    parser.add_argument("--bam",    choices=['BAM', 'BAMC', 'V2'], help="Writes the creature sprites as BAM files after the render(see IEAS_BamWriter and IEAS_BamV2Writer).")
+    parser.add_argument("--pvrz-size", choices=['256', '512', '1024', '2048'], help="Width and height of the PVRZ pages of --bam V2.")
+    parser.add_argument("--pvrz-base", type=int, help="Index of the first PVRZ page of --bam V2.")
+    parser.add_argument("--benchmark", choices=sorted(benchmarks), help="Runs a benchmark instead of rendering.")
+    args = parser.parse_args(argv)
+    properties = bpy.context.scene.IEAS_properties
+
+    if (args.benchmark != None):
+        return benchmarks[args.benchmark]()
+
+    if (args.job != None):
+        try:
+            job = loadJob(args.job)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Job file '{args.job}' could not be read: {e}")
+            return 2
+        # The type is set first, because changing it resets all toggles(see resetToggles).
+        for propertyName in sorted(job, key=lambda name: name != 'Type'):
+            if (propertyName not in IEAS_PGT_Inputs.__annotations__):
+                print(f"ERROR: Job file '{args.job}' contains the unknown property '{propertyName}'!")
+                return 2
+            value = job[propertyName]
+            # The object is given by its name.
+            if (propertyName == 'Object_List'):
+                value = bpy.data.objects.get(value)
+                if (value is None):
+                    print(f"ERROR: Object '{job[propertyName]}' does not exist!")
+                    return 2
+            try:
+                setattr(properties, propertyName, value)
+            except (TypeError, ValueError) as e:
+                print(f"ERROR: Property '{propertyName}' could not be set: {e}")
+                return 2
+
+    # The plan depends on the mirror mode, so it is set before the plan is compiled.
+    if (args.mirror_east == True):
+        properties.Mirror_East = True
+
+    if (args.plan != None):
+        try:
+            plan = IEAS_RenderPlanCompiler().compile(bpy.context)
+        except ValueError as e:
+            print(e)
+            return 1
+        plan.save(args.plan)
+        print(f"Render plan with {len(plan.jobs)} renders and {plan.outputCount()} files saved at '{args.plan}'.")
+        return 0
+
+    if (args.resume == True):
+        properties.Resume = True
+
+    if (args.incremental == True):
+        properties.Incremental = True
+
+    if (args.order != None):
+        properties.Order = args.order
+
+    if (args.weapon_pass == True):
+        properties.Weapon_Pass = True
+
+    if (args.armor_layers == True):
+        properties.Armor_Layers = True
+
+    if (args.hide_render == True):
+        properties.Hide_Render = True
+
+    if (args.direction_grid == True):
+        properties.Direction_Grid = True
+
+    if (args.frame_grid == True):
+        properties.Frame_Grid = True
+
+    if (args.camera_orbit == True):
+        properties.Camera_Orbit = True
+
+    if (args.animation_render == True):
+        properties.Animation_Render = True
+
+    if (args.vertex_cache == True):
+        properties.Vertex_Cache = True
+
+    if (args.static_frames == True):
+        properties.Static_Frames = True
+
+    if (args.static_tolerance != None):
+        properties.Static_Tolerance = args.static_tolerance
+
+    if (args.tile_extent == True):
+        properties.Tile_Extent = True
+
+    if (args.fast_png == True):
+        properties.Fast_Png = True
+
+    if (args.recompress_png == True):
+        properties.Recompress_Png = True
+
+    if (args.post_threads != None):
+        properties.Post_Threads = args.post_threads
+
+    if (args.bam != None):
+        properties.Bam_Output = args.bam
+
+    if (args.pvrz_size != None):
+        properties.Pvrz_Size = args.pvrz_size
+
+    if (args.pvrz_base != None):
+        properties.Pvrz_Base = args.pvrz_base
+
+    # The BAM files are written after the render, so an unsupported type is refused before anything is rendered.
+    if (properties.Bam_Output != 'NONE' and IEAS_RenderPlanCompiler.bamUnsupported(properties.Type) != None):
+        print(f"ERROR: No BAM files can be written, because {IEAS_RenderPlanCompiler.bamUnsupported(properties.Type)}!")
+        return 2
+
+    if (args.threads > 0):
+        bpy.context.scene.render.threads_mode  = 'FIXED'
+        bpy.context.scene.render.threads       = args.threads
+
+    if (args.workers > 1):
+        return runWorkers(args)
+
+    if (args.shard != None):
+        # ----- Worker process: renders only its part of the plan.
+        index, count = (int(number) for number in args.shard.split("/"))
+        try:
+            plan = IEAS_RenderPlanCompiler().compile(bpy.context).shard(index, count)
+            # The hashes and BAM files are saved by the starting process after every worker finished(see runWorkers).
+            executor = IEAS_RenderPlanExecutor.fromProperties(plan, properties, saveHashes=False, bamOutput='NONE')
+            for warning in executor.warnings:
+                print(f"Shard {index}/{count}: {warning}")
+            executor.run()
+        except ValueError as e:
+            print(e)
+            return 1
+        except Exception:
+            # Every failed worker must end with an exit code, otherwise the starting process would finish its render.
+            traceback.print_exc()
+            return 1
+        print(f"Shard {index}/{count}: {executor.timing()}")
+        if (executor.recompressor != None):
+            print(f"Shard {index}/{count}: {executor.recompressor.timing()}")
+        # The starting process sums the rendered jobs of every worker(see runWorkers). Skipped and copied jobs are not rendered.
+        with open(os.path.join(plan.pathSaveAt, shardFileName(index)), 'w', encoding='utf-8') as shardFile:
+            json.dump({'jobsRendered': executor.jobsDone - executor.jobsCopied}, shardFile)
+        return 0
+
+    # Without UI the operator renders everything at once(see IEAS_OT_Final.execute).
+    # Operators which report an error raise a RuntimeError when called by a script.
+    try:
+        result = bpy.ops.ieas.final()
+    except RuntimeError as e:
+        print(e)
+        return 1
+    return 0 if ('FINISHED' in result) else 1
+
+
+# Returns the name of the file in which a worker process saves how many jobs it rendered.
+def shardFileName(index):
+    return f"ieas_shard_{index}.json"
+
+
+# --------
+# Purpose:
+# --------
+# Starts args.workers background Blender processes on the saved blend file, each rendering one part of the plan.
+# Every process gets the same job file, so all of them compile the same plan(see IEAS_RenderPlan.shard).
+# The render threads are split between the processes, so the CPU is used fully but not oversubscribed.
+# Returns the highest exit code of the processes.
+# ---------------------------------------------------------------------------------------------------------------
+def runWorkers(args):
+    if (bpy.data.filepath == ''):
+        print("ERROR: The blend file has to be saved before rendering with several workers!")
+        return 2
+    # Compiles the plan once to stop before starting any process if the input is invalid.
+    try:
+        plan = IEAS_RenderPlanCompiler().compile(bpy.context)
+    except ValueError as e:
+        print(e)
+        return 1
+
+    startTimer  = time.time()
+    threads     = args.threads if (args.threads > 0) else max(1, (os.cpu_count() or 1) // args.workers)
+    processes   = []
+    # The counts of an earlier render are removed, so a failed worker counts no jobs.
+    shardPaths  = [os.path.join(plan.pathSaveAt, shardFileName(index)) for index in range(args.workers)]
+    for shardPath in shardPaths:
+        if os.path.exists(shardPath):
+            os.remove(shardPath)
+    for index in range(args.workers):
+        # Without --python-exit-code a worker whose script failed would end with exit code 0.
+        command = [bpy.app.binary_path, "-b", bpy.data.filepath, "--python-exit-code", "1", "-P", os.path.abspath(__file__), "--"]
+        if (args.job != None):
+            command += ["--job", os.path.abspath(args.job)]
+        if (args.resume == True):
+            command += ["--resume"]
+        if (args.incremental == True):
+            command += ["--incremental"]
+        if (args.order != None):
+            command += ["--order", args.order]
+        if (args.weapon_pass == True):
+            command += ["--weapon-pass"]
+        if (args.armor_layers == True):
+            command += ["--armor-layers"]
+        if (args.hide_render == True):
+            command += ["--hide-render"]
+        if (args.mirror_east == True):
+            command += ["--mirror-east"]
+        if (args.direction_grid == True):
+            command += ["--direction-grid"]
+        if (args.frame_grid == True):
+            command += ["--frame-grid"]
+        if (args.camera_orbit == True):
+            command += ["--camera-orbit"]
+        if (args.animation_render == True):
+            command += ["--animation-render"]
+        if (args.vertex_cache == True):
+            command += ["--vertex-cache"]
+        if (args.static_frames == True):
+            command += ["--static-frames"]
+        if (args.static_tolerance != None):
+            command += ["--static-tolerance", str(args.static_tolerance)]
+        if (args.tile_extent == True):
+            command += ["--tile-extent"]
+        if (args.fast_png == True):
+            command += ["--fast-png"]
+        if (args.recompress_png == True):
+            command += ["--recompress-png"]
+        if (args.post_threads != None):
+            command += ["--post-threads", str(args.post_threads)]
+        command += ["--shard", f"{index}/{args.workers}", "--threads", str(threads)]
+        processes.append(subprocess.Popen(command))
+    exitCodes = [process.wait() for process in processes]
+    jobsRendered = 0
+    for shardPath in shardPaths:
+        try:
+            with open(shardPath, 'r', encoding='utf-8') as shardFile:
+                jobsRendered += json.load(shardFile)['jobsRendered']
+            os.remove(shardPath)
+        except (OSError, ValueError, KeyError):
+            # The worker failed before it finished its part.
+            pass
+    # The exit codes alone are not trusted: the hashes and BAM files need every file of the plan.
+    if (max(exitCodes) == 0):
+        manifest    = IEAS_RenderManifest(plan.pathSaveAt).load()
+        missing     = sum(1 for job in plan.jobs if manifest.isRecorded(job) == False)
+        if (missing > 0):
+            print(f"ERROR: {missing} of {len(plan.jobs)} jobs were not written by the workers!")
+            exitCodes.append(1)
+
+    # Only a render finished by every worker is the base for the next incremental render.
+    if (max(exitCodes) == 0):
+        hashes = IEAS_RenderHashes(plan.pathSaveAt).load()
+        hashes.save(hashes.compute(plan))
+        # The BAM files need the sprites of every worker.
+        properties  = bpy.context.scene.IEAS_properties
+        bamOutput   = properties.Bam_Output
+        if (bamOutput != 'NONE'):
+            try:
+                if (bamOutput == 'V2'):
+                    writer = IEAS_BamV2Writer(IEAS_PixelBridge(), int(properties.Pvrz_Size), properties.Pvrz_Base)
+                else:
+                    writer = IEAS_BamWriter(IEAS_PixelBridge(), bamOutput == 'BAMC')
+                for warning in writer.writePlan(plan):
+                    print(warning)
+                print(writer.timing())
+            except ValueError as e:
+                print(e)
+                return 1
+
+    elapsed = time.time() - startTimer
+    print(f"Rendered {jobsRendered} of {len(plan.jobs)} frames with {args.workers} workers and {threads} threads each in {elapsed:.1f}s ({jobsRendered/max(elapsed, 1e-9):.2f} frames/s).")
+    return max(exitCodes)
+
+
 # --------
 # Purpose:
 # --------
 # Controls script execution: if the script is run directly in Blender's text editor (as main),
 # it will call the register function. This is standard practice for Blender add-ons. 
+# Arguments after "--" start the headless render(see runHeadless).
 if __name__ == "__main__":
-    register()
\ No newline at end of file
+    register()
+    if ("--" in sys.argv):
+        try:
+            exitCode = runHeadless(sys.argv[sys.argv.index("--")+1:])
+        except Exception:
+            # An unexpected error ends with a failed exit code instead of Blender's 0.
+            traceback.print_exc()
+            exitCode = 1
+        sys.exit(exitCode)
\ No newline at end of file